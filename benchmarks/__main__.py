@@ -0,0 +1,62 @@
+
+import argparse
+import sys
+
+from . import suite
+from .standin import Dataset
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Run the simplifier wrappers against a local AWS stand-in.',
+    )
+    parser.add_argument('cases', nargs='*', help='Only run these cases.')
+    parser.add_argument('--objects', type=int, default=Dataset.objects)
+    parser.add_argument('--object-size', type=int, default=Dataset.object_size)
+    parser.add_argument('--upload-size', type=int, default=Dataset.upload_size)
+    parser.add_argument('--zones', type=int, default=Dataset.zones)
+    parser.add_argument('--certificates', type=int, default=Dataset.certificates)
+    parser.add_argument('--distributions', type=int, default=Dataset.distributions)
+    parser.add_argument('--iterations', type=int, default=None)
+    parser.add_argument('--latency', type=float, default=0, help='Simulated latency per call, in milliseconds.')
+    parser.add_argument('--prefetch-pages', type=int, default=None)
+    parser.add_argument('--save', metavar='PATH', help='Save the results as a baseline.')
+    parser.add_argument('--compare', metavar='PATH', help='Compare the results against a saved baseline.')
+    parser.add_argument('--threshold', type=float, default=suite.REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    dataset = Dataset(
+        objects=args.objects,
+        object_size=args.object_size,
+        upload_size=args.upload_size,
+        zones=args.zones,
+        certificates=args.certificates,
+        distributions=args.distributions,
+    )
+    options = {}
+    if args.prefetch_pages is not None:
+        options.update({'prefetch_pages': args.prefetch_pages})
+
+    results = suite.run(
+        dataset,
+        names=args.cases,
+        latency=args.latency / 1000,
+        iterations=args.iterations,
+        **options,
+    )
+    suite.report(results)
+
+    if args.save:
+        suite.save(results, args.save)
+
+    if args.compare:
+        print()
+        if suite.compare(results, args.compare, threshold=args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,524 @@
+
+import bisect
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+import io
+import time
+from urllib.parse import unquote
+
+from botocore import xform_name
+from botocore.awsrequest import AWSResponse
+from botocore.response import StreamingBody
+
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class Dataset:
+    bucket: str = 'benchmark-bucket'
+    objects: int = 10000
+    object_size: int = 1024
+    upload_size: int = 64 * 1024 * 1024
+    zones: int = 500
+    certificates: int = 2000
+    distributions: int = 500
+    rest_apis: int = 100
+    resources: int = 50
+
+
+class LocalAWS:
+    # An in-process stand-in for the AWS endpoints used by the benchmarks. It answers
+    # from botocore's before-call hook, the same hook botocore's Stubber uses, so
+    # parameter validation, pagination and waiters run as usual but nothing is sent
+    # over the network. `latency` adds a fixed delay, in seconds, to every call.
+
+    def __init__(self, dataset: Dataset = None, *, latency: float = 0):
+        self.dataset = dataset or Dataset()
+        self.latency = latency
+        self.calls = 0
+
+        # Kept sorted, as S3 lists keys in order. The keys are spread over 16
+        # prefixes, for sharded listings.
+        self.objects = sorted(f'data/{index % 16:02x}/{index:08d}.json' for index in range(self.dataset.objects))
+        self.object_keys = set(self.objects)
+        # Bodies of uploaded objects, the others are generated from their key.
+        self.bodies = {}
+        self.etags = {}
+        # The headers objects were uploaded with, by key and by upload id.
+        self.headers = {}
+        self.upload_headers = {}
+        self.multipart_uploads = {}
+        self.zones = [
+            {
+                'Id': f'/hostedzone/Z{index:012d}',
+                'Name': f'zone{index}.example.com.',
+                'CallerReference': str(index),
+                'Config': {'PrivateZone': False},
+                'ResourceRecordSetCount': 2,
+            }
+            for index in range(self.dataset.zones)
+        ]
+        self.certificates = [
+            {
+                'CertificateArn': f'arn:aws:acm:us-east-1:123456789012:certificate/{index:08d}',
+                'DomainName': f'cert{index}.example.com',
+                'SubjectAlternativeNameSummaries': [f'cert{index}.example.com', f'www.cert{index}.example.com'],
+                'Status': 'ISSUED',
+            }
+            for index in range(self.dataset.certificates)
+        ]
+        self.distributions = [
+            {
+                'Id': f'E{index:012d}',
+                'ARN': f'arn:aws:cloudfront::123456789012:distribution/E{index:012d}',
+                'DomainName': f'd{index:012d}.cloudfront.net',
+                'Aliases': {'Quantity': 1, 'Items': [f'cdn{index}.example.com']},
+                'Status': 'Deployed',
+            }
+            for index in range(self.dataset.distributions)
+        ]
+        self.rest_apis = [{'id': f'api{index:06d}', 'name': f'api-{index}'} for index in range(self.dataset.rest_apis)]
+        self.resources = [
+            {
+                'id': f'res{index:06d}',
+                'path': f'/resource{index}',
+                'resourceMethods': {'GET': {'apiKeyRequired': False}, 'POST': {'apiKeyRequired': False}},
+            }
+            for index in range(self.dataset.resources)
+        ]
+        self.api_keys = []
+        self.usage_plans = []
+        self.usage_plan_keys = set()
+
+    def install(self, session):
+        # Clients copy the session's event hooks when they are created, so this has
+        # to happen before any client is made from the session.
+        session.events.register('before-parameter-build', self._capture)
+        session.events.register('before-call', self._handle)
+        return session
+
+    @staticmethod
+    def _capture(params, context, **kwargs):  # pylint: disable=unused-argument
+        # before-call only sees the serialized request, so the call's own
+        # parameters are kept aside for it.
+        context['standin_params'] = params
+
+    def _handle(self, model, context, **kwargs):  # pylint: disable=unused-argument
+        self.calls += 1
+        params = context.pop('standin_params')
+        if self.latency:
+            time.sleep(self.latency)
+
+        handler = getattr(self, f'_{model.service_model.service_name}_{xform_name(model.name)}', None)
+        if handler is None:
+            return self._error(501, 'NotImplemented', f'{model.name} is not supported by the stand-in')
+
+        return handler(params)
+
+    @staticmethod
+    def _ok(parsed, *, headers=None):
+        parsed.setdefault('ResponseMetadata', {}).update({'HTTPStatusCode': 200, 'RetryAttempts': 0})
+        return AWSResponse('https://localhost', 200, headers or {}, None), parsed
+
+    @staticmethod
+    def _error(status, code, message=''):
+        parsed = {
+            'Error': {'Code': code, 'Message': message},
+            'ResponseMetadata': {'HTTPStatusCode': status, 'RetryAttempts': 0},
+        }
+        return AWSResponse('https://localhost', status, {}, None), parsed
+
+    @staticmethod
+    def _page(items, token, limit):
+        start = int(token or 0)
+        end = start + int(limit)
+        return items[start:end], (str(end) if end < len(items) else None)
+
+    @staticmethod
+    def _read(body):
+        if isinstance(body, (bytes, bytearray)):
+            return bytes(body)
+        if isinstance(body, str):
+            return body.encode('utf-8')
+
+        body.seek(0)
+        return body.read()
+
+    @staticmethod
+    def _stored_headers(params):
+        return {name: params[name] for name in ('ContentType', 'ContentEncoding', 'Metadata') if name in params}
+
+    def _store(self, key, body, etag=None, headers=None):
+        if key not in self.object_keys:
+            bisect.insort(self.objects, key)
+            self.object_keys.add(key)
+
+        self.bodies[key] = body
+        self.headers[key] = headers or {}
+        self.etags[key] = etag or f'"{hashlib.md5(body).hexdigest()}"'
+        return self.etags[key]
+
+    def _body(self, key):
+        if key in self.bodies:
+            return self.bodies[key]
+
+        seed = hashlib.md5(key.encode('utf-8')).hexdigest().encode('ascii')
+        return (seed * (self.dataset.object_size // len(seed) + 1))[:self.dataset.object_size]
+
+    # s3
+
+    def _s3_list_objects_v2(self, params):
+        prefix = params.get('Prefix', '')
+        delimiter = params.get('Delimiter')
+        limit = int(params.get('MaxKeys', 1000))
+
+        # Tokens are the next key to list, as in S3 they stay valid while keys are
+        # added or deleted.
+        if params.get('ContinuationToken'):
+            index = bisect.bisect_left(self.objects, params['ContinuationToken'])
+        else:
+            index = bisect.bisect_left(self.objects, prefix)
+            if params.get('StartAfter'):
+                index = max(index, bisect.bisect_right(self.objects, params['StartAfter']))
+
+        keys, prefixes = [], []
+        while index < len(self.objects) and len(keys) + len(prefixes) < limit:
+            key = self.objects[index]
+            if not key.startswith(prefix):
+                break
+
+            if delimiter and delimiter in key[len(prefix):]:
+                common = key[:key.index(delimiter, len(prefix)) + len(delimiter)]
+                prefixes.append(common)
+                index = bisect.bisect_left(self.objects, common + '\U0010ffff')
+                continue
+
+            keys.append(key)
+            index += 1
+
+        truncated = index < len(self.objects) and self.objects[index].startswith(prefix)
+        parsed = {
+            'Name': params['Bucket'],
+            'Prefix': prefix,
+            'KeyCount': len(keys) + len(prefixes),
+            'IsTruncated': truncated,
+            'Contents': [
+                {
+                    'Key': key,
+                    'Size': len(self.bodies[key]) if key in self.bodies else self.dataset.object_size,
+                    'ETag': self.etags.get(key) or f'"{hashlib.md5(key.encode("utf-8")).hexdigest()}"',
+                    'LastModified': EPOCH,
+                    'StorageClass': 'STANDARD',
+                }
+                for key in keys
+            ],
+        }
+        if prefixes:
+            parsed.update({'CommonPrefixes': [{'Prefix': common} for common in prefixes]})
+        if truncated:
+            parsed.update({'NextContinuationToken': self.objects[index]})
+
+        return self._ok(parsed)
+
+    def _s3_list_object_versions(self, params):
+        # The bucket is unversioned, so every key has a single 'null' version.
+        prefix = params.get('Prefix', '')
+        index = bisect.bisect_right(self.objects, params['KeyMarker']) if params.get('KeyMarker') \
+            else bisect.bisect_left(self.objects, prefix)
+        limit = int(params.get('MaxKeys', 1000))
+
+        keys = []
+        while index < len(self.objects) and len(keys) < limit and self.objects[index].startswith(prefix):
+            keys.append(self.objects[index])
+            index += 1
+
+        truncated = index < len(self.objects) and self.objects[index].startswith(prefix)
+        parsed = {
+            'Name': params['Bucket'],
+            'Prefix': prefix,
+            'IsTruncated': truncated,
+            'Versions': [
+                {'Key': key, 'VersionId': 'null', 'IsLatest': True, 'LastModified': EPOCH, 'ETag': self.etags.get(key, '""')}
+                for key in keys
+            ],
+        }
+        if truncated:
+            parsed.update({'NextKeyMarker': keys[-1], 'NextVersionIdMarker': 'null'})
+
+        return self._ok(parsed)
+
+    def _s3_head_object(self, params):
+        if params['Key'] not in self.object_keys:
+            return self._error(404, '404', 'Not Found')
+
+        if params['Key'] in self.bodies:
+            body = self.bodies[params['Key']]
+            return self._ok({
+                'ContentLength': len(body),
+                'ContentType': 'binary/octet-stream',
+                'ETag': self.etags[params['Key']],
+                'LastModified': EPOCH,
+                **self.headers.get(params['Key'], {}),
+            })
+
+        return self._ok({
+            'ContentLength': self.dataset.object_size,
+            'ContentType': 'application/json',
+            'ETag': f'"{hashlib.md5(params["Key"].encode("utf-8")).hexdigest()}"',
+            'LastModified': EPOCH,
+        })
+
+    def _s3_get_object(self, params):
+        head = self._s3_head_object(params)
+        if head[0].status_code != 200:
+            return self._error(404, 'NoSuchKey', 'The specified key does not exist.')
+
+        parsed = head[1]
+        if params.get('IfMatch') not in (None, parsed['ETag'], '*'):
+            return self._error(412, 'PreconditionFailed', 'At least one of the pre-conditions you specified did not hold')
+
+        if params.get('IfNoneMatch') in (parsed['ETag'], '*') or (
+                params.get('IfModifiedSince') and params['IfModifiedSince'] >= parsed['LastModified']):
+            response, error = self._error(304, '304', 'Not Modified')
+            error['ResponseMetadata'].update({
+                'HTTPHeaders': {'etag': parsed['ETag'], 'last-modified': 'Mon, 01 Jan 2024 00:00:00 GMT'},
+            })
+            return response, error
+
+        body = self._body(params['Key'])
+        if params.get('Range'):
+            start, _, end = params['Range'][len('bytes='):].partition('-')
+            if not start:
+                start, end = len(body) - int(end), len(body) - 1
+            start, end = int(start), min(int(end or len(body) - 1), len(body) - 1)
+            if start >= len(body):
+                response, error = self._error(416, 'InvalidRange', 'The requested range is not satisfiable')
+                error['Error'].update({'ActualObjectSize': str(len(body))})
+                return response, error
+
+            parsed.update({'ContentRange': f'bytes {start}-{end}/{len(body)}'})
+            body = body[start:end + 1]
+
+        parsed.update({'Body': StreamingBody(io.BytesIO(body), len(body)), 'ContentLength': len(body)})
+        return self._ok(parsed, headers={'content-length': str(len(body))})
+
+    def _s3_put_object(self, params):
+        body = self._read(params.get('Body', b''))
+        return self._ok({'ETag': self._store(params['Key'], body, headers=self._stored_headers(params))})
+
+    @staticmethod
+    def _copy_source(params):
+        # botocore turns a CopySource dict into 'bucket/key?versionId=...' before
+        # the call is made.
+        source = params['CopySource']
+        if isinstance(source, dict):
+            return source['Key']
+
+        return unquote(source.split('?')[0].split('/', 1)[1])
+
+    def _s3_copy_object(self, params):
+        source = self._copy_source(params)
+        if source not in self.object_keys:
+            return self._error(404, 'NoSuchKey', 'The specified key does not exist.')
+
+        headers = self._stored_headers(params) if params.get('MetadataDirective') == 'REPLACE' \
+            else dict(self.headers.get(source, {}))
+        etag = self._store(params['Key'], self._body(source), headers=headers)
+        return self._ok({'CopyObjectResult': {'ETag': etag, 'LastModified': EPOCH}})
+
+    def _s3_upload_part_copy(self, params):
+        if params['UploadId'] not in self.multipart_uploads:
+            return self._error(404, 'NoSuchUpload')
+
+        head = self._s3_head_object({'Key': self._copy_source(params)})
+        if head[0].status_code != 200:
+            return self._error(404, 'NoSuchKey', 'The specified key does not exist.')
+        if params.get('CopySourceIfMatch') not in (None, head[1]['ETag']):
+            return self._error(412, 'PreconditionFailed', 'At least one of the pre-conditions you specified did not hold')
+
+        start, _, end = params['CopySourceRange'][len('bytes='):].partition('-')
+        body = self._body(self._copy_source(params))[int(start):int(end) + 1]
+        self.multipart_uploads[params['UploadId']][params['PartNumber']] = body
+        return self._ok({'CopyPartResult': {'ETag': f'"{hashlib.md5(body).hexdigest()}"', 'LastModified': EPOCH}})
+
+    def _s3_delete_object(self, params):
+        if params['Key'] in self.object_keys:
+            self.objects.remove(params['Key'])
+            self.object_keys.discard(params['Key'])
+            self.bodies.pop(params['Key'], None)
+            self.etags.pop(params['Key'], None)
+            self.headers.pop(params['Key'], None)
+
+        return self._ok({})
+
+    def _s3_delete_objects(self, params):
+        objects = params['Delete']['Objects']
+        if len(objects) > 1000:
+            return self._error(400, 'MalformedXML')
+
+        keys = {item['Key'] for item in objects}
+        self.objects[:] = [key for key in self.objects if key not in keys]
+        self.object_keys -= keys
+        for key in keys:
+            self.bodies.pop(key, None)
+            self.etags.pop(key, None)
+            self.headers.pop(key, None)
+
+        deleted = [] if params['Delete'].get('Quiet') else [{'Key': item['Key']} for item in objects]
+        return self._ok({'Deleted': deleted})
+
+    def _s3_create_multipart_upload(self, params):
+        upload_id = f'upload{len(self.multipart_uploads):06d}'
+        self.multipart_uploads[upload_id] = {}
+        self.upload_headers[upload_id] = self._stored_headers(params)
+        return self._ok({'Bucket': params['Bucket'], 'Key': params['Key'], 'UploadId': upload_id})
+
+    def _s3_upload_part(self, params):
+        if params['UploadId'] not in self.multipart_uploads:
+            return self._error(404, 'NoSuchUpload')
+
+        body = self._read(params['Body'])
+        self.multipart_uploads[params['UploadId']][params['PartNumber']] = body
+        return self._ok({'ETag': f'"{hashlib.md5(body).hexdigest()}"'})
+
+    def _s3_complete_multipart_upload(self, params):
+        parts = self.multipart_uploads.pop(params['UploadId'], None)
+        if parts is None:
+            return self._error(404, 'NoSuchUpload')
+
+        numbers = [part['PartNumber'] for part in params['MultipartUpload']['Parts']]
+        if numbers != sorted(parts):
+            return self._error(400, 'InvalidPart')
+
+        # Like S3, the ETag of a multipart object is the MD5 of its parts' MD5s.
+        digests = b''.join(bytes.fromhex(part['ETag'].strip('"')) for part in params['MultipartUpload']['Parts'])
+        etag = f'"{hashlib.md5(digests).hexdigest()}-{len(numbers)}"'
+        body = b''.join(parts[number] for number in numbers)
+        etag = self._store(params['Key'], body, etag, self.upload_headers.pop(params['UploadId'], None))
+        return self._ok({'Bucket': params['Bucket'], 'Key': params['Key'], 'ETag': etag})
+
+    def _s3_abort_multipart_upload(self, params):
+        self.multipart_uploads.pop(params['UploadId'], None)
+        self.upload_headers.pop(params['UploadId'], None)
+        return self._ok({})
+
+    # route53
+
+    def _route53_list_hosted_zones(self, params):
+        zones, token = self._page(self.zones, params.get('Marker'), params.get('MaxItems', 100))
+        parsed = {
+            'HostedZones': zones,
+            'IsTruncated': token is not None,
+            'MaxItems': str(params.get('MaxItems', 100)),
+        }
+        if token:
+            parsed.update({'NextMarker': token})
+
+        return self._ok(parsed)
+
+    def _route53_get_hosted_zone(self, params):
+        for zone in self.zones:
+            if zone['Id'].endswith(params['Id']):
+                return self._ok({'HostedZone': zone, 'DelegationSet': {'NameServers': []}})
+
+        return self._error(404, 'NoSuchHostedZone')
+
+    # acm
+
+    def _acm_list_certificates(self, params):
+        certificates, token = self._page(self.certificates, params.get('NextToken'), params.get('MaxItems', 100))
+        parsed = {'CertificateSummaryList': certificates}
+        if token:
+            parsed.update({'NextToken': token})
+
+        return self._ok(parsed)
+
+    def _acm_describe_certificate(self, params):
+        for certificate in self.certificates:
+            if certificate['CertificateArn'] == params['CertificateArn']:
+                return self._ok({'Certificate': dict(certificate, DomainValidationOptions=[])})
+
+        return self._error(400, 'ResourceNotFoundException')
+
+    # cloudfront
+
+    def _cloudfront_list_distributions(self, params):
+        distributions, token = self._page(self.distributions, params.get('Marker'), params.get('MaxItems', 100))
+        parsed = {
+            'DistributionList': {
+                'Marker': params.get('Marker', ''),
+                'MaxItems': int(params.get('MaxItems', 100)),
+                'IsTruncated': token is not None,
+                'Quantity': len(distributions),
+                'Items': distributions,
+            },
+        }
+        if token:
+            parsed['DistributionList'].update({'NextMarker': token})
+
+        return self._ok(parsed)
+
+    # apigateway
+
+    def _apigateway_get_rest_apis(self, params):
+        items, token = self._page(self.rest_apis, params.get('position'), params.get('limit', 25))
+        return self._ok({'items': items, **({'position': token} if token else {})})
+
+    def _apigateway_get_api_keys(self, params):
+        items, token = self._page(self.api_keys, params.get('position'), params.get('limit', 25))
+        return self._ok({'items': items, **({'position': token} if token else {})})
+
+    def _apigateway_create_api_key(self, params):
+        api_key = {'id': f'key{len(self.api_keys):06d}', 'name': params['name'], 'enabled': True}
+        self.api_keys.append(api_key)
+        return self._ok(dict(api_key))
+
+    def _apigateway_get_usage_plans(self, params):
+        items, token = self._page(self.usage_plans, params.get('position'), params.get('limit', 25))
+        return self._ok({'items': items, **({'position': token} if token else {})})
+
+    def _apigateway_create_usage_plan(self, params):
+        usage_plan = {
+            'id': f'plan{len(self.usage_plans):06d}',
+            'name': params['name'],
+            'apiStages': params.get('apiStages', []),
+        }
+        self.usage_plans.append(usage_plan)
+        return self._ok(dict(usage_plan))
+
+    def _apigateway_update_usage_plan(self, params):
+        for usage_plan in self.usage_plans:
+            if usage_plan['id'] == params['usagePlanId']:
+                for operation in params.get('patchOperations', []):
+                    api_id, stage = operation['value'].split(':', 1)
+                    usage_plan['apiStages'].append({'apiId': api_id, 'stage': stage})
+
+                return self._ok(dict(usage_plan))
+
+        return self._error(404, 'NotFoundException')
+
+    def _apigateway_get_stages(self, params):  # pylint: disable=unused-argument
+        return self._ok({'item': [{'deploymentId': 'deployment', 'stageName': 'prod'}]})
+
+    def _apigateway_get_usage_plan_key(self, params):
+        if (params['usagePlanId'], params['keyId']) not in self.usage_plan_keys:
+            return self._error(404, 'NotFoundException')
+
+        return self._ok({'id': params['keyId'], 'type': 'API_KEY'})
+
+    def _apigateway_create_usage_plan_key(self, params):
+        self.usage_plan_keys.add((params['usagePlanId'], params['keyId']))
+        return self._ok({'id': params['keyId'], 'type': params['keyType']})
+
+    def _apigateway_get_resources(self, params):
+        items, token = self._page(self.resources, params.get('position'), params.get('limit', 25))
+        return self._ok({'items': items, **({'position': token} if token else {})})
+
+    def _apigateway_update_method(self, params):
+        for resource in self.resources:
+            if resource['id'] == params['resourceId']:
+                resource['resourceMethods'][params['httpMethod']]['apiKeyRequired'] = True
+
+        return self._ok({'httpMethod': params['httpMethod'], 'apiKeyRequired': True})
@@ -0,0 +1,241 @@
+
+from dataclasses import asdict, dataclass
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+import typing
+
+import boto3
+
+from simplifier.acm import Certificate
+from simplifier.apigateway import Gateway
+from simplifier.cloudfront import Distribution
+from simplifier.pool import ClientPool
+from simplifier.r53 import Zone
+from simplifier.s3 import Bucket, Object
+
+from .standin import Dataset, LocalAWS
+
+
+# A case regresses once it is this much slower, or uses this much more memory,
+# than the baseline it is compared against.
+REGRESSION_THRESHOLD = 0.10
+
+
+@dataclass
+class Case:
+    name: str
+    # Called once per iteration with the object arguments, returns the number of
+    # items it processed.
+    run: typing.Callable[..., int]
+    iterations: int = 5
+
+
+@dataclass
+class Result:
+    name: str
+    iterations: int
+    items: int
+    calls: int
+    throughput: float
+    p50: float
+    p90: float
+    p99: float
+    peak_memory: int
+
+
+def _bucket_list(aws, **kwargs):
+    return sum(1 for _ in Bucket(aws.dataset.bucket, **kwargs).list())
+
+
+def _bucket_summaries(aws, **kwargs):
+    return sum(1 for _ in Bucket(aws.dataset.bucket, **kwargs).summaries())
+
+
+def _bucket_list_sharded(aws, **kwargs):
+    return sum(len(batch) for batch in Bucket(aws.dataset.bucket, **kwargs).list_sharded(depth=2))
+
+
+def _bucket_copy_prefix(aws, **kwargs):
+    report = Bucket(aws.dataset.bucket, **kwargs).copy_prefix('data/00/', f'{aws.dataset.bucket}-copy', 'copy/')
+    return len(report.raise_for_errors().results)
+
+
+def _bucket_presigned_urls(aws, **kwargs):
+    return sum(1 for _ in Bucket(aws.dataset.bucket, **kwargs).presigned_urls(aws.objects))
+
+
+def _object_get(aws, *, gets=100, **kwargs):
+    step = max(len(aws.objects) // gets, 1)
+    for key in aws.objects[::step][:gets]:
+        Object(aws.dataset.bucket, key, **kwargs).contents  # pylint: disable=expression-not-assigned
+
+    return gets
+
+
+def _object_create(aws, **kwargs):
+    Object.create(aws.dataset.bucket, 'upload/benchmark.bin', bytes(aws.dataset.upload_size), **kwargs)
+    return 1
+
+
+def _zone_find(aws, **kwargs):
+    Zone.find_by_domain(aws.zones[-1]['Name'][:-1], **kwargs)
+    return len(aws.zones)
+
+
+def _certificate_find(aws, **kwargs):
+    Certificate.find_by_domain(aws.certificates[-1]['DomainName'], **kwargs)
+    return len(aws.certificates)
+
+
+def _distribution_find(aws, **kwargs):
+    Distribution.find_by_domain_name(aws.distributions[-1]['Aliases']['Items'][0], **kwargs)
+    return len(aws.distributions)
+
+
+def _gateway_ensure_api_key(aws, **kwargs):
+    gateway = Gateway.find_by_name(aws.rest_apis[-1]['name'], **kwargs)
+    gateway.ensure_api_key('benchmark', 'benchmark-key-value-0123456789')
+    return len(aws.resources)
+
+
+CASES = [
+    Case('bucket.list', _bucket_list),
+    Case('bucket.summaries', _bucket_summaries),
+    Case('bucket.list_sharded', _bucket_list_sharded),
+    Case('bucket.copy_prefix', _bucket_copy_prefix),
+    Case('bucket.presigned_urls', _bucket_presigned_urls),
+    Case('object.get', _object_get),
+    Case('object.create', _object_create),
+    Case('zone.find_by_domain', _zone_find),
+    Case('certificate.find_by_domain', _certificate_find),
+    Case('distribution.find_by_domain_name', _distribution_find),
+    Case('gateway.ensure_api_key', _gateway_ensure_api_key),
+]
+
+
+def _percentile(values, percentile):
+    if len(values) == 1:
+        return values[0]
+
+    return statistics.quantiles(values, n=100, method='inclusive')[percentile - 1]
+
+
+def _session(aws):
+    session = boto3.session.Session(
+        aws_access_key_id='benchmark',
+        aws_secret_access_key='benchmark',
+        region_name='us-east-1',
+    )
+    return aws.install(session)
+
+
+def run_case(case: Case, dataset: Dataset, *, latency: float = 0, iterations: int = None, **options) -> Result:
+    iterations = iterations or case.iterations
+    aws = LocalAWS(dataset, latency=latency)
+
+    # Each case gets its own session and client pool so that cases do not share
+    # warm clients.
+    kwargs = {
+        'session': _session(aws),
+        'client_pool': ClientPool(),
+        **options,
+    }
+
+    # A warm-up run keeps client construction and model loading out of the timings.
+    case.run(aws, **kwargs)
+    aws.calls = 0
+
+    timings = []
+    items = 0
+    for _ in range(iterations):
+        gc.collect()
+        started = time.perf_counter()
+        items += case.run(aws, **kwargs)
+        timings.append(time.perf_counter() - started)
+
+    calls = aws.calls
+
+    # Memory is measured on a separate run since tracing skews the timings.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.run(aws, **kwargs)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        name=case.name,
+        iterations=iterations,
+        items=items,
+        calls=calls,
+        throughput=items / sum(timings),
+        p50=_percentile(timings, 50),
+        p90=_percentile(timings, 90),
+        p99=_percentile(timings, 99),
+        peak_memory=peak_memory,
+    )
+
+
+def run(dataset: Dataset = None, *, names=None, **kwargs) -> typing.List[Result]:
+    dataset = dataset or Dataset()
+    return [
+        run_case(case, dataset, **kwargs)
+        for case in CASES
+        if not names or case.name in names
+    ]
+
+
+def report(results: typing.List[Result], *, file=None):
+    print(
+        f'{"case":<34} {"items/s":>12} {"p50 ms":>10} {"p90 ms":>10} {"p99 ms":>10} {"calls":>8} {"peak KiB":>10}',
+        file=file,
+    )
+    for result in results:
+        print(
+            f'{result.name:<34} {result.throughput:>12.1f} {result.p50 * 1000:>10.2f} '
+            f'{result.p90 * 1000:>10.2f} {result.p99 * 1000:>10.2f} {result.calls:>8} '
+            f'{result.peak_memory / 1024:>10.1f}',
+            file=file,
+        )
+
+
+def save(results: typing.List[Result], path):
+    with open(path, 'w', encoding='utf-8') as filehandle:
+        json.dump({result.name: asdict(result) for result in results}, filehandle, indent=2)
+
+
+def compare(results: typing.List[Result], path, *, threshold: float = REGRESSION_THRESHOLD, file=None):
+    with open(path, 'r', encoding='utf-8') as filehandle:
+        baseline = json.load(filehandle)
+
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            print(f'{result.name:<34} no baseline', file=file)
+            continue
+
+        changes = {
+            'throughput': result.throughput / previous['throughput'] - 1,
+            'p50': result.p50 / previous['p50'] - 1,
+            'peak_memory': result.peak_memory / max(previous['peak_memory'], 1) - 1,
+        }
+        regressed = [
+            name for name, change in changes.items()
+            if (-change if name == 'throughput' else change) > threshold
+        ]
+        if regressed:
+            regressions.append(result.name)
+
+        print(
+            f'{result.name:<34} '
+            + ' '.join(f'{name} {change:+.1%}' for name, change in changes.items())
+            + (f'  REGRESSED ({", ".join(regressed)})' if regressed else ''),
+            file=file,
+        )
+
+    return regressions
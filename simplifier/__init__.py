@@ -0,0 +1,28 @@
+
+from importlib import import_module
+
+
+# Service packages are imported on first access, e.g. `simplifier.s3`, so that
+# importing simplifier only pays for the services actually used.
+_SUBPACKAGES = (
+    'acm',
+    'aio',
+    'apigateway',
+    'cloudfront',
+    'iam',
+    'lambda',
+    'r53',
+    's3',
+    'sts',
+)
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        return import_module(f'.{name}', __name__)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted([*globals(), *_SUBPACKAGES])
@@ -0,0 +1,63 @@
+
+from .. import acm
+from .base import AioBoto3Base
+from .r53 import Zone
+
+
+class Certificate(AioBoto3Base, acm.Certificate):
+
+    @property
+    def status(self):
+        return self._data.get('Status')
+
+    async def create(self):
+        kwargs = self.include_tags(
+            DomainName=self.domain_name,
+            ValidationMethod='DNS',
+            KeyAlgorithm='RSA_2048',
+        )
+        if self.subject_alternate_names:
+            kwargs.update({
+                'SubjectAlternativeNames': self.subject_alternate_names,
+            })
+
+        client = await self.get_client()
+        self._data = await client.request_certificate(**kwargs)
+
+    async def load(self):
+        if self._data.get('CertificateArn'):
+            client = await self.get_client()
+            self._data = (await client.describe_certificate(
+                CertificateArn=self.arn,
+            )).get('Certificate')
+        else:
+            cert = await type(self).find_by_domain(self.domain_name, **self.init_args)
+            await cert.load()
+            self._data = cert._data
+
+    async def validation_records(self, limit_to_domains=None):
+        if not self._data.get('DomainValidationOptions'):
+            await self.load()
+
+        return super().validation_records(limit_to_domains)
+
+    async def validate(self, *, wait=False):
+        zone = await Zone.find_by_domain(self.domain_name, **self.init_args)
+        await zone.update(await self.validation_records(), wait=wait)
+
+        if wait:
+            await self.wait(
+                'certificate_validated',
+                CertificateArn=self.arn,
+            )
+
+    @classmethod
+    async def find_by_domain(cls, domain_name, **kwargs):
+        self = cls(domain_name, **kwargs)
+
+        async for item in self.paginate('list_certificates', 'CertificateSummaryList'):
+            if item['DomainName'] == domain_name or domain_name in item['SubjectAlternativeNameSummaries']:
+                self._data = item
+                return self
+
+        return None
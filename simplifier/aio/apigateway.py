@@ -0,0 +1,158 @@
+
+from dataclasses import asdict
+
+from .. import apigateway
+from ..apigateway import (
+    GatewayStage,
+    UsagePlanStage,
+)
+from .base import AioBoto3Base
+
+
+class Gateway(AioBoto3Base, apigateway.Gateway):
+
+    @classmethod
+    async def find_by_name(cls, name, **kwargs):
+        self = cls(name, **kwargs)
+        async for item in self.paginate('get_rest_apis', 'items'):
+            if item['name'] == self.name:
+                self._data = item
+                return self
+
+        return None
+
+    async def ensure_api_key(self, name, key):
+        api_key = await ApiKey.find_by_name(name, **self.init_args)
+        if not api_key:
+            api_key = ApiKey(name, value=key, **self.init_args)
+            await api_key.create()
+
+        usage_plan = await UsagePlan.find_by_name(name, **self.init_args)
+        if not usage_plan:
+            usage_plan = UsagePlan(name, **self.init_args)
+            await usage_plan.create(api_gateway=self)
+
+        await usage_plan.ensure_stage(self)
+        await usage_plan.add_key(api_key)
+
+        client = await self.get_client()
+        async for resource in self.paginate('get_resources', 'items', restApiId=self.id):
+            for method, data in resource.get('resourceMethods', {}).items():
+                if data.get('apiKeyRequired'):
+                    continue
+
+                await client.update_method(
+                   restApiId=self.id,
+                   resourceId=resource['id'],
+                   httpMethod=method,
+                   patchOperations=[{
+                       'op': 'replace',
+                       'path': '/apiKeyRequired',
+                       'value': 'true',
+                   }],
+                )
+
+    @property
+    def stages(self):
+        raise AttributeError('Use `await load_stages()` with the asyncio API.')
+
+    async def load_stages(self):
+        client = await self.get_client()
+        resp = await client.get_stages(restApiId=self.id)
+        return [GatewayStage(deploymentId=item['deploymentId'], stageName=item['stageName']) for item in resp.get('item')]
+
+
+class ApiKey(AioBoto3Base, apigateway.ApiKey):
+
+    @classmethod
+    async def find_by_name(cls, name, **kwargs):
+        self = cls(name, **kwargs)
+        async for item in self.paginate('get_api_keys', 'items'):
+            if item['name'] == name:
+                self._data = item
+                return self
+
+        return None
+
+    async def create(self, *, value=None, wait=False):
+        if value is None:
+            if self.value is None:
+                raise ValueError(
+                    'Either provide a value when creating the ApiKey object, or when calling create()'
+                )
+
+            value = self.value
+
+        kwargs = self.include_tags(
+            name=self.name,
+            value=value,
+        )
+        client = await self.get_client()
+        self._data = await client.create_api_key(**kwargs)
+
+
+class UsagePlan(AioBoto3Base, apigateway.UsagePlan):
+
+    @classmethod
+    async def find_by_name(cls, name, **kwargs):
+        self = cls(name, **kwargs)
+        async for item in self.paginate('get_usage_plans', 'items'):
+            if item['name'] == self.name:
+                self._data = item
+                return self
+
+        return None
+
+    async def create(self, *, api_gateway=None):
+        kwargs = self.include_tags(
+            name=self.name,
+        )
+
+        if api_gateway is not None:
+            new_stages = []
+            for stage in await api_gateway.load_stages():
+                usage_plan_stage = UsagePlanStage(
+                    apiId=api_gateway.id,
+                    stage=stage.name,
+                )
+                new_stages.append(asdict(usage_plan_stage))
+
+            if new_stages:
+                kwargs.update({
+                    'apiStages': new_stages,
+                })
+
+        client = await self.get_client()
+        self._data = await client.create_usage_plan(**kwargs)
+
+    async def ensure_stage(self, api_gateway):
+        stages = self.stages
+        client = await self.get_client()
+        for stage in await api_gateway.load_stages():
+            usage_plan_stage = UsagePlanStage(
+                apiId=api_gateway.id,
+                stage=stage.name,
+            )
+            if usage_plan_stage not in stages:
+                await client.update_usage_plan(
+                    usagePlanId=self.id,
+                    patchOperations=[{
+                        'op': 'add',
+                        'path': '/apiStages',
+                        'value': f'{usage_plan_stage.apiId}:{usage_plan_stage.stage}',
+                    }],
+                )
+
+    async def add_key(self, api_key):
+        client = await self.get_client()
+        try:
+            await client.get_usage_plan_key(
+                usagePlanId=self.id,
+                keyId=api_key.id,
+            )
+        except client.exceptions.NotFoundException:
+            await client.create_usage_plan_key(
+                usagePlanId=self.id,
+                keyId=api_key.id,
+                keyType='API_KEY',
+            )
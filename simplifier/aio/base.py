@@ -0,0 +1,162 @@
+
+import threading
+import time
+import typing
+
+try:
+    from aiobotocore.session import AioSession
+    HAS_AIOBOTOCORE = True
+except ImportError:
+    HAS_AIOBOTOCORE = False
+
+from ..metrics import Sample
+from ..pool import _freeze
+from .pool import AioClientPool, default_pool
+
+
+_shared_sessions = {}
+_shared_sessions_lock = threading.Lock()
+
+
+def shared_aio_session(**session_args) -> 'AioSession':
+    # Objects made without an aio_session share one per set of session args, so
+    # that they also share pooled clients and their connections.
+    key = _freeze(session_args)
+    with _shared_sessions_lock:
+        if key not in _shared_sessions:
+            aio_session = AioSession(profile=session_args.get('profile_name'))
+
+            if session_args.get('aws_access_key_id'):
+                aio_session.set_credentials(
+                    session_args['aws_access_key_id'],
+                    session_args.get('aws_secret_access_key'),
+                    session_args.get('aws_session_token'),
+                )
+
+            if session_args.get('region_name'):
+                aio_session.set_config_variable('region', session_args['region_name'])
+
+            _shared_sessions[key] = aio_session
+
+        return _shared_sessions[key]
+
+
+class AioBoto3Base:
+    # Mixed in ahead of a synchronous wrapper, e.g. `class Zone(AioBoto3Base, r53.Zone)`.
+    # Every method that talks to AWS is overridden as a coroutine, while the plain
+    # data properties of the wrapped class are reused as-is.
+    _aio_session: 'AioSession' = None
+    _aio_client_pool: AioClientPool = default_pool
+
+    def __init__(
+        self, *args,
+        aio_session: 'AioSession' = None,
+        aio_client_pool: AioClientPool = None,
+        **kwargs,
+    ):
+        if not HAS_AIOBOTOCORE:
+            raise RuntimeError(
+                'aiobotocore is not present in this environment. Cannot use the asyncio API.')
+
+        self._aio_session = aio_session
+        if aio_client_pool is not None:
+            self._aio_client_pool = aio_client_pool
+
+        super().__init__(*args, **kwargs)
+
+    @property
+    def init_args(self):
+        init_args = super().init_args
+        init_args.update({
+            'aio_session': self.aio_session,
+            'aio_client_pool': self.aio_client_pool,
+        })
+        return init_args
+
+    @property
+    def aio_session(self) -> 'AioSession':
+        if self._aio_session is None:
+            self._aio_session = shared_aio_session(**self.session_args)
+
+        return self._aio_session
+
+    @property
+    def aio_client_pool(self):
+        return self._aio_client_pool
+
+    @property
+    def region_name(self):
+        return self.client_args.get('region_name') or self.aio_session.get_config_variable('region')
+
+    @property
+    def client(self):
+        raise AttributeError('Async objects have no blocking client. Use `await get_client()` instead.')
+
+    @client.setter
+    def client(self, value):
+        self._client = value
+
+    @property
+    def resource(self):
+        raise AttributeError('boto3 resources are not available through the asyncio API.')
+
+    @resource.setter
+    def resource(self, value):
+        self._resource = value
+
+    async def get_client(self):
+        if not self._client:
+            if self.aio_client_pool:
+                self._client = await self.aio_client_pool.client(
+                    self.aio_session, self.service, self.client_args)
+            else:
+                self._client = await self.aio_session.create_client(
+                    self.service, **self.client_args).__aenter__()
+
+        if self.metrics:
+            self.metrics.instrument(self._client)
+
+        return self._client
+
+    @property
+    def account_id(self):
+        raise AttributeError('Use `await get_account_id()` with the asyncio API.')
+
+    async def get_account_id(self):
+        from .sts import STS  # pylint: disable=import-outside-top-level
+        return await STS(**self.init_args).get_account_id()
+
+    async def paginate_pages(self, paginator_func, **kwargs) -> typing.AsyncIterator:
+        client = await self.get_client()
+        paginator = client.get_paginator(paginator_func)
+        operation = client.meta.method_to_api_mapping.get(paginator_func, paginator_func)
+        async for page in paginator.paginate(**kwargs):
+            if self.metrics:
+                self.metrics.record_page(self.service, operation)
+
+            yield page
+
+    async def paginate(self, paginator_func, *result_keys, **kwargs) -> typing.AsyncIterator:
+        async for page in self.paginate_pages(paginator_func, **kwargs):
+            results = page
+            for key in result_keys:
+                results = results.get(key, [])
+            for item in results:
+                yield item
+
+    async def wait(self, waiter_func, **kwargs):
+        client = await self.get_client()
+        waiter = client.get_waiter(waiter_func)
+        if not self.metrics:
+            return await waiter.wait(**kwargs)
+
+        sample = Sample(kind='wait', service=self.service, operation=waiter.name)
+        started = time.perf_counter()
+        try:
+            return await waiter.wait(**kwargs)
+        except Exception:
+            sample.error = True
+            raise
+        finally:
+            sample.latency = time.perf_counter() - started
+            self.metrics.record(sample)
@@ -0,0 +1,189 @@
+
+from datetime import datetime
+
+from ..base import Boto3Base
+from ..cloudfront import core, policy
+from .base import AioBoto3Base
+
+
+class Distribution(AioBoto3Base, core.Distribution):
+
+    async def create(self, *, wait=False):
+        kwargs = self.include_tags(**self.config)
+        kwargs.update({'CallerReference': str(datetime.utcnow().timestamp())})
+
+        client = await self.get_client()
+        if self.tags:
+            self._data = (await client.create_distribution_with_tags(
+                DistributionConfigWithTags=kwargs,
+            )).get('Distribution')
+
+        else:
+            self._data = (await client.create_distribution(
+                DistributionConfig=kwargs,
+            )).get('Distribution')
+
+        if wait:
+            await self.wait(
+                'distribution_deployed',
+                Id=self.id,
+            )
+
+    @classmethod
+    async def find_by_domain_name(cls, domain_name, **kwargs):
+        self = cls({}, **kwargs)
+        async for distro in self.paginate('list_distributions', 'DistributionList', 'Items'):
+            if domain_name in distro.get('Aliases', {}).get('Items', []):
+                self._data = distro
+                return self
+
+        return None
+
+
+class Function(AioBoto3Base, core.Function):
+
+    async def create(self):
+        kwargs = {
+            'Name': self.name,
+            'FunctionCode': self.code if isinstance(self.code, bytes) else self.code.encode('utf-8'),
+            'FunctionConfig': {
+                'Comment': self.comment,
+                'Runtime': self.runtime,
+            },
+        }
+
+        client = await self.get_client()
+        resp = await client.create_function(**kwargs)
+        self._data = resp.get('FunctionSummary')
+        self.etag = resp.get('ETag')
+
+        await client.publish_function(
+            Name=self.name,
+            IfMatch=self.etag,
+        )
+
+    async def _load_code(self, client):
+        resp = await client.get_function(Name=self.name)
+        async with resp['FunctionCode'] as body:
+            self.code = await body.read()
+        self.etag = resp['ETag']
+
+    async def load(self):
+        client = await self.get_client()
+        self._data = (await client.describe_function(Name=self.name)).get('FunctionSummary')
+        await self._load_code(client)
+
+    @property
+    def status(self):
+        return self._data['FunctionMetadata']['Stage']
+
+    @property
+    def arn(self):
+        return self._data['FunctionMetadata']['FunctionARN']
+
+    @classmethod
+    async def find_by_name(cls, name, **kwargs):
+        self = cls(name, None, **kwargs)
+        client = await self.get_client()
+        try:
+            await self._load_code(client)
+            return self
+        except client.exceptions.NoSuchFunctionExists:
+            return None
+
+
+class ResponsePolicy(AioBoto3Base, policy.ResponsePolicy):
+
+    _policy_args = (
+        'policy',
+        'cors',
+        'content_type_options',
+        'csp',
+        'frame_options',
+        'referrer_policy',
+        'strict_transport_security',
+    )
+
+    def __init__(self, name, *, aio_session=None, aio_client_pool=None, **kwargs):
+        # ResponsePolicy does not call up to Boto3Base, so the session and client
+        # arguments are split off and applied separately.
+        policy_kwargs = {key: kwargs.pop(key) for key in self._policy_args if key in kwargs}
+        super().__init__(name, aio_session=aio_session, aio_client_pool=aio_client_pool, **policy_kwargs)
+        Boto3Base.__init__(self, **kwargs)  # pylint: disable=non-parent-init-called
+
+    async def paginate(self, paginator_func, *result_keys, **kwargs):
+        client = await self.get_client()
+        operation = client.meta.method_to_api_mapping.get(paginator_func.__name__, paginator_func.__name__)
+        marker = None
+        while True:
+            if marker:
+                kwargs.update({'Marker': marker})
+
+            results = await paginator_func(**kwargs)
+            if self.metrics:
+                self.metrics.record_page(self.service, operation)
+
+            next_marker = None
+            for key in result_keys:
+                next_marker = results.get('NextMarker', next_marker)
+                results = results.get(key, [])
+
+            for item in results:
+                yield item
+
+            if not next_marker or next_marker == marker:
+                break
+
+            marker = next_marker
+
+    @classmethod
+    async def find_by_name(cls, name, **kwargs):
+        self = cls(name, **kwargs)
+        client = await self.get_client()
+        async for item in self.paginate(client.list_response_headers_policies, 'ResponseHeadersPolicyList', 'Items'):
+            check = item['ResponseHeadersPolicy']
+            if check.get('ResponseHeadersPolicyConfig', {}).get('Name') == name:
+                self.type = item['Type']
+
+                self.id = check['Id']
+                self.policy = check['ResponseHeadersPolicyConfig']
+                return self
+
+        return None
+
+    @classmethod
+    async def find_by_id(cls, id_, **kwargs):
+        self = cls(id_, **kwargs)
+        client = await self.get_client()
+        try:
+            item = await client.get_response_headers_policy(
+                Id=id_,
+            )
+
+            check = item['ResponseHeadersPolicy']
+            self.etag = item['ETag']
+            self.id = check['Id']
+            self.policy = check['ResponseHeadersPolicyConfig']
+            return self
+
+        except client.exceptions.NoSuchResponseHeadersPolicy:
+            return None
+
+    async def create(self):
+        self.policy['Name'] = self.name
+        client = await self.get_client()
+        resp = await client.create_response_headers_policy(
+            ResponseHeadersPolicyConfig=self.policy,
+        )
+        self.id = resp['ResponseHeadersPolicy']['Id']
+        self.etag = resp['ETag']
+
+    async def update(self):
+        client = await self.get_client()
+        resp = await client.update_response_headers_policy(
+            Id=self.id,
+            IfMatch=self.etag,
+            ResponseHeadersPolicyConfig=self.policy,
+        )
+        self.id = resp['ResponseHeadersPolicy']['Id']
+        self.etag = resp['ETag']
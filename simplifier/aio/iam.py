@@ -0,0 +1,113 @@
+
+from ..iam import core
+from .base import AioBoto3Base
+
+
+class User(AioBoto3Base, core.User):
+
+    async def create(self, *, wait=False):
+        kwargs = self.include_tags(UserName=self.username)
+        client = await self.get_client()
+        self._data = (await client.create_user(**kwargs)).get('User')
+
+        if wait:
+            await self.wait(
+                'user_exists',
+                UserName=self.username,
+            )
+
+    @classmethod
+    async def find_by_name(cls, username, **kwargs):
+        self = cls(username, **kwargs)
+        client = await self.get_client()
+        try:
+            await self.load()
+            return self
+        except client.exceptions.NoSuchEntityException:
+            return None
+
+    async def attach_policy(self, policy):
+        client = await self.get_client()
+        await client.attach_user_policy(
+            UserName=self.username,
+            PolicyArn=policy.arn,
+        )
+
+    async def create_access_key(self):
+        kwargs = self.init_args
+        kwargs.pop('tags')  # AccessKey does not support tags
+
+        key = AccessKey(self, **kwargs)
+        await key.create()
+        return key
+
+    async def load(self):
+        client = await self.get_client()
+        self._data = await client.get_user(UserName=self.username)
+
+
+class AccessKey(AioBoto3Base, core.AccessKey):
+
+    async def create(self):
+        client = await self.get_client()
+        self._data = (await client.create_access_key(
+            UserName=self.owner.username,
+        )).get('AccessKey')
+
+
+class Policy(AioBoto3Base, core.Policy):
+
+    async def create(self, *, wait=False):
+        kwargs = self.include_tags(
+            PolicyName=self.policy_name,
+            PolicyDocument=self.policy_string,
+        )
+        client = await self.get_client()
+        self._data = (await client.create_policy(**kwargs)).get('Policy')
+
+        if wait:
+            await self.wait(
+                'policy_exists',
+                PolicyArn=self.arn,
+            )
+
+
+class Role(AioBoto3Base, core.Role):
+
+    async def create(self, wait=False):
+        kwargs = self.include_tags(
+            RoleName=self.role_name,
+            AssumePolicyDocument=self.assume_policy.policy_string,
+        )
+        client = await self.get_client()
+        self._data = (await client.create_role(**kwargs)).get('Role')
+
+        if wait:
+            await self.wait(
+                'role_exists',
+                RoleName=self.role_name,
+            )
+
+    async def attach_policy(self, policy):
+        client = await self.get_client()
+        await client.put_role_policy(
+            RoleName=self.role_name,
+            PolicyName=policy.policy_name,
+            PolicyDocument=policy.policy_string,
+        )
+
+
+class InstanceProfile(AioBoto3Base, core.InstanceProfile):
+
+    async def create(self, *, wait=False):
+        kwargs = self.include_tags(
+            InstanceProfileName=self.profile_name,
+        )
+        client = await self.get_client()
+        self._data = (await client.create_instance_profile(**kwargs)).get('InstanceProfile')
+
+        if wait:
+            await self.wait(
+                'instance_profile_exists',
+                InstanceProfileName=self.profile_name,
+            )
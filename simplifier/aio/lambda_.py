@@ -0,0 +1,86 @@
+
+from importlib import import_module
+
+from .base import AioBoto3Base
+
+
+# `lambda` is a reserved word, so the synchronous package cannot be imported by name.
+core = import_module('..lambda.core', __package__)
+MAX_VERSIONS = import_module('..lambda.constants', __package__).MAX_VERSIONS
+
+
+class Function(AioBoto3Base, core.Function):
+
+    async def create(self, config, code, *, publish=False, wait=False):
+        client = await self.get_client()
+        self._data = {
+            'Configuration': await client.create_function(**self.create_kwargs(config, code, publish=publish)),
+        }
+
+        if wait:
+            await self.wait(
+                'function_active_v2',
+                FunctionName=self.name,
+            )
+
+    async def load(self):
+        client = await self.get_client()
+        self._data = await client.get_function(
+            FunctionName=self.name,
+        )
+
+    @classmethod
+    async def find_by_name(cls, name, **kwargs):
+        self = cls(name, **kwargs)
+        client = await self.get_client()
+        try:
+            await self.load()
+            return self
+
+        except client.exceptions.ResourceNotFoundException:
+            pass
+
+        return None
+
+    @property
+    def versions(self):
+        raise AttributeError('Use `await load_versions()` with the asyncio API.')
+
+    async def load_versions(self):
+        return [
+            item async for item in self.paginate('list_versions_by_function', 'Versions', FunctionName=self.name)
+        ]
+
+    @property
+    def aliases(self):
+        raise AttributeError('Use `await load_aliases()` with the asyncio API.')
+
+    async def load_aliases(self):
+        return [
+            item async for item in self.paginate('list_aliases', 'Aliases', FunctionName=self.name)
+        ]
+
+    async def cleanup_versions(self, *, max_versions=None):
+        if max_versions is None:
+            max_versions = MAX_VERSIONS
+
+        versions = await self.load_versions()
+        num_versions = len(versions)
+
+        if num_versions > max_versions:
+            alias_versions = [item['FunctionVersion'] for item in await self.load_aliases()]
+            client = await self.get_client()
+
+            for version in versions:
+                if version['Version'] == self.version or version['Version'] in alias_versions:
+                    continue
+
+                await client.delete_function(FunctionName=version['FunctionArn'])
+                num_versions -= 1
+
+                if num_versions <= max_versions:
+                    break
+
+    async def delete(self):
+        client = await self.get_client()
+        return await client.delete_function(FunctionName=self.arn)
@@ -0,0 +1,129 @@
+
+import asyncio
+from collections import OrderedDict
+import threading
+import typing
+import weakref
+
+from ..pool import DEFAULT_MAX_SIZE, PoolStats, _freeze
+
+
+class AioClientPool:
+    # aiobotocore clients own an aiohttp connector which is bound to the event loop
+    # that created it, so clients are pooled per loop and closed on that loop.
+    # Clients evicted from a bounded pool are closed, releasing their connections.
+    #
+    # Entries only hold their session and loop weakly. A client still refers to
+    # its loop, so the clients of a loop that has been closed are dropped too,
+    # which lets the loop go.
+    max_size: int = None
+
+    def __init__(self, *, max_size: int = None):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._stats = PoolStats()
+
+    @staticmethod
+    def _key(session, service, client_args, loop):
+        client_args = dict(client_args or {})
+        region_name = client_args.pop('region_name', None) or session.get_config_variable('region')
+        return (id(session), service, region_name, _freeze(client_args), id(loop))
+
+    def _purge(self):
+        # A closed loop cannot run the client's close, so its clients are just
+        # let go.
+        for key, (session_ref, loop_ref, _) in list(self._entries.items()):
+            loop = loop_ref()
+            if session_ref() is None or loop is None or loop.is_closed():
+                del self._entries[key]
+
+    async def client(self, session, service, client_args=None):
+        loop = asyncio.get_running_loop()
+        key = self._key(session, service, client_args, loop)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            # An entry of a collected session or loop whose id has been reused is
+            # stale.
+            if entry is not None and entry[0]() is session and entry[1]() is loop:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry[2]
+
+            self._stats.misses += 1
+            self._purge()
+
+        client = await session.create_client(service, **(client_args or {})).__aenter__()
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None and (existing[0]() is not session or existing[1]() is not loop):
+                del self._entries[key]
+                existing = None
+
+            if existing is None:
+                self._entries[key] = (weakref.ref(session), weakref.ref(loop), client)
+                evicted = self._evict()
+
+        if existing is not None:
+            await client.close()
+            return existing[2]
+
+        await self._close_entries(evicted)
+        return client
+
+    def _evict(self):
+        evicted = []
+        if not self.max_size:
+            return evicted
+
+        while len(self._entries) > self.max_size:
+            _, entry = self._entries.popitem(last=False)
+            self._stats.evictions += 1
+            evicted.append(entry)
+
+        return evicted
+
+    @staticmethod
+    async def _close_entries(entries):
+        loop = asyncio.get_running_loop()
+        for _, loop_ref, client in entries:
+            client_loop = loop_ref()
+            if client_loop is loop:
+                await client.close()
+            elif client_loop is not None and not client_loop.is_closed():
+                asyncio.run_coroutine_threadsafe(client.close(), client_loop)
+
+    async def resize(self, max_size: typing.Optional[int]):
+        with self._lock:
+            self.max_size = max_size
+            evicted = self._evict()
+
+        await self._close_entries(evicted)
+
+    async def close(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry[1]() is loop]
+            entries = [self._entries.pop(key) for key in keys]
+
+        await self._close_entries(entries)
+
+    @property
+    def stats(self) -> PoolStats:
+        with self._lock:
+            self._purge()
+            return PoolStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=len(self._entries),
+            )
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = PoolStats()
+
+
+default_pool = AioClientPool(max_size=DEFAULT_MAX_SIZE)
@@ -0,0 +1,92 @@
+
+from dataclasses import (
+    asdict,
+    is_dataclass,
+)
+
+from .. import r53
+from .base import AioBoto3Base
+
+
+class Zone(AioBoto3Base, r53.Zone):
+
+    @classmethod
+    async def find_by_domain(cls, domain_name, **kwargs):
+        self = cls(domain_name, **kwargs)
+        async for domain in self.paginate('list_hosted_zones', 'HostedZones'):
+            if domain['Name'][:-1].lower() == domain_name.lower():
+                self._data = domain
+                return self
+
+        return None
+
+    async def load(self):
+        if self.zone_id:
+            client = await self.get_client()
+            self._data = (await client.get_hosted_zone(Id=self.zone_id)).get('HostedZone')
+        else:
+            obj = await type(self).find_by_domain(self.name, **self.init_args)
+            self._data = obj._data
+
+    @property
+    def zone_id(self):
+        if not self._zone_id:
+            self._zone_id = self._data.get('Id')
+
+        return self._zone_id
+
+    @zone_id.setter
+    def zone_id(self, value):
+        self._zone_id = value
+
+    async def update(self, change_set, *, wait=False):
+        changes = asdict(change_set) if is_dataclass(change_set) else change_set
+
+        client = await self.get_client()
+        resp = await client.change_resource_record_sets(
+            HostedZoneId=self.zone_id,
+            ChangeBatch=changes,
+        )
+
+        if wait:
+            await self.wait(
+                'resource_record_sets_changed',
+                Id=resp['ChangeInfo']['Id'],
+            )
+
+
+class Domain(AioBoto3Base, r53.Domain):
+
+    async def register(self, *, num_years=1, admin_contact=None):
+
+        if not admin_contact:
+            raise ValueError('admin_contact must be set!')
+
+        client = await self.get_client()
+        self._data = await client.register_domain(
+            DomainName=self.name,
+            DurationInYears=num_years,
+            AutoRenew=True,
+            AdminContact=admin_contact,
+            RegistrantContact=admin_contact,
+            TechContact=admin_contact,
+            BillingContact=admin_contact,
+            PrivacyProtectAdminContact=True,
+            PrivacyProtectRegistrantContact=True,
+            PrivacyProtectTechContact=True,
+            PrivacyProtectBillingContact=True,
+        )
+
+    async def load(self):
+        client = await self.get_client()
+        self._data = await client.get_domain_detail(DomainName=self.name)
+
+    @classmethod
+    async def find_by_domain(cls, domain_name, **kwargs):
+        self = cls(domain_name.lower(), **kwargs)
+        async for domain in self.paginate('list_domains', 'Domains'):
+            if domain['DomainName'].lower() == self.name:
+                await self.load()
+                return self
+
+        return None
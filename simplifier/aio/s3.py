@@ -0,0 +1,139 @@
+
+from .. import s3
+from ..s3.json import dumps, loads
+from .base import AioBoto3Base
+
+
+class Bucket(AioBoto3Base, s3.Bucket):
+
+    async def create(self, *, wait=False):
+        client = await self.get_client()
+        self._data = await client.create_bucket(
+            Bucket=self.bucket,
+        )
+
+        if wait:
+            await self.wait(
+                'bucket_exists',
+                Bucket=self.bucket,
+            )
+
+    async def list(self):
+        async for item in self.paginate('list_objects_v2', 'Contents', Bucket=self.bucket):
+            yield Object(self.bucket, item['Key'], **self.init_args)
+
+
+class Object(AioBoto3Base, s3.Object):
+    # Objects are never loaded from the constructor, call `await load()` instead.
+
+    def __init__(self, bucket, key, *, version_id=None, autoload=False, **kwargs):  # pylint: disable=unused-argument
+        super().__init__(bucket, key, version_id=version_id, autoload=False, **kwargs)
+
+    async def get(self):
+        client = await self.get_client()
+        kwargs = {
+            'Bucket': self.bucket,
+            'Key': self.key,
+        }
+        if self.version_id:
+            kwargs.update({
+                'VersionId': self.version_id,
+            })
+
+        return await client.get_object(**kwargs)
+
+    async def load(self):
+        self.obj = await self.get()
+        return self
+
+    @property
+    def obj(self):
+        if not self._obj:
+            raise ValueError('Object has not been loaded. Call `await load()` first.')
+
+        return self._obj
+
+    @obj.setter
+    def obj(self, value):
+        self._obj = value
+
+    @property
+    def metadata(self):
+        return self.obj
+
+    @property
+    def contents(self):
+        raise AttributeError('Use `await read()` with the asyncio API.')
+
+    async def read(self):
+        if not self._obj:
+            await self.load()
+
+        async with self.obj['Body'] as body:
+            return await body.read()
+
+    @classmethod
+    async def create(cls, bucket, key, contents, *, wait=False, **kwargs):
+        self = cls(bucket, key, **kwargs)
+        client = await self.get_client()
+
+        bytes_contents = contents if isinstance(contents, bytes) else contents.encode('utf-8')
+        await client.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=bytes_contents,
+        )
+
+        if wait:
+            await self.wait(
+                'object_exists',
+                Bucket=bucket,
+                Key=key,
+            )
+
+        return self
+
+    async def update(self, contents):
+        return await type(self).create(self.bucket, self.key, contents, **self.init_args)
+
+    @property
+    def versions(self):
+        raise AttributeError('Use `await load_versions()` with the asyncio API.')
+
+    async def load_versions(self):
+        versions = {}
+        async for version in self.paginate('list_object_versions', 'Versions', Bucket=self.bucket, Prefix=self.key):
+            versions.update({version['VersionId']: version['LastModified']})
+
+        if 'null' in versions:
+            return {}
+
+        return versions
+
+    async def version(self, version):
+        if version not in await self.load_versions():
+            return None
+
+        return type(self)(
+            self.bucket,
+            self.key,
+            version_id=version,
+            **self.init_args,
+        )
+
+    @property
+    def flask_response(self):
+        raise AttributeError('Flask responses are not available through the asyncio API.')
+
+
+class JsonObject(Object, s3.JsonObject):
+
+    @classmethod
+    async def create(cls, bucket, key, contents, **kwargs):
+        if not isinstance(contents, (str, bytes,)):
+            contents = dumps(contents)
+
+        return await super().create(bucket, key, contents, **kwargs)
+
+    async def read(self):
+        return loads(await super().read(), fast=self.fast_decode)
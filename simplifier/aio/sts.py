@@ -0,0 +1,38 @@
+
+import hashlib
+
+from .. import sts
+from .base import AioBoto3Base
+
+
+class STS(AioBoto3Base, sts.STS):
+
+    async def _credential_key(self):
+        credentials = await self.aio_session.get_credentials()
+        if credentials is None:
+            return None
+
+        frozen = await credentials.get_frozen_credentials()
+        token = hashlib.sha256(frozen.token.encode('utf-8')).hexdigest() if frozen.token else None
+        return (frozen.access_key, token)
+
+    async def load_identity(self, *, refresh=False):
+        client = await self.get_client()
+        key = await self._credential_key()
+        if key is None or not self._identity_cache:
+            return await client.get_caller_identity()
+
+        identity = None if refresh else self._identity_cache.get(key)
+        if identity is None:
+            identity = await client.get_caller_identity()
+            identity.pop('ResponseMetadata', None)
+            self._identity_cache.set(key, identity)
+
+        return identity
+
+    @property
+    def identity(self):
+        raise AttributeError('Use `await load_identity()` with the asyncio API.')
+
+    async def get_account_id(self):
+        return (await self.load_identity())['Account']
@@ -28,7 +28,7 @@ class Gateway(ApiGatewayBase):
 
     @classmethod
     def find_by_name(cls, name, **kwargs):
-        self = cls(name)
+        self = cls(name, **kwargs)
         for item in self.paginate('get_rest_apis', 'items'):
             if item['name'] == self.name:
                 self._data = item
@@ -41,14 +41,14 @@ class Gateway(ApiGatewayBase):
         return f'https://{self.id}.execute-api.{self.region}.amazonaws.com'
 
     def ensure_api_key(self, name, key):
-        api_key = ApiKey.find_by_name(name)
+        api_key = ApiKey.find_by_name(name, **self.init_args)
         if not api_key:
             api_key = ApiKey(name, value=key, **self.init_args)
             api_key.create()
 
-        usage_plan = UsagePlan.find_by_name(name)
+        usage_plan = UsagePlan.find_by_name(name, **self.init_args)
         if not usage_plan:
-            usage_plan = UsagePlan(name)
+            usage_plan = UsagePlan(name, **self.init_args)
             usage_plan.create(api_gateway=self)
 
         usage_plan.ensure_stage(self)
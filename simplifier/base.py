@@ -1,9 +1,41 @@
 
 from dataclasses import dataclass
+import threading
 import typing
 
-import boto3
-import botocore
+from .batch import (  # pylint: disable=unused-import
+    BatchError,
+    BatchExecutor,
+    BatchReport,
+    BatchResult,
+    default_executor,
+)
+from .metrics import Metrics, default_metrics
+from .paginate import prefetch
+from .pool import ClientPool, _freeze, default_pool, session_lock
+from .waiters import WaiterEngine
+
+# boto3 is imported on first use rather than at import time, as importing it
+# accounts for most of the time it takes to import a wrapper.
+if typing.TYPE_CHECKING:
+    import boto3
+    import botocore
+
+
+_shared_sessions = {}
+_shared_sessions_lock = threading.Lock()
+
+
+def shared_session(**session_args) -> 'boto3.session.Session':
+    # Objects made without a session share one per set of session args, so
+    # that they also share pooled clients rather than each making their own.
+    key = _freeze(session_args)
+    with _shared_sessions_lock:
+        if key not in _shared_sessions:
+            import boto3  # pylint: disable=import-outside-top-level
+            _shared_sessions[key] = boto3.session.Session(**session_args)
+
+        return _shared_sessions[key]
 
 
 @dataclass
@@ -14,12 +46,12 @@ class Boto3Tag:
 
 class Boto3SessionBase:
     _service: str = None
-    _session: boto3.session.Session = None
+    _session: 'boto3.session.Session' = None
     _session_args: typing.Dict[str, any] = None
 
     def __init__(
         self, *,
-        session: boto3.session.Session = None,
+        session: 'boto3.session.Session' = None,
         **session_args,
     ):
 
@@ -48,7 +80,7 @@ class Boto3SessionBase:
     @property
     def session(self):
         if not self._session:
-            self._session = boto3.session.Session(**self.session_args)
+            self._session = shared_session(**self.session_args)
 
         return self._session
 
@@ -116,7 +148,7 @@ class Boto3SessionBase:
 
     @property
     def in_north_america(self):
-        return self.in_canada or self._in_usa
+        return self.in_canada or self.in_usa
 
     @property
     def in_south_america(self):
@@ -124,22 +156,41 @@ class Boto3SessionBase:
 
 
 class Boto3Base(Boto3SessionBase):
-    _client: botocore.client.BaseClient = None
-    _client_args: botocore.client.Config = None
-    _resource: boto3.resources.model.ResourceModel = None
+    _client: 'botocore.client.BaseClient' = None
+    _client_args: 'botocore.client.Config' = None
+    _resource: 'boto3.resources.model.ResourceModel' = None
+    _client_pool: ClientPool = default_pool
+    _metrics: Metrics = default_metrics
+    prefetch_pages: int = None
     _data: typing.Dict[str, any] = None
     tags: typing.List[Boto3Tag] = None
 
     def __init__(
         self, *,
         tags: typing.List[Boto3Tag] = None,
-        client: botocore.client.BaseClient = None,
-        client_args: botocore.client.Config = None,
-        session: boto3.session.Session = None,
+        client: 'botocore.client.BaseClient' = None,
+        client_args: 'botocore.client.Config' = None,
+        client_pool: ClientPool = None,
+        prefetch_pages: int = None,
+        metrics: Metrics = None,
+        session: 'boto3.session.Session' = None,
         **session_args,
     ):
         super().__init__(session=session, **session_args)
 
+        # Passing client_pool=False opts this object out of client pooling.
+        if client_pool is not None:
+            self._client_pool = client_pool
+
+        # Passing metrics=False opts this object out of metrics collection.
+        if metrics is not None:
+            self._metrics = metrics
+
+        # The number of pages paginate() fetches ahead of the consumer on a
+        # background thread. None or 0 fetches pages on demand.
+        if prefetch_pages is not None:
+            self.prefetch_pages = prefetch_pages
+
         self.client = client
         self.client_args = client_args
         self.tags = None
@@ -150,6 +201,9 @@ class Boto3Base(Boto3SessionBase):
         return {
             'session': self.session,
             'client_args': self.client_args,
+            'client_pool': self.client_pool,
+            'prefetch_pages': self.prefetch_pages,
+            'metrics': self.metrics,
             'tags': self.tags,
         }
 
@@ -158,27 +212,52 @@ class Boto3Base(Boto3SessionBase):
         return self._client_args or {}
 
     @client_args.setter
-    def client_args(self, value: typing.Union[botocore.client.Config, None]):
+    def client_args(self, value: typing.Union['botocore.client.Config', None]):
         if value is None:
             self._client_args = {}
         else:
             self._client_args = value
 
+    @property
+    def region_name(self):
+        # A region passed in the client args takes precedence, which lets objects
+        # in several regions share one session.
+        return self.client_args.get('region_name') or self.session.region_name
+
+    @property
+    def client_pool(self):
+        return self._client_pool
+
+    @property
+    def metrics(self):
+        return self._metrics
+
     @property
     def client(self):
         if not self._client:
-            self._client = self.session.client(self.service, **self.client_args)
+            if self.client_pool:
+                self._client = self.client_pool.client(self.session, self.service, self.client_args)
+            else:
+                with session_lock(self.session):
+                    self._client = self.session.client(self.service, **self.client_args)
+
+        if self.metrics:
+            self.metrics.instrument(self._client)
 
         return self._client
 
     @client.setter
-    def client(self, value: botocore.client.BaseClient):
+    def client(self, value: 'botocore.client.BaseClient'):
         self._client = value
 
     @property
     def resource(self):
         if not self._resource:
-            self._resource = self.session.resource(self.service, **self.client_args)
+            if self.client_pool:
+                self._resource = self.client_pool.resource(self.session, self.service, self.client_args)
+            else:
+                with session_lock(self.session):
+                    self._resource = self.session.resource(self.service, **self.client_args)
 
         return self._resource
 
@@ -197,9 +276,21 @@ class Boto3Base(Boto3SessionBase):
     def arn(self):
         return self._data['Arn']
 
-    def paginate(self, paginator_func, *result_keys, **kwargs):
-        paginator = self.client.get_paginator(paginator_func)
-        for page in paginator.paginate(**kwargs):
+    def paginate_pages(self, paginator_func, *, prefetch_pages=None, **kwargs):
+        if prefetch_pages is None:
+            prefetch_pages = self.prefetch_pages
+
+        client = self.client
+        paginator = client.get_paginator(paginator_func)
+        operation = client.meta.method_to_api_mapping.get(paginator_func, paginator_func)
+        for page in prefetch(paginator.paginate(**kwargs), prefetch_pages):
+            if self.metrics:
+                self.metrics.record_page(self.service, operation)
+
+            yield page
+
+    def paginate(self, paginator_func, *result_keys, prefetch_pages=None, **kwargs):
+        for page in self.paginate_pages(paginator_func, prefetch_pages=prefetch_pages, **kwargs):
             results = page
             for key in result_keys:
                 results = results.get(key, [])
@@ -207,5 +298,6 @@ class Boto3Base(Boto3SessionBase):
                 yield item
 
     def wait(self, waiter_func, **kwargs):
-        waiter = self.client.get_waiter(waiter_func)
-        return waiter.wait(**kwargs)
+        engine = WaiterEngine()
+        engine.add(self, waiter_func, **kwargs)
+        return engine.wait()[0]
@@ -0,0 +1,219 @@
+
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import random
+import threading
+import time
+import typing
+
+from .metrics import THROTTLING_ERROR_CODES
+
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Bounds, in seconds, for the delay a service is given once it starts throttling.
+BACKOFF_BASE = 0.1
+BACKOFF_MAX = 20.0
+
+
+def is_throttling_response(response):
+    return (response or {}).get('Error', {}).get('Code') in THROTTLING_ERROR_CODES
+
+
+def is_throttling_error(exc):
+    return is_throttling_response(getattr(exc, 'response', None))
+
+
+@dataclass
+class BatchResult:
+    item: any
+    value: any = None
+    error: BaseException = None
+    attempts: int = 0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+@dataclass
+class BatchReport:
+    results: typing.List[BatchResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> typing.List[BatchResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> typing.List[BatchResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def values(self):
+        return [result.value for result in self.results]
+
+    def raise_for_errors(self):
+        if self.failed:
+            raise BatchError(self)
+
+        return self
+
+
+class BatchError(Exception):
+
+    def __init__(self, report: BatchReport):
+        self.report = report
+        failed = report.failed
+        super().__init__(
+            f'{len(failed)} of {len(report.results)} operations failed, first error: {failed[0].error!r}'
+        )
+
+
+class _ServiceState:
+    # The delay grows each time a service throttles and shrinks again with every
+    # success, so every worker hitting a service slows down together.
+
+    def __init__(self, limit):
+        self.semaphore = threading.BoundedSemaphore(limit) if limit else None
+        self.delay = 0.0
+        self.lock = threading.Lock()
+
+    def throttled(self):
+        with self.lock:
+            self.delay = min(max(self.delay * 2, BACKOFF_BASE), BACKOFF_MAX)
+
+    def succeeded(self):
+        with self.lock:
+            self.delay = self.delay / 2 if self.delay > BACKOFF_BASE else 0.0
+
+
+class BatchExecutor:
+    max_workers: int = None
+    max_attempts: int = None
+    service_limits: typing.Dict[str, int] = None
+
+    def __init__(
+        self, *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        service_limits: typing.Dict[str, int] = None,
+    ):
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.service_limits = service_limits or {}
+        self._lock = threading.Lock()
+        self._pool = None
+        self._services = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='simplifier-batch',
+                )
+
+            return self._pool
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _service(self, service):
+        # A service may also be keyed as (service, region), in which case the limit
+        # and the backoff apply to each region separately.
+        name = service[0] if isinstance(service, tuple) else service
+
+        with self._lock:
+            if service not in self._services:
+                self._services[service] = _ServiceState(self.service_limits.get(name))
+
+            return self._services[service]
+
+    def _execute(self, func, item, service):
+        state = self._service(service)
+        result = BatchResult(item=item)
+
+        while True:
+            result.attempts += 1
+            if state.delay:
+                time.sleep(state.delay * random.uniform(0.5, 1.0))
+
+            if state.semaphore:
+                state.semaphore.acquire()
+
+            try:
+                result.value = func(item)
+                state.succeeded()
+                return result
+
+            except Exception as exc:  # pylint: disable=broad-except
+                if is_throttling_error(exc) and result.attempts < self.max_attempts:
+                    state.throttled()
+                    continue
+
+                result.error = exc
+                return result
+
+            finally:
+                if state.semaphore:
+                    state.semaphore.release()
+
+    def run(self, func, items, *, service=None) -> BatchReport:
+        # Runs func(item) for every item. The service, used for concurrency limits
+        # and backoff, is taken from a bound wrapper method when not given, and can
+        # also be a callable returning the service for each item.
+        if service is None:
+            service = getattr(getattr(func, '__self__', None), 'service', None)
+
+        services = service if callable(service) else lambda item: service
+        futures = [self.submit(func, item, service=services(item)) for item in items]
+        return BatchReport(results=[future.result() for future in futures])
+
+    def submit(self, func, item, *, service=None) -> 'Future[BatchResult]':
+        # Runs func(item) in the background, with the same limits and backoff as
+        # run(). The future's result is a BatchResult, it never raises.
+        return self.pool.submit(self._execute, func, item, service)
+
+    def imap(self, func, items, *, service=None, window: int = None) -> typing.Iterator[BatchResult]:
+        # Like run(), but yields the results in order as they complete, with no
+        # more than window items submitted ahead, so items can come from a lazy
+        # source of any size.
+        window = window or self.max_workers * 2
+        services = service if callable(service) else lambda item: service
+
+        pending = collections.deque()
+        for item in items:
+            pending.append(self.submit(func, item, service=services(item)))
+            while len(pending) > window:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+    def call(self, objects, method, *args, **kwargs) -> BatchReport:
+        # Calls the named method on every wrapper object, e.g. call(functions, 'load').
+        futures = [
+            self.submit(
+                lambda obj: getattr(obj, method)(*args, **kwargs),
+                obj,
+                service=getattr(obj, 'service', None),
+            )
+            for obj in objects
+        ]
+        return BatchReport(results=[future.result() for future in futures])
+
+
+default_executor = BatchExecutor()
@@ -43,7 +43,7 @@ class Distribution(Boto3Base):
 
     @classmethod
     def find_by_domain_name(cls, domain_name, **kwargs):
-        self = cls({})
+        self = cls({}, **kwargs)
         for distro in self.paginate('list_distributions', 'DistributionList', 'Items'):
             if domain_name in distro.get('Aliases', {}).get('Items', []):
                 self._data = distro
@@ -5,6 +5,7 @@ from enum import Enum
 import typing as t
 
 from ..base import Boto3Base
+from ..paginate import prefetch
 
 
 class PolicyType(Enum):
@@ -132,21 +133,40 @@ class Policy(Boto3Base):
     type: PolicyType = None
     policy: t.Dict[str, any] = None
 
-    def paginate(self, paginate_func, *result_keys, **kwargs):
-        marker = kwargs.get('Marker')
-        next_marker = None
-        results = paginate_func(**kwargs)
+    def _pages(self, paginate_func, *result_keys, **kwargs):
+        marker = kwargs.pop('Marker', None)
+        while True:
+            if marker:
+                kwargs.update({'Marker': marker})
 
-        for key in result_keys:
-            next_marker = results.get('NextMarker')
-            results = results.get(key, [])
+            page = paginate_func(**kwargs)
+            yield page
 
-        for item in results:
-            yield item
+            next_marker = page
+            for key in result_keys[:-1]:
+                next_marker = next_marker.get(key, {})
+            next_marker = next_marker.get('NextMarker')
 
-        if next_marker and next_marker != marker:
-            print(f'pagination: {marker} -> {next_marker}')
-            yield self.paginate(paginate_func, *result_keys, Marker=next_marker, **kwargs)
+            if not next_marker or next_marker == marker:
+                break
+
+            marker = next_marker
+
+    def paginate(self, paginate_func, *result_keys, prefetch_pages=None, **kwargs):
+        if prefetch_pages is None:
+            prefetch_pages = self.prefetch_pages
+
+        operation = self.client.meta.method_to_api_mapping.get(paginate_func.__name__, paginate_func.__name__)
+        for page in prefetch(self._pages(paginate_func, *result_keys, **kwargs), prefetch_pages):
+            if self.metrics:
+                self.metrics.record_page(self.service, operation)
+
+            results = page
+            for key in result_keys:
+                results = results.get(key, [])
+
+            for item in results:
+                yield item
 
 
 class OriginPolicy(Policy):
@@ -1,22 +1,69 @@
 
+from collections.abc import Iterable, Sequence
+from functools import cached_property
+
 from .base import Boto3SessionBase
 
 
+class LazyEnum(Sequence):
+    # Reading an enum from a service model means creating a session and loading the
+    # model, so the values are only looked up the first time they are used.
+
+    def __init__(self, resolve):
+        self._resolve = resolve
+
+    @cached_property
+    def values(self):
+        return list(self._resolve() or [])
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, value):
+        return value in self.values
+
+    def __eq__(self, other):
+        # Equal to any other sequence of the same values, but not to a string of
+        # them.
+        if isinstance(other, (str, bytes)) or not isinstance(other, Iterable):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __hash__(self):
+        return hash(tuple(self.values))
+
+    def __repr__(self):
+        if 'values' not in self.__dict__:
+            return f'{type(self).__name__}(<unresolved>)'
+
+        return f'{type(self).__name__}({self.values!r})'
+
+
 class Boto3Enum(Boto3SessionBase):
     _instances = {}
 
     def __new__(cls, service, *args, **kwargs):
-        if service not in cls._instance:
-            cls._instances[service] = super().__new__(cls, *args, **kwargs)
+        if service not in cls._instances:
+            cls._instances[service] = super().__new__(cls)
             cls._instances[service]._service = service
 
         return cls._instances[service]
 
+    def __init__(self, service, **kwargs):  # pylint: disable=unused-argument
+        super().__init__(**kwargs)
+
+    @property
     def service_model(self):
-        return self.session.get_service_model(self.service)
+        return self.session._session.get_service_model(self.service)  # pylint: disable=protected-access
 
     def operation_model(self, name):
         return self.service_model.operation_model(name)
 
     def operation_enum(self, operation_model, member):
-        return self.operation_model(operation_model).input_shape.members(member).enum
+        return LazyEnum(
+            lambda: self.operation_model(operation_model).input_shape.members[member].enum
+        )
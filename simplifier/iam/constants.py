@@ -1,16 +1,15 @@
 
-from awacs.aws import (
-    Action,
-    Allow,
-    PolicyDocument,
-    Principal,
-    Statement,
-)
-from awacs.sts import AssumeRole
-
-
 def generic_assume_policy():
-    from .core import Policy  # pylint: disable=import-outside-top-level
+    # pylint: disable=import-outside-top-level
+    from awacs.aws import (
+        Allow,
+        PolicyDocument,
+        Principal,
+        Statement,
+    )
+    from awacs.sts import AssumeRole
+
+    from .core import Policy
 
     return Policy(
         policy_name='assume-policy',
@@ -20,7 +19,7 @@ def generic_assume_policy():
                 Statement(
                     Effect=Allow,
                     Action=[AssumeRole],
-                    Principal=Principle(
+                    Principal=Principal(
                         'Service',
                         [
                             'apigateway.amazonaws.com',
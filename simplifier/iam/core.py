@@ -1,8 +1,6 @@
 
 import json
 
-from awacs.aws import PolicyDocument
-
 from ..base import Boto3Base
 from .constants import generic_assume_policy
 
@@ -141,7 +139,9 @@ class Policy(IAMBase):
 
     @property
     def policy_string(self):
-        if isinstance(self.policy, PolicyDocument):
+        # awacs documents are recognised by their to_json() rather than by type, so
+        # that awacs is not imported along with this module.
+        if hasattr(self.policy, 'to_json'):
             return self.policy.to_json()
 
         if isinstance(self.policy, str):
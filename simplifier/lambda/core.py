@@ -1,6 +1,7 @@
 
 from dataclasses import dataclass
 from functools import cached_property
+import typing
 
 from ..base import (
     Boto3Base,
@@ -18,8 +19,36 @@ from .enums import Runtime
 
 class Function(Boto3Base):
     _service = 'lambda'
-
-    def create(self):
+    name = None
+
+    def __init__(self, name, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+
+    def create_kwargs(self, config: 'FunctionConfig', code: typing.Dict[str, any], *, publish=False):
+        # code is create_function's Code, e.g. {'ZipFile': ...} or
+        # {'S3Bucket': ..., 'S3Key': ...}. Lambda takes tags as a mapping.
+        kwargs = {
+            'FunctionName': self.name,
+            'Code': code,
+            'Publish': publish,
+            **config.as_kwargs(),
+        }
+        if self.tags:
+            kwargs.update({'Tags': {tag.Key: tag.Value for tag in self.tags}})
+
+        return kwargs
+
+    def create(self, config: 'FunctionConfig', code: typing.Dict[str, any], *, publish=False, wait=False):
+        self._data = {
+            'Configuration': self.client.create_function(**self.create_kwargs(config, code, publish=publish)),
+        }
+
+        if wait:
+            self.wait(
+                'function_active_v2',
+                FunctionName=self.name,
+            )
 
     def load(self):
         self._data = self.client.get_function(
@@ -36,6 +65,7 @@ class Function(Boto3Base):
 
     @property
     def Runtimes(self):
+        return Runtime
 
     @classmethod
     def find_by_name(cls, name, **kwargs):
@@ -44,7 +74,7 @@ class Function(Boto3Base):
             self.load()
             return self
 
-        except self.client.ResourceNotFoundException:
+        except self.client.exceptions.ResourceNotFoundException:
             pass
 
         return None
@@ -65,14 +95,14 @@ class Function(Boto3Base):
     def version(self):
         return self.configuration['Version']
 
-    def cleanup_versions(self, *, max_versions=None):
+    def cleanup_versions(self, *, max_versions=None, executor=None):
         if max_versions is None:
             max_versions = MAX_VERSIONS
 
         num_versions = len(self.versions)
-        removed_versions = 0
+        removable = []
 
-        if total_versions > max_versions:
+        if num_versions > max_versions:
             alias_versions = [item['FunctionVersion'] for item in self.aliases]
 
             for version in self.versions:
@@ -81,12 +111,24 @@ class Function(Boto3Base):
 
                 # boto3 takes either name or arn as the value and each version has
                 # a unique arn, so we use that here.
-                self.client.delete_function(FunctionName=version['FunctionArn'])
-                numVersions -= 1
+                removable.append(version['FunctionArn'])
+                num_versions -= 1
 
                 if num_versions <= max_versions:
                     break
 
+        if executor is None:
+            for arn in removable:
+                self.client.delete_function(FunctionName=arn)
+
+            return None
+
+        return executor.run(
+            lambda arn: self.client.delete_function(FunctionName=arn),
+            removable,
+            service=self.service,
+        ).raise_for_errors()
+
     def delete(self):
         return self.client.delete_function(FunctionName=self.arn)
 
@@ -98,4 +140,15 @@ class FunctionConfig:
     Handler: str
     Timeout: int
     MemorySize: int
+    # The function's environment variables.
     Environment: typing.Dict[str, any]
+
+    def as_kwargs(self):
+        return {
+            'Runtime': getattr(self.Runtime, 'value', self.Runtime),
+            'Role': self.Role,
+            'Handler': self.Handler,
+            'Timeout': self.Timeout,
+            'MemorySize': self.MemorySize,
+            'Environment': {'Variables': self.Environment},
+        }
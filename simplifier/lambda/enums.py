@@ -1,5 +1,5 @@
 
-from ..base import Boto3Enum
+from ..enums import Boto3Enum
 
 
 enums = Boto3Enum('lambda')
@@ -0,0 +1,259 @@
+
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+import threading
+import time
+import typing
+import weakref
+
+
+# Upper bounds, in seconds, of the latency histogram buckets. Anything slower
+# ends up in the final, unbounded bucket.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+THROTTLING_ERROR_CODES = (
+    'BandwidthLimitExceeded',
+    'EC2ThrottledException',
+    'LimitExceededException',
+    'PriorRequestNotComplete',
+    'ProvisionedThroughputExceededException',
+    'RequestLimitExceeded',
+    'RequestThrottled',
+    'RequestThrottledException',
+    'SlowDown',
+    'Throttling',
+    'ThrottlingException',
+    'TooManyRequestsException',
+)
+
+_SAMPLE_KEY = 'simplifier_metrics_sample'
+_STARTED_KEY = 'simplifier_metrics_started'
+
+
+@dataclass
+class LatencyHistogram:
+    count: int = 0
+    total: float = 0.0
+    min: float = None
+    max: float = None
+    buckets: typing.List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def add(self, latency):
+        self.count += 1
+        self.total += latency
+        self.min = latency if self.min is None else min(self.min, latency)
+        self.max = latency if self.max is None else max(self.max, latency)
+        self.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+            'buckets': dict(zip([*LATENCY_BUCKETS, float('inf')], self.buckets)),
+        }
+
+
+@dataclass
+class OperationStats:
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    throttles: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    pages: int = 0
+    waits: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def as_dict(self):
+        values = asdict(self)
+        values.update({'latency': self.latency.as_dict()})
+        return values
+
+
+@dataclass
+class Sample:
+    kind: str
+    service: str
+    operation: str
+    latency: float = None
+    error: bool = False
+    retries: int = 0
+    throttles: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+def _body_size(body):
+    if body is None:
+        return 0
+
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return len(body)
+
+    try:
+        position = body.tell()
+        size = body.seek(0, 2) - position
+        body.seek(position)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+class Metrics:
+    # Calls are observed through botocore's event hooks, so anything made with an
+    # instrumented client is counted, including the calls made by paginators and
+    # waiters. Metrics start out disabled, in which case clients are not
+    # instrumented at all.
+    enabled: bool = False
+
+    def __init__(self, *, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._callbacks = []
+        self._instrumented = weakref.WeakSet()
+
+        # Several Metrics may instrument the same pooled client, so each keeps its
+        # own entries in the per-call context.
+        self._sample_key = (_SAMPLE_KEY, id(self))
+        self._started_key = (_STARTED_KEY, id(self))
+
+    def __bool__(self):
+        return self.enabled
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def subscribe(self, callback: typing.Callable[[Sample], None]):
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: typing.Callable[[Sample], None]):
+        with self._lock:
+            self._callbacks.remove(callback)
+
+    def instrument(self, client):
+        with self._lock:
+            if client in self._instrumented:
+                return client
+
+            self._instrumented.add(client)
+
+        events = client.meta.events
+        service_event_name = client.meta.service_model.service_id.hyphenize()
+
+        # Registered ahead of botocore's own handlers, as the retry handler stops
+        # the needs-retry event from propagating once it decides to retry.
+        events.register_first(f'before-call.{service_event_name}', self._before_call)
+        events.register_first(f'request-created.{service_event_name}', self._request_created)
+        events.register_first(f'needs-retry.{service_event_name}', self._needs_retry)
+        events.register_first(f'after-call.{service_event_name}', self._after_call)
+        events.register_first(f'after-call-error.{service_event_name}', self._after_call_error)
+
+        return client
+
+    def _before_call(self, model=None, context=None, **kwargs):  # pylint: disable=unused-argument
+        if self.enabled and context is not None:
+            context[self._started_key] = time.perf_counter()
+            context[self._sample_key] = Sample(
+                kind='call',
+                service=model.service_model.service_name,
+                operation=model.name,
+            )
+
+    def _request_created(self, request=None, **kwargs):  # pylint: disable=unused-argument
+        sample = (getattr(request, 'context', None) or {}).get(self._sample_key)
+        if sample is not None:
+            sample.bytes_sent += _body_size(request.body)
+
+    def _needs_retry(self, response=None, request_dict=None, **kwargs):  # pylint: disable=unused-argument
+        sample = ((request_dict or {}).get('context') or {}).get(self._sample_key)
+        if sample is not None and response is not None:
+            code = response[1].get('Error', {}).get('Code')
+            if code in THROTTLING_ERROR_CODES:
+                sample.throttles += 1
+
+    def _finish(self, context):
+        sample = (context or {}).pop(self._sample_key, None)
+        if sample is not None:
+            sample.latency = time.perf_counter() - context.pop(self._started_key)
+
+        return sample
+
+    def _after_call(self, http_response=None, parsed=None, model=None, context=None, **kwargs):  # pylint: disable=unused-argument
+        sample = self._finish(context)
+        if sample is None:
+            return
+
+        sample.retries = (parsed or {}).get('ResponseMetadata', {}).get('RetryAttempts', 0)
+        sample.error = http_response is not None and http_response.status_code >= 300
+        # The content-length of a response to a HEAD, or with a 204 or 304, is
+        # that of a body which is not sent.
+        method = getattr(model, 'http', {}).get('method')
+        if http_response is not None and method != 'HEAD' and http_response.status_code not in (204, 304):
+            sample.bytes_received = int(http_response.headers.get('content-length') or 0)
+
+        self.record(sample)
+
+    def _after_call_error(self, context=None, **kwargs):  # pylint: disable=unused-argument
+        sample = self._finish(context)
+        if sample is None:
+            return
+
+        sample.error = True
+        self.record(sample)
+
+    def record(self, sample: Sample):
+        if not self.enabled:
+            return
+
+        with self._lock:
+            stats = self._stats.setdefault((sample.service, sample.operation), OperationStats())
+            if sample.kind == 'call':
+                stats.calls += 1
+                stats.errors += int(sample.error)
+                stats.retries += sample.retries
+                stats.throttles += sample.throttles
+                stats.bytes_sent += sample.bytes_sent
+                stats.bytes_received += sample.bytes_received
+            elif sample.kind == 'page':
+                stats.pages += 1
+            elif sample.kind == 'wait':
+                stats.waits += 1
+                stats.errors += int(sample.error)
+
+            if sample.latency is not None:
+                stats.latency.add(sample.latency)
+
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            callback(sample)
+
+    def record_page(self, service, operation):
+        if self.enabled:
+            self.record(Sample(kind='page', service=service, operation=operation))
+
+    def snapshot(self) -> typing.Dict[str, typing.Dict[str, typing.Dict[str, any]]]:
+        with self._lock:
+            snapshot = {}
+            for (service, operation), stats in self._stats.items():
+                snapshot.setdefault(service, {}).update({operation: stats.as_dict()})
+
+            return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+
+default_metrics = Metrics()
@@ -0,0 +1,128 @@
+
+from dataclasses import dataclass
+import queue
+import threading
+import typing
+
+
+# How long the producer waits on a full buffer before checking whether the
+# consumer has gone away.
+PUT_TIMEOUT = 0.1
+
+_DONE = object()
+
+
+@dataclass
+class _Raised:
+    exc: BaseException
+
+
+def prefetch(pages: typing.Iterable, depth: typing.Optional[int]) -> typing.Iterator:
+    # Pages are pulled from `pages` on a background thread, which runs at most
+    # `depth` pages ahead of the consumer so that memory stays bounded.
+    if not depth:
+        yield from pages
+        return
+
+    buffer = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def produce():
+        try:
+            for page in pages:
+                if not put(page):
+                    return
+
+            put(_DONE)
+
+        except BaseException as exc:  # pylint: disable=broad-except
+            put(_Raised(exc))
+
+    thread = threading.Thread(target=produce, name='simplifier-prefetch', daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+
+            if isinstance(item, _Raised):
+                raise item.exc
+
+            yield item
+
+    finally:
+        # Unblocks the producer when the consumer stops early, e.g. find_by_* returning
+        # on the first match.
+        stopped.set()
+
+
+def interleave(iterables: typing.Iterable[typing.Iterable], *, workers: int, depth: int) -> typing.Iterator:
+    # Drains several iterables on up to `workers` background threads at once and
+    # yields their items as they arrive, so items of different iterables come in
+    # no particular order. At most `depth` items are buffered.
+    buffer = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+    lock = threading.Lock()
+    iterables = iter(iterables)
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def produce():
+        try:
+            while not stopped.is_set():
+                with lock:
+                    iterable = next(iterables, _DONE)
+                if iterable is _DONE:
+                    break
+
+                for item in iterable:
+                    if not put(item):
+                        return
+
+            put(_DONE)
+
+        except BaseException as exc:  # pylint: disable=broad-except
+            put(_Raised(exc))
+
+    threads = [
+        threading.Thread(target=produce, name='simplifier-interleave', daemon=True)
+        for _ in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        running = len(threads)
+        while running:
+            item = buffer.get()
+            if item is _DONE:
+                running -= 1
+                continue
+
+            if isinstance(item, _Raised):
+                raise item.exc
+
+            yield item
+
+    finally:
+        stopped.set()
@@ -0,0 +1,172 @@
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import typing
+import weakref
+
+if typing.TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+
+# The default pool holds at most this many clients and, per thread, resources.
+DEFAULT_MAX_SIZE = 64
+
+_session_locks = weakref.WeakKeyDictionary()
+_session_locks_lock = threading.Lock()
+
+
+def session_lock(session) -> threading.Lock:
+    # boto3 sessions are not thread-safe, so clients are made from a session
+    # one at a time.
+    with _session_locks_lock:
+        lock = _session_locks.get(session)
+        if lock is None:
+            lock = _session_locks[session] = threading.Lock()
+
+        return lock
+
+
+@dataclass
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+def _freeze(value):
+    from botocore.config import Config  # pylint: disable=import-outside-top-level
+
+    if isinstance(value, Config):
+        # pylint: disable=protected-access
+        return ('Config', _freeze(value._user_provided_options))
+
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+
+    return value
+
+
+class ClientPool:
+    # botocore clients are thread-safe and can be shared freely, boto3 resources
+    # are not, so resources are kept per thread and go away with their thread.
+    #
+    # Entries are keyed by session and only hold it weakly, so that the entries
+    # of a session are dropped once it is garbage collected.
+    max_size: int = None
+
+    def __init__(self, *, max_size: int = None):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._local = threading.local()
+        self._sessions = {}
+        self._collected = []
+        self._stats = PoolStats()
+
+    @property
+    def _resources(self):
+        resources = getattr(self._local, 'resources', None)
+        if resources is None:
+            resources = self._local.resources = OrderedDict()
+
+        return resources
+
+    def _key(self, kind, session, service, client_args):
+        client_args = dict(client_args or {})
+        region_name = client_args.pop('region_name', None) or session.region_name
+        return (kind, id(session), service, region_name, _freeze(client_args))
+
+    def _watch(self, session):
+        # The callback may run from the garbage collector at any point, even
+        # with the lock held, so it only records the session's id.
+        if id(session) not in self._sessions:
+            self._sessions[id(session)] = weakref.ref(session, lambda _, key=id(session): self._collected.append(key))
+
+    def _purge(self):
+        while self._collected:
+            session_id = self._collected.pop()
+            self._sessions.pop(session_id, None)
+            for key in [key for key in self._entries if key[1] == session_id]:
+                del self._entries[key]
+
+    def _get(self, kind, session, service, client_args):
+        key = self._key(kind, session, service, client_args)
+        entries = self._entries if kind == 'client' else self._resources
+
+        with self._lock:
+            self._purge()
+            entry = entries.get(key)
+            # A resource of a collected session whose id has been reused is stale.
+            if entry is not None and entry[0]() is session:
+                entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry[1]
+
+            self._stats.misses += 1
+
+        # Client construction loads the service model, so it is done outside of
+        # the pool's lock. Should two threads race for the same key, the first
+        # one wins.
+        with session_lock(session):
+            factory = session.client if kind == 'client' else session.resource
+            value = factory(service, **(client_args or {}))
+
+        with self._lock:
+            self._purge()
+            entry = entries.get(key)
+            if entry is not None and entry[0]() is session:
+                return entry[1]
+
+            self._watch(session)
+            entries[key] = (weakref.ref(session), value)
+            self._evict(entries)
+
+        return value
+
+    def _evict(self, entries):
+        if not self.max_size:
+            return
+
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def client(self, session, service, client_args=None) -> 'BaseClient':
+        return self._get('client', session, service, client_args)
+
+    def resource(self, session, service, client_args=None):
+        return self._get('resource', session, service, client_args)
+
+    def resize(self, max_size: typing.Optional[int]):
+        with self._lock:
+            self.max_size = max_size
+            self._evict(self._entries)
+            self._evict(self._resources)
+
+    def clear(self):
+        # Resources of other threads are dropped as those threads end.
+        with self._lock:
+            self._entries.clear()
+            self._resources.clear()
+
+    @property
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=len(self._entries) + len(self._resources),
+            )
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = PoolStats()
+
+
+default_pool = ClientPool(max_size=DEFAULT_MAX_SIZE)
@@ -0,0 +1,120 @@
+
+from dataclasses import dataclass
+import inspect
+import typing
+
+from .batch import BatchExecutor, BatchReport
+
+
+# Region name prefixes for each group, matching the in_* properties of
+# Boto3SessionBase.
+REGION_GROUPS = {
+    'africa': ('af-',),
+    'asia': ('ap-',),
+    'canada': ('ca-',),
+    'china': ('cn-',),
+    'europe': ('eu-',),
+    'israel': ('il-',),
+    'middle_east': ('me-',),
+    'north_america': ('ca-', 'us-'),
+    'south_america': ('sa-',),
+    'usa': ('us-',),
+}
+
+
+# Regions get their own executor, with a worker for every region, so that
+# operations which run their own batches on the default executor can wait on
+# them without holding that executor's workers.
+default_region_executor = BatchExecutor(max_workers=64)
+
+
+@dataclass
+class RegionReport(BatchReport):
+
+    @property
+    def by_region(self) -> typing.Dict[str, any]:
+        return {result.item: result.value for result in self.succeeded}
+
+    @property
+    def errors(self) -> typing.Dict[str, BaseException]:
+        return {result.item: result.error for result in self.failed}
+
+    def merged(self) -> typing.List[any]:
+        # Flattens list results and drops empty ones, e.g. a find_by_* that found
+        # nothing in a region.
+        merged = []
+        for result in self.succeeded:
+            if isinstance(result.value, list):
+                merged.extend(result.value)
+            elif result.value is not None:
+                merged.append(result.value)
+
+        return merged
+
+
+def _operation_service(operation):
+    owner = getattr(operation, '__self__', None)
+    return getattr(owner, '_service', None) if inspect.isclass(owner) else getattr(owner, 'service', None)
+
+
+def resolve_regions(regions, *, service=None, session=None) -> typing.List[str]:
+    # Accepts region names, group names from REGION_GROUPS, or 'all'. Groups are
+    # expanded against the regions the service is available in.
+    if isinstance(regions, str):
+        regions = [regions]
+
+    available = None
+    resolved = []
+    for region in regions:
+        if region != 'all' and region not in REGION_GROUPS:
+            resolved.append(region)
+            continue
+
+        if available is None:
+            if service is None:
+                raise ValueError('A service is needed to expand region groups')
+
+            if session is None:
+                from .base import shared_session  # pylint: disable=import-outside-top-level
+                session = shared_session()
+
+            available = session.get_available_regions(service)
+
+        prefixes = tuple(prefix for group in REGION_GROUPS.values() for prefix in group) \
+            if region == 'all' else REGION_GROUPS[region]
+        resolved.extend(name for name in available if name.startswith(prefixes))
+
+    return list(dict.fromkeys(resolved))
+
+
+def fan_out(
+    operation: typing.Callable, *args,
+    regions: typing.Union[str, typing.Iterable[str]] = 'all',
+    service: str = None,
+    session=None,
+    client_args: typing.Dict[str, any] = None,
+    executor: BatchExecutor = None,
+    **kwargs,
+) -> RegionReport:
+    # Calls operation(*args, **kwargs) once per region, concurrently, e.g.
+    #   fan_out(Certificate.find_by_domain, 'example.com', regions=['europe', 'us-east-1'])
+    # The region is passed down through client_args, so every region shares the
+    # same session and credentials. Generators, such as listings, are consumed
+    # into lists.
+    service = service or _operation_service(operation)
+    regions = resolve_regions(regions, service=service, session=session)
+    executor = executor or default_region_executor
+
+    def call(region):
+        region_kwargs = dict(kwargs, client_args={**(client_args or {}), 'region_name': region})
+        if session is not None:
+            region_kwargs.update({'session': session})
+
+        result = operation(*args, **region_kwargs)
+        if inspect.isgenerator(result):
+            result = list(result)
+
+        return result
+
+    report = executor.run(call, regions, service=lambda region: (service, region))
+    return RegionReport(results=report.results)
@@ -1,3 +1,5 @@
 
+from .cache import DiskCache, ObjectCache
 from .core import Bucket, Object
 from .json import JsonObject
+from .listing import ListingBatch, ObjectSummary
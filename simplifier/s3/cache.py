@@ -0,0 +1,288 @@
+
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+import datetime
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import typing
+
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+DEFAULT_DISK_MAX_SIZE = 1024 * 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Conditional GETs sent to check a cached body was still current.
+    revalidations: int = 0
+    bytes_saved: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size: int = 0
+
+
+@dataclass
+class CacheEntry:
+    etag: str
+    body: bytes = field(repr=False)
+    # The get_object response, without its body.
+    metadata: typing.Dict[str, any] = field(default_factory=dict, repr=False)
+    # When S3 last confirmed the body was current, as a time.time().
+    validated: float = 0.0
+
+    @property
+    def size(self):
+        return len(self.body)
+
+
+class ObjectCache:
+    # A read-through cache of object bodies, kept in memory and evicted least
+    # recently used first once they add up to more than max_size bytes.
+    #
+    # A cached body is revalidated with a conditional GET on its ETag, which S3
+    # answers with a 304 and no body while it is current. Within
+    # revalidate_after seconds of the last check, the body is served without
+    # asking S3 at all. Objects larger than max_entry_size are never cached.
+    max_size: int = None
+    max_entry_size: int = None
+    revalidate_after: float = None
+
+    def __init__(
+        self, *,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_entry_size: int = None,
+        revalidate_after: float = 0,
+    ):
+        self.max_size = max_size
+        self.max_entry_size = max_entry_size if max_entry_size is not None else max_size
+        self.revalidate_after = revalidate_after
+        self._lock = threading.Lock()
+        # Cache key -> size of the entry, least recently used first.
+        self._index = OrderedDict()
+        self._entries = {}
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return replace(self._stats, entries=len(self._index), size=sum(self._index.values()))
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = CacheStats()
+
+    # Storage, overridden by DiskCache.
+
+    def _read(self, key) -> typing.Optional[CacheEntry]:
+        return self._entries.get(key)
+
+    def _write(self, key, entry: CacheEntry):
+        self._entries[key] = entry
+
+    def _delete(self, key):
+        self._entries.pop(key, None)
+
+    def _revalidated(self, key, entry: CacheEntry):
+        # The entry is the stored one, already updated.
+        pass
+
+    # LRU bookkeeping.
+
+    def get(self, key) -> typing.Optional[CacheEntry]:
+        with self._lock:
+            if key not in self._index:
+                return None
+
+            self._index.move_to_end(key)
+
+        # A DiskCache reads files here, so this is done outside of the lock. The
+        # entry may be evicted meanwhile, in which case nothing is found.
+        entry = self._read(key)
+        if entry is None:
+            self.discard(key)
+
+        return entry
+
+    def put(self, key, entry: CacheEntry):
+        if entry.size > self.max_entry_size:
+            return
+
+        with self._lock:
+            self._write(key, entry)
+            self._index[key] = entry.size
+            self._index.move_to_end(key)
+
+            size = sum(self._index.values())
+            while size > self.max_size and len(self._index) > 1:
+                evicted, evicted_size = self._index.popitem(last=False)
+                self._delete(evicted)
+                self._stats.evictions += 1
+                size -= evicted_size
+
+    def discard(self, key):
+        with self._lock:
+            if self._index.pop(key, None) is not None:
+                self._delete(key)
+
+    def clear(self):
+        with self._lock:
+            for key in self._index:
+                self._delete(key)
+            self._index.clear()
+
+    @staticmethod
+    def key(bucket, key, version_id=None):
+        return (bucket, key, version_id)
+
+    def _hit(self, entry):
+        from botocore.response import StreamingBody  # pylint: disable=import-outside-top-level
+
+        with self._lock:
+            self._stats.hits += 1
+            self._stats.bytes_saved += entry.size
+
+        return dict(entry.metadata, Body=StreamingBody(io.BytesIO(entry.body), entry.size))
+
+    def fetch(self, client, **kwargs) -> typing.Dict[str, any]:
+        # Returns a get_object response for Bucket, Key and VersionId, with the
+        # body served from the cache when S3 confirms it is current.
+        # pylint: disable=import-outside-top-level
+        from botocore.exceptions import ClientError
+        from botocore.response import StreamingBody
+
+        key = self.key(kwargs['Bucket'], kwargs['Key'], kwargs.get('VersionId'))
+        entry = self.get(key)
+
+        # A version never changes, so it is not revalidated.
+        if entry is not None and (key[2] or time.time() - entry.validated < self.revalidate_after):
+            return self._hit(entry)
+
+        if entry is not None:
+            with self._lock:
+                self._stats.revalidations += 1
+
+            try:
+                response = client.get_object(IfNoneMatch=entry.etag, **kwargs)
+            except ClientError as exc:
+                if exc.response.get('ResponseMetadata', {}).get('HTTPStatusCode') != 304:
+                    raise
+
+                entry.validated = time.time()
+                with self._lock:
+                    self._revalidated(key, entry)
+                return self._hit(entry)
+        else:
+            response = client.get_object(**kwargs)
+
+        with self._lock:
+            self._stats.misses += 1
+
+        size = response.get('ContentLength')
+        if size is None or size > self.max_entry_size:
+            self.discard(key)
+            return response
+
+        body = response['Body'].read()
+        metadata = {name: value for name, value in response.items() if name not in ('Body', 'ResponseMetadata')}
+        self.put(key, CacheEntry(etag=response.get('ETag'), body=body, metadata=metadata, validated=time.time()))
+
+        return dict(response, Body=StreamingBody(io.BytesIO(body), len(body)))
+
+
+def _encode(value):
+    if isinstance(value, datetime.datetime):
+        return {'__datetime__': value.isoformat()}
+
+    raise TypeError(f'Cannot store {type(value).__name__} in the cache')
+
+
+def _decode(value):
+    if '__datetime__' in value:
+        return datetime.datetime.fromisoformat(value['__datetime__'])
+
+    return value
+
+
+class DiskCache(ObjectCache):
+    # An ObjectCache that keeps bodies in a directory, so that they survive
+    # restarts and can be shared by processes on the same host. Each entry is a
+    # `.body` file with a `.json` file holding its ETag and metadata.
+    directory: str = None
+
+    def __init__(self, directory, *, max_size: int = DEFAULT_DISK_MAX_SIZE, **kwargs):
+        super().__init__(max_size=max_size, **kwargs)
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key, suffix):
+        name = hashlib.sha256(json.dumps(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f'{name}{suffix}')
+
+    def _load_index(self):
+        # Entries left by an earlier run are ordered by when they were last used.
+        found = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, 'r', encoding='utf-8') as filehandle:
+                    key = tuple(json.load(filehandle)['key'])
+                found.append((os.stat(path).st_mtime, key, os.stat(self._path(key, '.body')).st_size))
+            except (OSError, ValueError, KeyError):
+                continue
+
+        for _, key, size in sorted(found):
+            self._index[key] = size
+
+    def _read(self, key):
+        try:
+            with open(self._path(key, '.json'), 'r', encoding='utf-8') as filehandle:
+                stored = json.load(filehandle, object_hook=_decode)
+            with open(self._path(key, '.body'), 'rb') as filehandle:
+                body = filehandle.read()
+        except (OSError, ValueError):
+            return None
+
+        # Marks the entry as recently used for the next run, unless it has just
+        # been evicted.
+        try:
+            os.utime(self._path(key, '.json'))
+        except OSError:
+            pass
+
+        return CacheEntry(etag=stored['etag'], body=body, metadata=stored['metadata'], validated=stored['validated'])
+
+    def _replace(self, path, contents):
+        temporary = f'{path}.{threading.get_ident()}.tmp'
+        with open(temporary, 'wb') as filehandle:
+            filehandle.write(contents)
+        os.replace(temporary, path)
+
+    def _write(self, key, entry):
+        # The body is written first, so that metadata is never found without it.
+        self._replace(self._path(key, '.body'), entry.body)
+        self._revalidated(key, entry)
+
+    def _revalidated(self, key, entry):
+        self._replace(self._path(key, '.json'), json.dumps({
+            'key': key,
+            'etag': entry.etag,
+            'metadata': entry.metadata,
+            'validated': entry.validated,
+        }, default=_encode).encode('utf-8'))
+
+    def _delete(self, key):
+        for suffix in ('.json', '.body'):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
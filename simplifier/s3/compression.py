@@ -0,0 +1,164 @@
+
+from contextlib import contextmanager
+from importlib.util import find_spec
+import io
+import typing
+import zlib
+
+from .transfer import READ_SIZE, BodyReader, ViewReader, open_source
+
+
+# zstd is only available with the zstandard package installed.
+HAS_ZSTANDARD = find_spec('zstandard') is not None
+
+GZIP = 'gzip'
+ZSTD = 'zstd'
+ENCODINGS = (GZIP, ZSTD)
+
+# The size before compression is kept in this user metadata key.
+UNCOMPRESSED_SIZE_METADATA = 'uncompressed-size'
+
+
+def _compressor(encoding, level):
+    if encoding == GZIP:
+        # wbits of 16 + 15 writes a gzip header and trailer. The default level, 6,
+        # is far cheaper than 9 for little less compression.
+        level = zlib.Z_DEFAULT_COMPRESSION if level is None else level
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    if encoding == ZSTD:
+        if not HAS_ZSTANDARD:
+            raise ValueError('zstd compression needs the zstandard package')
+
+        import zstandard  # pylint: disable=import-outside-top-level
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+
+    raise ValueError(f'Unsupported encoding {encoding!r}, use one of {", ".join(ENCODINGS)}')
+
+
+class GzipReader:
+    # Decompresses a gzip stream no more than the size asked for at a time, so
+    # a small body that inflates to gigabytes is never held whole. Input that
+    # zlib held back is fed again before more is read, and each member of a
+    # multi-member gzip, as concatenated files are, is decompressed in turn.
+
+    def __init__(self, source):
+        self._source = source
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._pending = b''
+
+    def read(self, size) -> bytes:
+        # Returns up to size bytes, and b'' only at the end of the stream.
+        while True:
+            data = self._decompressor.unconsumed_tail or self._pending or self._source.read(READ_SIZE)
+            self._pending = b''
+            if not data:
+                return self._decompressor.flush()
+
+            chunk = self._decompressor.decompress(data, size)
+            if self._decompressor.eof:
+                self._pending = self._decompressor.unused_data
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+            if chunk:
+                return chunk
+
+
+def _decompressor(encoding, body):
+    # A reader of the decompressed body, whose read(size) returns at most size
+    # bytes.
+    if encoding == GZIP:
+        return GzipReader(body)
+
+    if encoding == ZSTD:
+        if not HAS_ZSTANDARD:
+            raise ValueError('zstd decompression needs the zstandard package')
+
+        import zstandard  # pylint: disable=import-outside-top-level
+        return zstandard.ZstdDecompressor().stream_reader(BodyReader(body), read_across_frames=True)
+
+    raise ValueError(f'Unsupported encoding {encoding!r}, use one of {", ".join(ENCODINGS)}')
+
+
+class CompressingReader(io.RawIOBase):
+    # Reads a stream compressed, a chunk at a time, so that the compressed
+    # payload is never held in memory as a whole.
+
+    def __init__(self, source, encoding, level=None):
+        super().__init__()
+        self._source = source
+        self._compressor = _compressor(encoding, level)
+        self._buffer = bytearray()
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast('B')
+        while len(self._buffer) < len(view) and not self._eof:
+            chunk = self._source.read(READ_SIZE)
+            if chunk:
+                self._buffer += self._compressor.compress(chunk)
+            else:
+                self._buffer += self._compressor.flush()
+                self._eof = True
+
+        count = min(len(view), len(self._buffer))
+        view[:count] = self._buffer[:count]
+        del self._buffer[:count]
+        return count
+
+
+class DecompressingBody:
+    # Wraps a botocore StreamingBody, with the same read and iter_chunks, and
+    # decompresses it as it is read.
+
+    def __init__(self, body, encoding):
+        self._body = body
+        self._decompressor = _decompressor(encoding, body)
+        self._buffer = bytearray()
+        self._eof = False
+
+    def _fill(self, size):
+        # The buffer never grows past the size asked for.
+        while (size is None or len(self._buffer) < size) and not self._eof:
+            chunk = self._decompressor.read(READ_SIZE if size is None else size - len(self._buffer))
+            if chunk:
+                self._buffer += chunk
+            else:
+                self._eof = True
+
+    def read(self, amt=None) -> bytes:
+        self._fill(amt)
+        if amt is None or amt >= len(self._buffer):
+            data, self._buffer = bytes(self._buffer), bytearray()
+        else:
+            data = bytes(self._buffer[:amt])
+            del self._buffer[:amt]
+
+        return data
+
+    def iter_chunks(self, chunk_size=READ_SIZE) -> typing.Iterator[bytes]:
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        self._body.close()
+
+
+@contextmanager
+def compressed(contents, encoding, *, level=None):
+    # Yields a reader of the compressed contents and the upload kwargs that
+    # describe them. The size before compression is recorded when it is known,
+    # which is the case for everything but streams.
+    with open_source(contents) as source:
+        kwargs = {'ContentEncoding': encoding}
+        if isinstance(source, memoryview):
+            kwargs.update({'Metadata': {UNCOMPRESSED_SIZE_METADATA: str(len(source))}})
+            source = ViewReader(source)
+
+        yield CompressingReader(source, encoding, level), kwargs
@@ -0,0 +1,101 @@
+
+from dataclasses import dataclass
+import typing
+
+from ..batch import BatchExecutor, BatchReport
+from .delete import DeleteReport
+from .transfer import default_transfer_executor, part_size_for, _multipart
+
+
+# copy_object handles objects of up to 5 GiB, larger ones are copied in parts
+# with upload_part_copy, which takes parts of up to 5 GiB.
+MULTIPART_COPY_THRESHOLD = 5 * 1024 * 1024 * 1024
+COPY_PART_SIZE = 512 * 1024 * 1024
+
+# A multipart copy starts a new object, so these are carried over from the
+# source, as copy_object does by itself.
+_COPIED_HEADERS = (
+    'CacheControl',
+    'ContentDisposition',
+    'ContentEncoding',
+    'ContentLanguage',
+    'ContentType',
+    'Expires',
+    'Metadata',
+    'StorageClass',
+)
+# copy_object parameters that create_multipart_upload does not take.
+_COPY_ONLY = ('MetadataDirective', 'TaggingDirective')
+
+
+@dataclass
+class CopyReport(BatchReport):
+    # One result per copied object, whose item is the source's ObjectSummary and
+    # value the target key. A move also holds the report of deleting the sources
+    # that were copied.
+    deleted: DeleteReport = None
+
+    def raise_for_errors(self):
+        super().raise_for_errors()
+        if self.deleted is not None:
+            self.deleted.raise_for_errors()
+
+        return self
+
+
+def _copy_part(client, bucket, key, upload_id, part):
+    number, source, copy_range, etag = part
+    response = client.upload_part_copy(
+        Bucket=bucket,
+        Key=key,
+        UploadId=upload_id,
+        PartNumber=number,
+        CopySource=source,
+        CopySourceRange=copy_range,
+        CopySourceIfMatch=etag,
+    )
+
+    return {'ETag': response['CopyPartResult']['ETag'], 'PartNumber': number}
+
+
+def copy_object(
+    client, source_bucket: str, source_key: str, bucket: str, key: str, *,
+    version_id: str = None,
+    size: int = None,
+    multipart_threshold: int = MULTIPART_COPY_THRESHOLD,
+    part_size: int = COPY_PART_SIZE,
+    executor: BatchExecutor = None,
+    **kwargs,
+) -> typing.Dict[str, any]:
+    # Copies an object within S3, so no data passes through this host. Objects
+    # below the threshold are copied with a single copy_object, larger ones as
+    # a multipart upload of concurrent upload_part_copy ranges, which only copy
+    # the source as long as its ETag does not change. The size is looked up
+    # when not given. kwargs are passed on to copy_object or
+    # create_multipart_upload, e.g. StorageClass. Returns the response of
+    # copy_object or complete_multipart_upload.
+    source = {'Bucket': source_bucket, 'Key': source_key}
+    if version_id:
+        source.update({'VersionId': version_id})
+
+    head = None
+    if size is None:
+        head = client.head_object(**source)
+        size = head['ContentLength']
+
+    if size < multipart_threshold:
+        return client.copy_object(CopySource=source, Bucket=bucket, Key=key, **kwargs)
+
+    if head is None:
+        head = client.head_object(**source)
+
+    headers = {name: head[name] for name in _COPIED_HEADERS if head.get(name)}
+    headers.update({name: value for name, value in kwargs.items() if name not in _COPY_ONLY})
+
+    part_size = part_size_for(size, part_size)
+
+    parts = [
+        (number, source, f'bytes={offset}-{min(offset + part_size, size) - 1}', head['ETag'])
+        for number, offset in enumerate(range(0, size, part_size), start=1)
+    ]
+    return _multipart(client, bucket, key, [parts], executor or default_transfer_executor, _copy_part, **headers)
@@ -1,19 +1,54 @@
 
+from contextlib import nullcontext
 from functools import cached_property
+from importlib.util import find_spec
+import io
+import typing
 
-import boto3
-try:
-    from flask import Response
-    HAS_FLASK = True
-except ImportError:
-    HAS_FLASK = False
+from botocore.exceptions import ClientError
 
 from ..base import Boto3Base
+from ..batch import BatchResult, default_executor
+from ..paginate import interleave
+from .cache import ObjectCache
+from .compression import ENCODINGS, UNCOMPRESSED_SIZE_METADATA, DecompressingBody, compressed
+from .copy import CopyReport, copy_object
+from .delete import DeleteReport, delete_objects
+from .inventory import DELIVERY_PATTERN, MANIFEST_NAME, InventoryManifest, read_inventory
+from .listing import ListingBatch, ObjectSummary
+from .presign import CLIENT_METHODS, DEFAULT_EXPIRES_IN, UrlSigner
+from .sync import SyncReport, sync
+from .transfer import MULTIPART_THRESHOLD, PART_SIZE, BodyReader, Download, upload
 from .utils import datetime_to_header
+from .versions import VersionIndex
+
+
+# Flask is only imported once a response is built, as most users never need it.
+HAS_FLASK = find_spec('flask') is not None
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# How many shards of a sharded listing are listed at once.
+DEFAULT_SHARD_WORKERS = 8
 
 
 class S3Base(Boto3Base):
     _service = 's3'
+    cache: ObjectCache = None
+
+    def __init__(self, *, cache: ObjectCache = None, **kwargs):
+        super().__init__(**kwargs)
+        # An opt-in read-through cache of object bodies, shared by every object
+        # created from this one.
+        self.cache = cache
+
+    @property
+    def init_args(self):
+        init_args = super().init_args
+        init_args.update({
+            'cache': self.cache,
+        })
+        return init_args
 
 
 class Bucket(S3Base):
@@ -37,22 +72,228 @@ class Bucket(S3Base):
                 Bucket=self.bucket,
             )
 
-    def list(self):
-        paginator = self.client.get_paginator('list_objects_v2')
+    def list_batches(
+        self, prefix=None, *,
+        delimiter=None,
+        start_after=None,
+        page_size=None,
+        prefetch_pages=None,
+    ) -> typing.Iterator[ListingBatch]:
+        kwargs = {
+            'Bucket': self.bucket,
+        }
+        if prefix:
+            kwargs.update({'Prefix': prefix})
+        if delimiter:
+            kwargs.update({'Delimiter': delimiter})
+        if start_after:
+            kwargs.update({'StartAfter': start_after})
+        if page_size:
+            kwargs.update({'PaginationConfig': {'PageSize': page_size}})
+
+        for page in self.paginate_pages('list_objects_v2', prefetch_pages=prefetch_pages, **kwargs):
+            yield ListingBatch.from_page(self.bucket, page)
+
+    def summaries(self, prefix=None, **kwargs) -> typing.Iterator[ObjectSummary]:
+        for batch in self.list_batches(prefix, **kwargs):
+            yield from batch
+
+    def list(self, prefix=None, **kwargs):
+        for batch in self.list_batches(prefix, **kwargs):
+            for key in batch.keys:
+                yield Object(self.bucket, key, autoload=False, **self.init_args)
+
+    def delete_keys(self, keys, *, executor=None) -> DeleteReport:
+        # Keys can be names, or (name, version_id) pairs to delete a version.
+        objects = (
+            {'Key': key} if isinstance(key, str) else {'Key': key[0], 'VersionId': key[1]}
+            for key in keys
+        )
+        return delete_objects(self.client, self.bucket, objects, executor=executor, service=self.service)
+
+    def delete_prefix(self, prefix, *, versions=False, executor=None) -> DeleteReport:
+        # Deletes every key under prefix, in batches sent while the listing is
+        # still running. With versions, every version and delete marker is
+        # deleted as well, rather than the current versions being hidden behind
+        # new delete markers.
+        if not prefix:
+            raise ValueError('A prefix must be given, use empty() to delete every key')
+
+        return self._purge(prefix, versions=versions, executor=executor)
+
+    def empty(self, *, versions=False, executor=None) -> DeleteReport:
+        return self._purge(None, versions=versions, executor=executor)
+
+    def _purge(self, prefix, *, versions, executor):
+        if versions:
+            kwargs = {'Prefix': prefix} if prefix else {}
+            objects = (
+                {'Key': item['Key'], 'VersionId': item['VersionId']}
+                for page in self.paginate_pages('list_object_versions', Bucket=self.bucket, **kwargs)
+                for item in page.get('Versions', []) + page.get('DeleteMarkers', [])
+            )
+        else:
+            objects = ({'Key': key} for batch in self.list_batches(prefix) for key in batch.keys)
+
+        return delete_objects(self.client, self.bucket, objects, executor=executor, service=self.service)
+
+    def heads(self, keys, *, executor=None) -> typing.Iterator[BatchResult]:
+        # HEADs many keys concurrently, yielding a BatchResult per key in order,
+        # with the key as its item and the head_object response as its value.
+        # keys can be a lazy source such as a listing, only a bounded number of
+        # requests is ever in flight.
+        executor = executor or default_executor
+        client = self.client
+
+        def head(key):
+            response = client.head_object(Bucket=self.bucket, Key=key)
+            response.pop('ResponseMetadata', None)
+            return response
 
-        for page in paginator.paginate(Bucket=self.bucket):
-            for item in page.get('Contents', []):
-                yield S3Object(self.bucket, item['Key'], autoload=False, **self.init_args)
+        return executor.imap(head, keys, service=self.service)
+
+    @cached_property
+    def url_signer(self) -> UrlSigner:
+        return UrlSigner(self.client, self.bucket, self.session.get_credentials())
+
+    def presigned_urls(
+        self, keys, *,
+        method='GET',
+        expires_in=DEFAULT_EXPIRES_IN,
+        **params,
+    ) -> typing.Iterator[str]:
+        # Presigns a URL for every key locally, see presign.UrlSigner, which takes
+        # a few microseconds per URL rather than a trip through the client.
+        return self.url_signer.sign_many(keys, method=method, expires_in=expires_in, **params)
+
+    def sync(self, directory, prefix='', **kwargs) -> SyncReport:
+        # See sync.sync, e.g. bucket.sync('build/', 'site/', delete=True).
+        return sync(self, directory, prefix, **kwargs)
+
+    def copy_prefix(self, prefix, target, target_prefix=None, *, move=False, executor=None, **kwargs) -> CopyReport:
+        # Copies every key under prefix to the target bucket, a name or Bucket,
+        # under target_prefix, which defaults to the same prefix. The copies are
+        # made within S3, concurrently, while the listing is still running. With
+        # move, the sources are deleted in batches as soon as they are copied.
+        # kwargs are passed on to copy.copy_object, e.g. StorageClass.
+        target = getattr(target, 'bucket', target)
+        prefix = prefix or ''
+        target_prefix = prefix if target_prefix is None else target_prefix
+
+        # The listing would otherwise come across the copies as they are made.
+        if target == self.bucket and target_prefix.startswith(prefix):
+            raise ValueError('Keys cannot be copied to within their own prefix in the same bucket')
+
+        executor = executor or default_executor
+        client = self.client
+
+        def copy(summary):
+            key = f'{target_prefix}{summary.key[len(prefix):]}'
+            copy_object(client, self.bucket, summary.key, target, key, size=summary.size, **kwargs)
+            return key
+
+        copies = executor.imap(copy, self.summaries(prefix or None), service=self.service)
+        if not move:
+            return CopyReport(results=list(copies))
+
+        results = []
+
+        def copied():
+            for result in copies:
+                results.append(result)
+                if result.ok:
+                    yield {'Key': result.item.key}
+
+        deleted = delete_objects(client, self.bucket, copied(), executor=executor, service=self.service)
+        return CopyReport(results=results, deleted=deleted)
+
+    def list_sharded(
+        self, prefix=None, *,
+        shards=None,
+        delimiter='/',
+        depth=1,
+        workers=DEFAULT_SHARD_WORKERS,
+        **kwargs,
+    ) -> typing.Iterator[ListingBatch]:
+        # Lists every key under prefix, with the listing split into shards that
+        # are listed concurrently. Batches come in no particular order.
+        #
+        # The shards are the given prefixes, or else are found by listing `depth`
+        # levels of the hierarchy under prefix with the delimiter, the keys found
+        # on the way being part of the listing.
+        buffered = workers * 2
+
+        if shards is None:
+            shards = [prefix or '']
+            for _ in range(depth):
+                level, shards = shards, []
+                listings = (self.list_batches(shard, delimiter=delimiter, **kwargs) for shard in level)
+                for batch in interleave(listings, workers=workers, depth=buffered):
+                    shards.extend(batch.prefixes)
+                    batch.prefixes = []
+                    if batch:
+                        yield batch
+
+                if not shards:
+                    return
+
+        listings = (self.list_batches(shard, **kwargs) for shard in shards)
+        yield from interleave(listings, workers=workers, depth=buffered)
+
+    def inventory_manifest(self, location) -> InventoryManifest:
+        # Reads an inventory's manifest from this bucket, the inventory's
+        # destination. location is the key of a manifest.json, or the inventory's
+        # own prefix, '<destination prefix>/<source bucket>/<inventory id>/', to
+        # read its most recent delivery.
+        if not location.endswith(MANIFEST_NAME):
+            prefix = location if location.endswith('/') else f'{location}/'
+            deliveries = [
+                delivery
+                for batch in self.list_batches(prefix, delimiter='/')
+                for delivery in batch.prefixes
+                if DELIVERY_PATTERN.fullmatch(delivery[len(prefix):-1])
+            ]
+            if not deliveries:
+                raise ValueError(f'No inventory deliveries found in {self.bucket}/{prefix}')
+
+            location = f'{max(deliveries)}{MANIFEST_NAME}'
+
+        return InventoryManifest.load(self.client, self.bucket, location)
+
+    def inventory_batches(self, location, prefix=None, **kwargs) -> typing.Iterator[ListingBatch]:
+        # Lists the inventoried bucket from an S3 Inventory kept in this bucket,
+        # see inventory.read_inventory, rather than paginating the bucket itself.
+        # The batches hold the source bucket's objects as of the inventory's
+        # delivery, in no particular order. location is as for inventory_manifest,
+        # or an InventoryManifest.
+        manifest = location if isinstance(location, InventoryManifest) else self.inventory_manifest(location)
+        return read_inventory(self.client, manifest, prefix, **kwargs)
+
+    def inventory_summaries(self, location, prefix=None, **kwargs) -> typing.Iterator[ObjectSummary]:
+        for batch in self.inventory_batches(location, prefix, **kwargs):
+            yield from batch
 
 
 class Object(S3Base):
     bucket = None
     key = None
     version_id = None
+    retain_body = False
+    decompress = True
     _obj = None
+    _head = None
+    _body_consumed = False
+    _contents = None
+
+    def __init__(
+        self, bucket, key, *,
+        version_id=None,
+        autoload=True,
+        retain_body=False,
+        decompress=True,
+        **kwargs,
+    ):
 
-    def __init__(self, bucket, key, *, version_id=None, autoload=True, **kwargs):
-        
         if not bucket or not key:
             raise ValueError('Both bucket and key must be set!')
 
@@ -61,57 +302,155 @@ class Object(S3Base):
         self.key = key
         self.version_id = version_id
 
-        if autoload:
+        # Keeps a fully read body around, so that it can be read more than once
+        # without fetching the object again.
+        self.retain_body = retain_body
+
+        # Bodies stored with a gzip or zstd Content-Encoding are decompressed as
+        # they are read, unless this is turned off.
+        self.decompress = decompress
+
+        # Only the headers are loaded up front, with a HEAD, and the body is
+        # fetched when it is first read, so no pooled connection is held by a
+        # body that may never be read. A missing key raises NoSuchKey here. With
+        # a cache the whole object is loaded, as the cache can usually answer
+        # without transferring the body.
+        if autoload and self.cache is not None:
             self.obj = self.get()
+        elif autoload:
+            self.load_metadata()
+
+    @property
+    def object_kwargs(self):
+        kwargs = {
+            'Bucket': self.bucket,
+            'Key': self.key,
+        }
+        if self.version_id:
+            kwargs.update({
+                'VersionId': self.version_id,
+            })
+
+        return kwargs
 
-    def get(self):
+    def get(self, **kwargs):
         try:
-            kwargs = {
-                'Bucket': self.bucket,
-                'Key': self.key,
-            }
-            if self.version_id:
-                kwargs.update({
-                    'VersionId': self.version_id,
-                })
-            return self.client.get_object(**kwargs)
+            # Ranged and conditional requests are passed straight through.
+            if self.cache is not None and not kwargs:
+                return self.cache.fetch(self.client, **self.object_kwargs)
+
+            return self.client.get_object(**self.object_kwargs, **kwargs)
+
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f'Unable to open: {self.bucket}/{self.key}: {exc}')
+            raise exc
+
+    def head(self, **kwargs):
+        try:
+            return self.client.head_object(**self.object_kwargs, **kwargs)
+
+        except ClientError as exc:
+            print(f'Unable to open: {self.bucket}/{self.key}: {exc}')
+            # A HEAD response has no body to name its error, so a missing key is
+            # raised as the NoSuchKey a GET would raise.
+            if self.version_id is None and exc.response.get('Error', {}).get('Code') == '404':
+                error = {'Code': 'NoSuchKey', 'Message': 'The specified key does not exist.'}
+                raise self.client.exceptions.NoSuchKey({**exc.response, 'Error': error}, exc.operation_name) from exc
+            raise exc
 
         except Exception as exc:  # pylint: disable=broad-except
             print(f'Unable to open: {self.bucket}/{self.key}: {exc}')
             raise exc
 
+    def load_metadata(self):
+        self._head = self.head()
+        return self
+
     @classmethod
-    def create(cls, bucket, key, contents, *, wait=False, **kwargs):
-        bucket = S3Bucket(bucket, **kwargs)
-        bytes_contents = contents if isinstance(contents, bytes) else contents.encode('utf-8')
+    def create(
+        cls, bucket, key, contents, *,
+        wait=False,
+        multipart_threshold=MULTIPART_THRESHOLD,
+        part_size=PART_SIZE,
+        executor=None,
+        compression=None,
+        compression_level=None,
+        **kwargs,
+    ):
+        # contents can be str, bytes, a memoryview or mmap, an os.PathLike to a
+        # file, or a file-like object. Files are memory mapped where possible, so
+        # large uploads are sent in concurrent parts without being copied.
+        #
+        # With a compression of 'gzip' or 'zstd' the contents are compressed as
+        # they are uploaded and stored with that Content-Encoding, along with
+        # their original size in the user metadata.
+        bucket = Bucket(bucket, **kwargs)
+        source = compressed(contents, compression, level=compression_level) \
+            if compression else nullcontext((contents, {}))
         try:
-            bucket.client.put_object(
-                Bucket=bucket,
-                Key=key,
-                Body=bytes_contents,
-            )
+            with source as (body, upload_kwargs):
+                upload(
+                    bucket.client,
+                    bucket.bucket,
+                    key,
+                    body,
+                    multipart_threshold=multipart_threshold,
+                    part_size=part_size,
+                    executor=executor,
+                    **upload_kwargs,
+                )
 
         except Exception as exc:  # pylint: disable=broad-except
-            print(f'Unable to save: {bucket}/{key}: {exc}')
+            print(f'Unable to save: {bucket.bucket}/{key}: {exc}')
             raise exc
 
         if wait:
             bucket.wait(
                 'object_exists',
-                Bucket=bucket,
+                Bucket=bucket.bucket,
                 Key=key,
             )
 
-        return cls(bucket, key, **kwargs)
+        return cls(bucket.bucket, key, **kwargs)
+
+    def update(self, contents, **kwargs):
+        return type(self).create(self.bucket, self.key, contents, **self.init_args, **kwargs)
+
+    def copy_to(self, bucket, key=None, *, move=False, **kwargs):
+        # Copies the object within S3 to the bucket, a name or Bucket, under the
+        # same key unless another is given, and returns the copy. With move the
+        # object is deleted once it has been copied. kwargs are passed on to
+        # copy.copy_object.
+        bucket = getattr(bucket, 'bucket', bucket)
+        key = key or self.key
+        if move and (bucket, key) == (self.bucket, self.key):
+            raise ValueError('An object cannot be moved onto itself')
 
-    def update(self, contents):
-        return type(self).create(self.bucket, self.key, contents, **self.init_args)
+        try:
+            copy_object(
+                self.client,
+                self.bucket,
+                self.key,
+                bucket,
+                key,
+                version_id=self.version_id,
+                size=self.content_length,
+                **kwargs,
+            )
+            if move:
+                self.client.delete_object(**self.object_kwargs)
+
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f'Unable to copy: {self.bucket}/{self.key} to {bucket}/{key}: {exc}')
+            raise exc
+
+        return type(self)(bucket, key, **self.init_args)
 
     def version(self, version):
         if version not in self.versions:
             return None
 
-        return S3Object(
+        return Object(
             self.bucket,
             self.key,
             version_id=version,
@@ -119,23 +458,21 @@ class Object(S3Base):
         )
 
     @cached_property
-    def versions(self):
-        versions = {}
-        paginator = self.client.get_paginator('list_object_versions')
+    def versions(self) -> VersionIndex:
+        return VersionIndex(self.client, self.bucket, self.key)
 
-        version_kwargs = {
-            'Bucket': self.bucket,
-            'Prefix': self.key,
-        }
-
-        for page in paginator.paginate(**version_kwargs):
-            for version in page.get('Versions', []):
-                versions.update({version['VersionId']: version['LastModified']})
-
-        if 'null' in versions:
-            return {}
+    def version_as_of(self, when):
+        # The version of the object that was current at the given time.
+        entry = self.versions.as_of(when)
+        if entry is None:
+            return None
 
-        return versions
+        return type(self)(
+            self.bucket,
+            self.key,
+            version_id=entry.version_id,
+            **self.init_args,
+        )
 
     @property
     def obj(self):
@@ -147,42 +484,275 @@ class Object(S3Base):
     @obj.setter
     def obj(self, value):
         self._obj = value
+        self._body_consumed = False
+        self._contents = None
+
+    @property
+    def metadata(self):
+        # The object's headers, from the loaded object when there is one and from
+        # a HEAD request otherwise, so that no body is fetched just for them.
+        if self._obj:
+            return self._obj
+
+        if self._head is None:
+            self.load_metadata()
+
+        return self._head
 
     @property
     def content_type(self):
-        return self.obj.get('ContentType', None)
+        return self.metadata.get('ContentType', None)
 
     @property
     def cache_control(self):
-        return self.obj.get('CacheControl', None)
+        return self.metadata.get('CacheControl', None)
 
     @property
     def expires(self):
-        return self.obj.get('Expires', None)
+        return self.metadata.get('Expires', None)
 
     @property
     def last_modified(self):
-        return self.obj.get('LastModified', None)
+        return self.metadata.get('LastModified', None)
+
+    @property
+    def etag(self):
+        return self.metadata.get('ETag', None)
+
+    @property
+    def content_length(self):
+        return self.metadata.get('ContentLength', None)
+
+    @property
+    def user_metadata(self):
+        return self.metadata.get('Metadata', {})
+
+    @property
+    def content_encoding(self):
+        return self.metadata.get('ContentEncoding', None)
+
+    @property
+    def uncompressed_size(self):
+        # The size of a compressed object's contents, when it was recorded on
+        # upload, or the size of an object that is not compressed.
+        if self.content_encoding not in ENCODINGS:
+            return self.content_length
+
+        size = self.user_metadata.get(UNCOMPRESSED_SIZE_METADATA)
+        return int(size) if size is not None else None
+
+    @property
+    def _decodes(self):
+        return self.decompress and self.content_encoding in ENCODINGS
+
+    def _take_body(self, *, decode=True):
+        # A response body can only be read once, so a fresh response is fetched
+        # once the current one has been consumed.
+        if self._body_consumed:
+            self.obj = self.get()
+
+        self._body_consumed = True
+        if decode and self._decodes:
+            return DecompressingBody(self.obj['Body'], self.content_encoding)
+
+        return self.obj['Body']
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        if self._contents is not None:
+            for offset in range(0, len(self._contents), chunk_size):
+                yield self._contents[offset:offset + chunk_size]
+            return
+
+        chunks = [] if self.retain_body else None
+        for chunk in self._take_body().iter_chunks(chunk_size):
+            if chunks is not None:
+                chunks.append(chunk)
+            yield chunk
+
+        if chunks is not None:
+            self._contents = b''.join(chunks)
+
+    def open(self, *, buffer_size=io.DEFAULT_BUFFER_SIZE) -> io.BufferedIOBase:
+        if self._contents is not None:
+            return io.BytesIO(self._contents)
+
+        return io.BufferedReader(BodyReader(self._take_body()), buffer_size)
+
+    def readinto(self, buffer) -> int:
+        # Fills the buffer with the start of the object and returns the number of
+        # bytes written, which is less than its size only for smaller objects.
+        view = memoryview(buffer).cast('B')
+        written = 0
+        with self.open() as reader:
+            while written < len(view):
+                count = reader.readinto(view[written:])
+                if not count:
+                    break
+                written += count
+
+        return written
+
+    def download(self, target=None, *, part_size=PART_SIZE, executor=None):
+        # Fetches the object as concurrent byte ranges into target, see
+        # transfer.Download, and returns the target. The stored bytes are
+        # downloaded, compressed objects are not decompressed.
+        return Download(
+            self.client,
+            self.bucket,
+            self.key,
+            target,
+            version_id=self.version_id,
+            part_size=part_size,
+            executor=executor,
+        ).run()
 
     @property
     def contents(self):
-        return self.obj['Body'].read()
+        if self._contents is not None:
+            return self._contents
+
+        contents = self._take_body().read()
+        if self.retain_body:
+            self._contents = contents
+
+        return contents
+
+    def presigned_url(self, method='GET', *, expires_in=DEFAULT_EXPIRES_IN, **params):
+        # A URL that gives whoever holds it the method on this object until it
+        # expires, signed locally. params are passed on as for the client method,
+        # e.g. ResponseContentDisposition, or ContentType for a PUT.
+        if method not in CLIENT_METHODS:
+            raise ValueError(f'Unsupported method {method!r}, use one of {", ".join(CLIENT_METHODS)}')
+
+        return self.client.generate_presigned_url(
+            CLIENT_METHODS[method],
+            Params={**self.object_kwargs, **params},
+            ExpiresIn=expires_in,
+        )
 
     @property
-    def flask_response(self):
+    def flask_redirect(self):
+        return self.make_flask_redirect()
+
+    def make_flask_redirect(self, *, expires_in=DEFAULT_EXPIRES_IN, code=302, **params):
+        # Redirects the client to a presigned URL of the object, so that S3 sends
+        # the body rather than this process. Signing makes no request, so with
+        # autoload=False no request is made to S3 at all.
         if not HAS_FLASK:
             raise AttributeError(
                 'Flask is not present in this environment. Cannot produce a Response object.')
 
-        response = Response(response=self.contents)
+        from flask import redirect  # pylint: disable=import-outside-top-level
 
-        if self.content_type:
-            response.headers['Content-Type'] = str(self.content_type)
-        if self.cache_control:
-            response.headers['Cache-Control'] = str(self.cache_control)
-        if self.expires:
-            response.headers['Expires'] = datetime_to_header(self.expires)
-        if self.last_modified:
-            response.headers['Last-Modified'] = datetime_to_header(self.last_modified)
+        response = redirect(self.presigned_url(expires_in=expires_in, **params), code=code)
+        # The URL expires, so the redirect must not be cached beyond that.
+        response.headers['Cache-Control'] = f'private, max-age={max(expires_in - 60, 0)}'
+        return response
+
+    @property
+    def flask_response(self):
+        return self.make_flask_response()
+
+    def make_flask_response(self, request=None, *, chunk_size=DEFAULT_CHUNK_SIZE):
+        # Streams the object through in chunks. When answering a request, which
+        # defaults to the current Flask request, a single byte range is passed on to
+        # S3 and conditional headers are answered with a 304 without a body being
+        # sent by S3.
+        if not HAS_FLASK:
+            raise AttributeError(
+                'Flask is not present in this environment. Cannot produce a Response object.')
+
+        # pylint: disable=import-outside-top-level
+        from botocore.exceptions import ClientError
+        from flask import Response, has_request_context, request as current_request
+
+        if request is None and has_request_context():
+            request = current_request
+
+        kwargs = self._request_kwargs(request) if request is not None else {}
+
+        # Compressed objects are sent as stored, with their Content-Encoding, so
+        # contents kept after decompressing cannot be used.
+        if not kwargs and self._contents is not None and not self._decodes:
+            obj, body = self.obj, [self._contents]
+
+        elif not kwargs and self._obj and not self._body_consumed:
+            obj, body = self.obj, self._stream(self._take_body(decode=False), chunk_size)
+
+        else:
+            try:
+                obj = self.client.get_object(**self.object_kwargs, **kwargs)
+            except ClientError as exc:
+                status = exc.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+                if status == 304:
+                    return Response(status=304, headers=self._not_modified_headers(exc.response))
+                if status == 416:
+                    size = exc.response.get('Error', {}).get('ActualObjectSize', '*')
+                    return Response(status=416, headers={'Content-Range': f'bytes */{size}'})
+                raise
+
+            # A ranged response only holds part of the object, so it is not kept.
+            if 'Range' not in kwargs:
+                self.obj = obj
+                self._body_consumed = True
+
+            body = self._stream(obj['Body'], chunk_size)
+
+        response = Response(
+            response=body,
+            status=206 if obj.get('ContentRange') else 200,
+            direct_passthrough=True,
+        )
+        response.headers['Accept-Ranges'] = 'bytes'
+
+        if obj.get('ContentLength') is not None:
+            response.headers['Content-Length'] = str(obj['ContentLength'])
+        if obj.get('ContentRange'):
+            response.headers['Content-Range'] = str(obj['ContentRange'])
+        if obj.get('ETag'):
+            response.headers['ETag'] = str(obj['ETag'])
+        if obj.get('ContentType'):
+            response.headers['Content-Type'] = str(obj['ContentType'])
+        if obj.get('ContentEncoding'):
+            response.headers['Content-Encoding'] = str(obj['ContentEncoding'])
+        if obj.get('CacheControl'):
+            response.headers['Cache-Control'] = str(obj['CacheControl'])
+        if obj.get('Expires'):
+            response.headers['Expires'] = datetime_to_header(obj['Expires'])
+        if obj.get('LastModified'):
+            response.headers['Last-Modified'] = datetime_to_header(obj['LastModified'])
 
         return response
+
+    @staticmethod
+    def _request_kwargs(request):
+        # The conditions are sent with the GET itself, S3 answers a match with a 304
+        # and no body, so there is no separate HEAD request.
+        kwargs = {}
+
+        if request.headers.get('If-None-Match'):
+            kwargs.update({'IfNoneMatch': request.headers['If-None-Match']})
+        elif request.if_modified_since:
+            kwargs.update({'IfModifiedSince': request.if_modified_since})
+
+        # Multiple ranges would need a multipart response, those get the whole object.
+        if request.range is not None and request.range.units == 'bytes' and len(request.range.ranges) == 1:
+            kwargs.update({'Range': request.range.to_header()})
+
+        return kwargs
+
+    @staticmethod
+    def _not_modified_headers(response):
+        headers = response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+        return {
+            name: headers[name.lower()]
+            for name in ('ETag', 'Last-Modified', 'Cache-Control', 'Expires')
+            if headers.get(name.lower())
+        }
+
+    @staticmethod
+    def _stream(body, chunk_size):
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
@@ -0,0 +1,78 @@
+
+from dataclasses import dataclass
+import itertools
+import typing
+
+from ..batch import BatchError, BatchExecutor, BatchReport, default_executor
+
+
+# S3 deletes at most this many keys per request.
+DELETE_BATCH_SIZE = 1000
+
+
+@dataclass
+class DeleteReport(BatchReport):
+    # One result per delete_objects request, whose item is the batch of
+    # {'Key': ..., 'VersionId': ...} it deleted.
+
+    @property
+    def errors(self) -> typing.List[typing.Dict[str, str]]:
+        # S3's errors for single keys, and the whole batch of any request that
+        # failed, in the form of delete_objects' Errors.
+        errors = []
+        for result in self.results:
+            if result.ok:
+                errors.extend(result.value.get('Errors', []))
+            else:
+                errors.extend(
+                    dict(item, Code=type(result.error).__name__, Message=str(result.error))
+                    for item in result.item
+                )
+
+        return errors
+
+    @property
+    def deleted(self) -> typing.List[typing.Dict[str, str]]:
+        failed = {(error.get('Key'), error.get('VersionId')) for error in self.errors}
+        return [
+            item
+            for result in self.results
+            for item in result.item
+            if (item['Key'], item.get('VersionId')) not in failed
+        ]
+
+    def raise_for_errors(self):
+        if self.errors:
+            raise DeleteError(self)
+
+        return self
+
+
+class DeleteError(BatchError):
+
+    def __init__(self, report: DeleteReport):  # pylint: disable=super-init-not-called
+        self.report = report
+        errors = report.errors
+        Exception.__init__(
+            self,
+            f'{len(errors)} keys could not be deleted, first: {errors[0].get("Key")}: '
+            f'{errors[0].get("Code")} {errors[0].get("Message")}',
+        )
+
+
+def delete_objects(
+    client, bucket: str, objects: typing.Iterable[typing.Dict[str, str]], *,
+    executor: BatchExecutor = None,
+    service: str = 's3',
+) -> DeleteReport:
+    # Deletes {'Key': ..., 'VersionId': ...} items with delete_objects, in
+    # batches that are sent as soon as they fill up. objects can be a lazy
+    # listing, which then carries on while earlier batches are being deleted.
+    executor = executor or default_executor
+    objects = iter(objects)
+
+    def delete(batch):
+        return client.delete_objects(Bucket=bucket, Delete={'Objects': batch, 'Quiet': True})
+
+    batches = iter(lambda: list(itertools.islice(objects, DELETE_BATCH_SIZE)), [])
+    return DeleteReport(results=list(executor.imap(delete, batches, service=service)))
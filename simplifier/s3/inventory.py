@@ -0,0 +1,120 @@
+
+import csv
+import datetime
+import gzip
+import io
+import json
+import re
+import typing
+from urllib.parse import unquote_plus
+
+from ..paginate import interleave
+from .listing import ListingBatch
+from .transfer import BodyReader
+
+
+MANIFEST_NAME = 'manifest.json'
+
+# Each delivery of an inventory is a folder named after its time, next to the
+# data/ and hive/ folders, e.g. 2024-01-31T01-00Z/.
+DELIVERY_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}-\d{2}Z')
+
+DEFAULT_INVENTORY_BATCH_SIZE = 1000
+DEFAULT_INVENTORY_WORKERS = 8
+
+
+class InventoryManifest:
+    # The manifest.json of an inventory delivery, which lists its data files.
+    bucket: str = None
+    key: str = None
+    source_bucket: str = None
+    destination_bucket: str = None
+    file_format: str = None
+    schema: typing.List[str] = None
+    files: typing.List[typing.Dict[str, any]] = None
+    created: datetime.datetime = None
+
+    def __init__(self, bucket, key, data):
+        self.bucket = bucket
+        self.key = key
+        self.source_bucket = data['sourceBucket']
+        # The destination is given as an ARN, arn:aws:s3:::bucket.
+        self.destination_bucket = data.get('destinationBucket', bucket).split(':')[-1]
+        self.file_format = data['fileFormat']
+        self.schema = [name.strip() for name in data['fileSchema'].split(',')]
+        self.files = data['files']
+        self.created = datetime.datetime.fromtimestamp(
+            int(data['creationTimestamp']) / 1000, tz=datetime.timezone.utc)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.bucket!r}, {self.key!r})'
+
+    @classmethod
+    def load(cls, client, bucket, key):
+        return cls(bucket, key, json.loads(client.get_object(Bucket=bucket, Key=key)['Body'].read()))
+
+
+def _timestamp(value):
+    # Inventory times look like 2024-01-31T00:00:00.000Z.
+    return datetime.datetime.fromisoformat(value.replace('Z', '+00:00')) if value else None
+
+
+def _read_file(client, manifest, key, prefix, batch_size):
+    # Streams one gzipped CSV data file as ListingBatches of current versions,
+    # decompressing and parsing it a buffer at a time.
+    columns = {name: index for index, name in enumerate(manifest.schema)}
+    key_column = columns['Key']
+    size_column = columns.get('Size')
+    etag_column = columns.get('ETag')
+    modified_column = columns.get('LastModifiedDate')
+    class_column = columns.get('StorageClass')
+    latest_column = columns.get('IsLatest')
+    marker_column = columns.get('IsDeleteMarker')
+
+    body = client.get_object(Bucket=manifest.destination_bucket, Key=key)['Body']
+    with io.TextIOWrapper(gzip.GzipFile(fileobj=BodyReader(body)), encoding='utf-8', newline='') as text:
+        batch = ListingBatch(bucket=manifest.source_bucket)
+        for row in csv.reader(text):
+            # Inventories of versioned buckets hold every version, a listing only
+            # has the current ones.
+            if latest_column is not None and row[latest_column] == 'false':
+                continue
+            if marker_column is not None and row[marker_column] == 'true':
+                continue
+
+            name = unquote_plus(row[key_column])
+            if prefix and not name.startswith(prefix):
+                continue
+
+            size = row[size_column] if size_column is not None else None
+            etag = row[etag_column] if etag_column is not None else None
+            batch.keys.append(name)
+            batch.sizes.append(int(size) if size else None)
+            batch.etags.append(f'"{etag}"' if etag else None)
+            batch.last_modified.append(_timestamp(row[modified_column]) if modified_column is not None else None)
+            batch.storage_classes.append(row[class_column] if class_column is not None else None)
+
+            if len(batch) >= batch_size:
+                yield batch
+                batch = ListingBatch(bucket=manifest.source_bucket)
+
+        if batch:
+            yield batch
+
+
+def read_inventory(
+    client, manifest: InventoryManifest, prefix: str = None, *,
+    workers: int = DEFAULT_INVENTORY_WORKERS,
+    depth: int = None,
+    batch_size: int = DEFAULT_INVENTORY_BATCH_SIZE,
+) -> typing.Iterator[ListingBatch]:
+    # Yields the current objects of the inventory's source bucket, optionally
+    # under a prefix, as ListingBatches of up to batch_size keys. Data files are
+    # streamed on up to workers threads at once, with at most depth batches,
+    # by default two per worker, waiting to be consumed, so memory stays bounded
+    # whatever the size of the inventory. Batches come in no particular order.
+    if manifest.file_format != 'CSV':
+        raise ValueError(f'Only CSV inventories can be read, not {manifest.file_format}')
+
+    files = (_read_file(client, manifest, file['key'], prefix, batch_size) for file in manifest.files)
+    return interleave(files, workers=workers, depth=depth or workers * 2)
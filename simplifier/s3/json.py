@@ -1,18 +1,173 @@
 
+import gzip
+from importlib.util import find_spec
+import io
 import json
+import re
+import typing
 
-from .core import Object
+from .core import DEFAULT_CHUNK_SIZE, Object
+
+
+# orjson can be used for decoding, where it is installed, by asking for it.
+HAS_ORJSON = find_spec('orjson') is not None
+
+# orjson decodes integers beyond 64 bits as floats, so documents with numbers
+# that long are left to json.
+_LONG_NUMBER = re.compile(r'\d{19,}')
+_LONG_NUMBER_BYTES = re.compile(rb'\d{19,}')
+
+GZIP_MAGIC = b'\x1f\x8b'
+JSON_LINES_SUFFIXES = ('.jsonl', '.ndjson')
+JSON_LINES_CONTENT_TYPES = ('application/x-ndjson', 'application/jsonl', 'application/json-lines')
+
+_UNSET = object()
+_WHITESPACE = ' \t\n\r'
+_ITEM_END = _WHITESPACE + ',]'
+
+
+def loads(data, *, fast=False):
+    # With fast, orjson decodes the document when it is installed. json takes
+    # over for anything orjson would decode differently or refuses, such as
+    # NaN, so the result is the same either way.
+    if fast and HAS_ORJSON:
+        import orjson  # pylint: disable=import-outside-top-level
+
+        pattern = _LONG_NUMBER if isinstance(data, str) else _LONG_NUMBER_BYTES
+        if not pattern.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+
+    return json.loads(data)
+
+
+def dumps(value) -> bytes:
+    return json.dumps(value).encode('utf-8')
+
+
+def iter_array(reader: typing.TextIO, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> typing.Iterator:
+    # Decodes the items of a top-level JSON array one at a time, holding no more
+    # of the document than the current item and one chunk of text.
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+
+    def fill():
+        nonlocal buffer, position, eof
+        chunk = reader.read(chunk_size)
+        eof = not chunk
+        buffer, position = buffer[position:] + chunk, 0
+
+    def peek():
+        # The next character that is not whitespace, or '' at the end.
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if eof:
+                return ''
+            fill()
+
+    if peek() != '[':
+        raise ValueError('The document is not a JSON array')
+    position += 1
+
+    if peek() == ']':
+        return
+
+    while True:
+        peek()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+                # A number cut off by the end of the buffer decodes as a shorter
+                # one, so an item only counts once something that ends it follows.
+                if eof or (end < len(buffer) and buffer[end] in _ITEM_END):
+                    break
+            except ValueError:
+                if eof:
+                    raise
+            fill()
+
+        position = end
+        yield item
+
+        separator = peek()
+        if separator == ']':
+            return
+        if separator != ',':
+            raise ValueError(f'Expected "," or "]" in the JSON array, found {separator!r}')
+        position += 1
 
 
 class JsonObject(Object):
+    _value = _UNSET
+    fast_decode = False
+
+    def __init__(self, *args, fast_decode=False, **kwargs):
+        # Decodes with orjson, when it is installed, see loads().
+        self.fast_decode = fast_decode
+        super().__init__(*args, **kwargs)
 
     @classmethod
     def create(cls, bucket, key, contents, **kwargs):
         if not isinstance(contents, (str, bytes,)):
-            contents = json.dumps(contents)
+            contents = dumps(contents)
 
         return super().create(bucket, key, contents, **kwargs)
 
+    @Object.obj.setter
+    def obj(self, value):
+        Object.obj.fset(self, value)
+        self._value = _UNSET
+
+    @property
+    def json_lines(self):
+        content_type = (self.content_type or '').split(';')[0].strip()
+        return self.key.endswith(JSON_LINES_SUFFIXES) or content_type in JSON_LINES_CONTENT_TYPES
+
     @property
     def contents(self):
-        return json.loads(super().contents)
+        # Decoded once and kept, the same value is returned by every access until
+        # the object is loaded again.
+        if self._value is _UNSET:
+            data = super().contents
+            if data[:2] == GZIP_MAGIC:
+                data = gzip.decompress(data)
+
+            self._value = [loads(line, fast=self.fast_decode) for line in data.splitlines() if line.strip()] \
+                if self.json_lines else loads(data, fast=self.fast_decode)
+
+        return self._value
+
+    def open_decoded(self, *, buffer_size=io.DEFAULT_BUFFER_SIZE) -> io.BufferedIOBase:
+        # The body as a binary stream, decompressed on the fly when gzipped.
+        reader = self.open(buffer_size=buffer_size)
+        head = reader.getvalue()[:2] if isinstance(reader, io.BytesIO) else reader.peek(2)[:2]
+        if head == GZIP_MAGIC:
+            return io.BufferedReader(gzip.GzipFile(fileobj=reader, mode='rb'), buffer_size)
+
+        return reader
+
+    def iter_items(self, *, lines: bool = None, chunk_size=DEFAULT_CHUNK_SIZE) -> typing.Iterator:
+        # Yields the items of a top-level array, or the documents of a JSON Lines
+        # object, without reading the whole body into memory. JSON Lines are
+        # recognised from the key's suffix or the content type unless lines is
+        # given.
+        if lines is None:
+            lines = self.json_lines
+
+        with self.open_decoded() as reader:
+            if lines:
+                for line in reader:
+                    if line.strip():
+                        yield loads(line, fast=self.fast_decode)
+                return
+
+            with io.TextIOWrapper(reader, encoding='utf-8') as text:
+                yield from iter_array(text, chunk_size=chunk_size)
@@ -0,0 +1,62 @@
+
+from dataclasses import dataclass, field
+import datetime
+import typing
+
+
+class ObjectSummary:
+    # A listed key, without the client and session state of an Object wrapper.
+    __slots__ = ('bucket', 'key', 'size', 'etag', 'last_modified', 'storage_class')
+
+    def __init__(self, bucket, key, size=None, etag=None, last_modified=None, storage_class=None):
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.storage_class = storage_class
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.bucket!r}, {self.key!r}, size={self.size!r})'
+
+    def __eq__(self, other):
+        if not isinstance(other, ObjectSummary):
+            return NotImplemented
+
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash((self.bucket, self.key, self.etag))
+
+
+@dataclass
+class ListingBatch:
+    # One page of a listing, stored as columns rather than as one record per key.
+    bucket: str
+    keys: typing.List[str] = field(default_factory=list)
+    sizes: typing.List[int] = field(default_factory=list)
+    etags: typing.List[str] = field(default_factory=list)
+    last_modified: typing.List[datetime.datetime] = field(default_factory=list)
+    storage_classes: typing.List[str] = field(default_factory=list)
+    # The common prefixes of a listing with a delimiter.
+    prefixes: typing.List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_page(cls, bucket, page):
+        contents = page.get('Contents', [])
+        return cls(
+            bucket=bucket,
+            keys=[item['Key'] for item in contents],
+            sizes=[item.get('Size') for item in contents],
+            etags=[item.get('ETag') for item in contents],
+            last_modified=[item.get('LastModified') for item in contents],
+            storage_classes=[item.get('StorageClass') for item in contents],
+            prefixes=[item['Prefix'] for item in page.get('CommonPrefixes', [])],
+        )
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self) -> typing.Iterator[ObjectSummary]:
+        for values in zip(self.keys, self.sizes, self.etags, self.last_modified, self.storage_classes):
+            yield ObjectSummary(self.bucket, *values)
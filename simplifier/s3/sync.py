@@ -0,0 +1,251 @@
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import mimetypes
+import os
+import pathlib
+import typing
+
+from ..batch import BatchExecutor, BatchReport, BatchResult, default_executor
+from .transfer import MULTIPART_THRESHOLD, PART_SIZE, READ_SIZE, Download, part_size_for, upload
+
+
+UP = 'up'
+DOWN = 'down'
+
+# The manifest is kept in the synced directory unless given elsewhere. It
+# holds one section per bucket and prefix the directory is synced with.
+MANIFEST_NAME = '.simplifier-sync.json'
+
+_DOWNLOAD_SUFFIX = '.download'
+
+
+@dataclass
+class SyncReport:
+    direction: str
+    uploaded: typing.List[str] = field(default_factory=list)
+    downloaded: typing.List[str] = field(default_factory=list)
+    deleted: typing.List[str] = field(default_factory=list)
+    unchanged: typing.List[str] = field(default_factory=list)
+    # The results of the transfers and deletions, by relative path.
+    transfers: BatchReport = field(default_factory=BatchReport)
+
+    @property
+    def failed(self) -> typing.Dict[str, BaseException]:
+        return {result.item: result.error for result in self.transfers.failed}
+
+    def raise_for_errors(self):
+        self.transfers.raise_for_errors()
+        return self
+
+
+def _md5(filehandle, size):
+    digest = hashlib.md5()
+    while size > 0:
+        chunk = filehandle.read(min(size, READ_SIZE))
+        if not chunk:
+            break
+        digest.update(chunk)
+        size -= len(chunk)
+
+    return digest
+
+
+def file_etag(path, size, *, multipart_threshold=MULTIPART_THRESHOLD, part_size=PART_SIZE) -> str:
+    # The ETag S3 gives a file uploaded by transfer.upload: the MD5 of the file,
+    # or for a multipart upload the MD5 of its parts' MD5s and the part count.
+    with open(path, 'rb') as filehandle:
+        if size < multipart_threshold:
+            return f'"{_md5(filehandle, size).hexdigest()}"'
+
+        part_size = part_size_for(size, part_size)
+        count = -(-size // part_size)
+        digests = b''.join(_md5(filehandle, part_size).digest() for _ in range(count))
+
+    return f'"{hashlib.md5(digests).hexdigest()}-{count}"'
+
+
+def _local_path(directory, name):
+    # Object keys are not trusted as paths, one that leads out of the directory,
+    # such as 'a/../../b', is refused rather than written or removed.
+    root = os.path.abspath(directory)
+    path = os.path.abspath(os.path.join(root, *name.split('/')))
+    if path == root or os.path.commonpath([root, path]) != root:
+        raise ValueError(f'{name!r} is outside of {directory}')
+
+    return path
+
+
+def _scan_directory(directory, manifest_path):
+    files = {}
+    for root, dirs, names in os.walk(directory):
+        dirs.sort()
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            if path == manifest_path or name.endswith((_DOWNLOAD_SUFFIX, f'{_DOWNLOAD_SUFFIX}.parts')):
+                continue
+
+            stat = os.stat(path)
+            files[os.path.relpath(path, directory).replace(os.sep, '/')] = (stat.st_size, stat.st_mtime_ns)
+
+    return files
+
+
+class _Manifest:
+
+    def __init__(self, path, section):
+        self.path = path
+        self.section = section
+        try:
+            with open(path, 'r', encoding='utf-8') as filehandle:
+                self.sections = json.load(filehandle)
+        except (OSError, ValueError):
+            self.sections = {}
+
+        self.entries = self.sections.setdefault(section, {})
+
+    def matches(self, name, size, mtime, etag):
+        # Whether the file and the object are unchanged since they were last synced.
+        entry = self.entries.get(name)
+        return entry is not None and (entry['size'], entry['mtime'], entry['etag']) == (size, mtime, etag)
+
+    def record(self, name, size, mtime, etag):
+        self.entries[name] = {'size': size, 'mtime': mtime, 'etag': etag}
+
+    def save(self):
+        temporary = f'{self.path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as filehandle:
+            json.dump(self.sections, filehandle, indent=1, sort_keys=True)
+
+        os.replace(temporary, self.path)
+
+
+def sync(
+    bucket, directory, prefix: str = '', *,
+    direction: str = UP,
+    delete: bool = False,
+    manifest: str = None,
+    dry_run: bool = False,
+    executor: BatchExecutor = None,
+    **kwargs,
+) -> SyncReport:
+    # Makes the bucket prefix match the directory (UP) or the directory match
+    # the bucket prefix (DOWN), transferring only files that differ.
+    #
+    # A file and an object are the same when they match the manifest entry of
+    # the last sync. Otherwise, when their sizes match, the file's ETag is
+    # computed and compared, so an existing copy is never transferred again.
+    # With delete, files or objects missing on the source side are removed.
+    # kwargs are passed on to transfer.upload, e.g. ContentType overrides the
+    # type guessed from the file name.
+    if direction not in (UP, DOWN):
+        raise ValueError(f'direction must be {UP!r} or {DOWN!r}')
+
+    directory = os.fspath(directory)
+    if prefix and not prefix.endswith('/'):
+        prefix = f'{prefix}/'
+
+    executor = executor or default_executor
+    manifest = _Manifest(
+        os.fspath(manifest) if manifest else os.path.join(directory, MANIFEST_NAME),
+        f'{bucket.bucket}/{prefix}',
+    )
+
+    if direction == DOWN:
+        os.makedirs(directory, exist_ok=True)
+
+    local = _scan_directory(directory, manifest.path) if os.path.isdir(directory) else {}
+    remote = {
+        summary.key[len(prefix):]: (summary.size, summary.etag)
+        for summary in bucket.summaries(prefix or None)
+        if not summary.key.endswith('/')
+    }
+
+    report = SyncReport(direction=direction)
+    source, target = (local, remote) if direction == UP else (remote, local)
+
+    transfers = []
+    for name in source:
+        size, mtime = local.get(name, (None, None))
+        remote_size, etag = remote.get(name, (None, None))
+
+        if size is not None and etag is not None:
+            if manifest.matches(name, size, mtime, etag):
+                report.unchanged.append(name)
+                continue
+
+            if size == remote_size and file_etag(os.path.join(directory, name), size) == etag:
+                manifest.record(name, size, mtime, etag)
+                report.unchanged.append(name)
+                continue
+
+        transfers.append(name)
+
+    extras = [name for name in target if name not in source] if delete else []
+
+    if direction == UP:
+        report.uploaded.extend(transfers)
+    else:
+        report.downloaded.extend(transfers)
+    report.deleted.extend(extras)
+
+    if dry_run:
+        return report
+
+    client = bucket.client
+
+    def transfer(name):
+        path = _local_path(directory, name)
+        if direction == UP:
+            content_type, _ = mimetypes.guess_type(name)
+            upload_kwargs = {'ContentType': content_type} if content_type else {}
+            upload_kwargs.update(kwargs)
+            response = upload(client, bucket.bucket, f'{prefix}{name}', pathlib.Path(path), **upload_kwargs)
+            etag = response['ETag']
+        else:
+            # Downloads land next to the file and replace it once complete, so
+            # an interrupted sync never leaves a partial file in its place.
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            Download(client, bucket.bucket, f'{prefix}{name}', f'{path}{_DOWNLOAD_SUFFIX}').run()
+            os.replace(f'{path}{_DOWNLOAD_SUFFIX}', path)
+            etag = remote[name][1]
+
+        stat = os.stat(path)
+        manifest.record(name, stat.st_size, stat.st_mtime_ns, etag)
+        return name
+
+    def remove(name):
+        os.remove(_local_path(directory, name))
+        return name
+
+    try:
+        results = executor.run(transfer, transfers, service=bucket.service)
+
+        if direction == UP:
+            deletion = bucket.delete_keys([f'{prefix}{name}' for name in extras], executor=executor)
+            errors = {error['Key'][len(prefix):]: error for error in deletion.errors}
+            removals = BatchReport(results=[
+                BatchResult(item=name, attempts=1) if name not in errors else BatchResult(
+                    item=name,
+                    error=IOError(f'{errors[name].get("Code")}: {errors[name].get("Message")}'),
+                    attempts=1,
+                )
+                for name in extras
+            ])
+        else:
+            removals = executor.run(remove, extras)
+
+        for result in removals.succeeded:
+            manifest.entries.pop(result.item, None)
+
+    finally:
+        manifest.save()
+
+    report.transfers = BatchReport(results=results.results + removals.results)
+    failed = set(report.failed)
+    report.uploaded[:] = [name for name in report.uploaded if name not in failed]
+    report.downloaded[:] = [name for name in report.downloaded if name not in failed]
+    report.deleted[:] = [name for name in report.deleted if name not in failed]
+
+    return report
@@ -0,0 +1,489 @@
+
+from contextlib import contextmanager
+import functools
+import io
+import json
+import mmap
+import os
+import threading
+import typing
+
+from ..batch import BatchError, BatchExecutor, BatchReport
+
+
+# Objects at least this large are uploaded in parts. S3 needs every part but the
+# last to be at least MIN_PART_SIZE, and allows at most MAX_PARTS of them.
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+PART_SIZE = 8 * 1024 * 1024
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10000
+
+# Ranges are read into their place in the target this much at a time.
+READ_SIZE = 1024 * 1024
+
+# Transfers get their own executor, so that uploads started from a batch running
+# on the default executor cannot starve it of workers.
+default_transfer_executor = BatchExecutor(max_workers=8)
+
+
+class BodyReader(io.RawIOBase):
+    # Adapts a botocore StreamingBody to the io interface, so that it can be
+    # wrapped in a BufferedReader and read into existing buffers.
+
+    def __init__(self, body):
+        super().__init__()
+        self._body = body
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast('B')
+        data = self._body.read(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._body.close()
+
+        super().close()
+
+
+class ViewReader(io.RawIOBase):
+    # A seekable reader over a memoryview, so that botocore can checksum and
+    # retry a part without the part being copied into its own bytes.
+
+    def __init__(self, view):
+        super().__init__()
+        self._view = view
+        self._position = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+
+        self._position = min(max(offset, 0), len(self._view))
+        return self._position
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast('B')
+        count = min(len(view), len(self._view) - self._position)
+        view[:count] = self._view[self._position:self._position + count]
+        self._position += count
+        return count
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+
+        super().close()
+
+
+def part_size_for(size, part_size=PART_SIZE):
+    # Grows the part size for objects that would otherwise need too many parts.
+    return max(part_size, MIN_PART_SIZE, -(-size // MAX_PARTS))
+
+
+def _map_file(filehandle):
+    # Maps a regular file from its current position, returns None for anything
+    # that cannot be mapped, such as pipes and in-memory streams.
+    try:
+        fileno = filehandle.fileno()
+        position = filehandle.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+    if os.fstat(fileno).st_size <= position:
+        return memoryview(b'')
+
+    try:
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    return memoryview(mapped)[position:]
+
+
+@contextmanager
+def open_source(contents):
+    # Yields a memoryview over the contents where possible, without copying
+    # them, or else the file-like object itself to be read from in parts.
+    # Strings are encoded as utf-8 and os.PathLike values are opened as files.
+    if isinstance(contents, str):
+        contents = contents.encode('utf-8')
+
+    if isinstance(contents, (bytes, bytearray, memoryview, mmap.mmap)):
+        view = memoryview(contents).cast('B')
+        try:
+            yield view
+        finally:
+            view.release()
+        return
+
+    if isinstance(contents, os.PathLike):
+        with open(contents, 'rb') as filehandle:
+            with open_source(filehandle) as source:
+                yield source
+        return
+
+    if not hasattr(contents, 'read'):
+        raise TypeError(f'Cannot upload contents of type {type(contents).__name__}')
+
+    view = _map_file(contents)
+    if view is None:
+        yield contents
+        return
+
+    try:
+        yield view
+    finally:
+        # The mapping is closed once nothing refers to it anymore.
+        view.release()
+
+
+def _read_part(filehandle, size):
+    part = bytearray()
+    while len(part) < size:
+        chunk = filehandle.read(size - len(part))
+        if not chunk:
+            break
+        part.extend(chunk)
+
+    return part
+
+
+def _stream_parts(filehandle, part_size):
+    while True:
+        part = _read_part(filehandle, part_size)
+        if not part:
+            return
+        yield part
+
+
+def upload(
+    client, bucket: str, key: str, contents, *,
+    multipart_threshold: int = MULTIPART_THRESHOLD,
+    part_size: int = PART_SIZE,
+    executor: BatchExecutor = None,
+    **kwargs,
+) -> typing.Dict[str, any]:
+    # Uploads the contents with a single put_object below the threshold, and as
+    # a multipart upload with its parts sent concurrently otherwise. kwargs are
+    # passed on to put_object or create_multipart_upload, e.g. ContentType.
+    executor = executor or default_transfer_executor
+
+    with open_source(contents) as source:
+        if isinstance(source, memoryview):
+            if len(source) < multipart_threshold:
+                return client.put_object(Bucket=bucket, Key=key, Body=ViewReader(source[:]), **kwargs)
+
+            part_size = part_size_for(len(source), part_size)
+            parts = [
+                (number, source[offset:offset + part_size])
+                for number, offset in enumerate(range(0, len(source), part_size), start=1)
+            ]
+            return _multipart(client, bucket, key, [parts], executor, _upload_part, **kwargs)
+
+        # Streams of unknown size are read up to the threshold first, to decide
+        # between a single put and a multipart upload.
+        head = _read_part(source, multipart_threshold)
+        if len(head) < multipart_threshold:
+            return client.put_object(Bucket=bucket, Key=key, Body=bytes(head), **kwargs)
+
+        part_size = max(part_size, MIN_PART_SIZE)
+        windows = _stream_windows(head, source, part_size, executor)
+        return _multipart(client, bucket, key, windows, executor, _upload_part, **kwargs)
+
+
+def _stream_windows(head, filehandle, part_size, executor):
+    # Groups the parts of a stream so that no more of them are held in memory
+    # than the executor can upload at once.
+    window = []
+    for number, part in enumerate(_merge_parts(io.BytesIO(head), filehandle, part_size), start=1):
+        window.append((number, part))
+        if len(window) == executor.max_workers:
+            yield window
+            window = []
+
+    if window:
+        yield window
+
+
+def _merge_parts(head, filehandle, part_size):
+    # Parts read from the head carry on into the rest of the stream, so that
+    # every part but the last one is a full part.
+    remainder = bytearray()
+    for part in _stream_parts(head, part_size):
+        if len(part) == part_size:
+            yield part
+        else:
+            remainder = part
+
+    if remainder:
+        remainder.extend(_read_part(filehandle, part_size - len(remainder)))
+        yield remainder
+
+    yield from _stream_parts(filehandle, part_size)
+
+
+def _upload_part(client, bucket, key, upload_id, part):
+    number, data = part
+    body = ViewReader(data[:]) if isinstance(data, memoryview) else data
+    try:
+        response = client.upload_part(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=number,
+            Body=body,
+        )
+    finally:
+        if isinstance(body, ViewReader):
+            body.close()
+
+    return {'ETag': response['ETag'], 'PartNumber': number}
+
+
+def _multipart(client, bucket, key, windows, executor, send_part, **kwargs):
+    # Runs a multipart upload of the windows of parts, each window's parts being
+    # sent concurrently by send_part(client, bucket, key, upload_id, part). The
+    # upload is aborted when any part fails.
+    upload_id = client.create_multipart_upload(Bucket=bucket, Key=key, **kwargs)['UploadId']
+    send = functools.partial(send_part, client, bucket, key, upload_id)
+
+    completed = []
+    try:
+        for window in windows:
+            report = executor.run(send, window, service='s3').raise_for_errors()
+            completed.extend(report.values)
+
+        return client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': sorted(completed, key=lambda part: part['PartNumber'])},
+        )
+
+    except BaseException:
+        client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        raise
+
+
+def _drop_tracebacks(exc):
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        exc.__traceback__ = None
+        exc = exc.__cause__ or exc.__context__
+
+
+class DownloadError(BatchError):
+    # Raised when some ranges of a download failed. The download keeps track of
+    # the ranges it already has, so `exc.download.run()` fetches only the rest.
+
+    def __init__(self, report: BatchReport, download: 'Download'):
+        super().__init__(report)
+        self.download = download
+
+
+class Download:
+    # Fetches an object as concurrent byte ranges, written straight into their
+    # place in the target: a writable buffer such as a bytearray or mmap, or a
+    # file path, which is preallocated and memory mapped. A new bytearray is
+    # allocated when no target is given.
+    #
+    # Downloads to a file record their finished ranges next to it, in
+    # `<path>.parts`, so that an interrupted download resumes from where it
+    # stopped, as long as the object has not changed since.
+    client = None
+    bucket: str = None
+    key: str = None
+    version_id: str = None
+    target = None
+    part_size: int = None
+    executor: BatchExecutor = None
+    size: int = None
+    etag: str = None
+
+    def __init__(
+        self, client, bucket: str, key: str, target=None, *,
+        version_id: str = None,
+        part_size: int = PART_SIZE,
+        executor: BatchExecutor = None,
+    ):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.version_id = version_id
+        self.target = target
+        self.part_size = part_size
+        self.executor = executor or default_transfer_executor
+        self.completed = set()
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return os.fspath(self.target) if isinstance(self.target, (str, os.PathLike)) else None
+
+    @property
+    def state_path(self):
+        return f'{self.path}.parts' if self.path else None
+
+    @property
+    def object_kwargs(self):
+        kwargs = {
+            'Bucket': self.bucket,
+            'Key': self.key,
+        }
+        if self.version_id:
+            kwargs.update({
+                'VersionId': self.version_id,
+            })
+
+        return kwargs
+
+    @property
+    def ranges(self) -> typing.List[typing.Tuple[int, int]]:
+        return [
+            (offset, min(offset + self.part_size, self.size) - 1)
+            for offset in range(0, self.size, self.part_size)
+        ]
+
+    @property
+    def done(self):
+        return self.size is not None and len(self.completed) == len(self.ranges)
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as filehandle:
+                state = json.load(filehandle)
+        except (OSError, ValueError):
+            return
+
+        # Ranges of an object that has changed since, or that were cut
+        # differently, cannot be reused.
+        if (state.get('etag'), state.get('size'), state.get('part_size')) == (self.etag, self.size, self.part_size):
+            self.completed.update(state.get('completed', []))
+
+    def _save_state(self):
+        # Called with the lock held. The state is replaced atomically so that it
+        # is never seen half written.
+        temporary = f'{self.state_path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as filehandle:
+            json.dump({
+                'etag': self.etag,
+                'size': self.size,
+                'part_size': self.part_size,
+                'completed': sorted(self.completed),
+            }, filehandle)
+
+        os.replace(temporary, self.state_path)
+
+    @contextmanager
+    def _open_target(self):
+        if self.path is None:
+            if self.target is None:
+                self.target = bytearray(self.size)
+
+            view = memoryview(self.target).cast('B')
+            if view.readonly or len(view) < self.size:
+                view.release()
+                raise ValueError(f'The target needs to be a writable buffer of at least {self.size} bytes')
+
+            try:
+                yield view
+            finally:
+                view.release()
+            return
+
+        mode = 'r+b' if os.path.exists(self.path) else 'w+b'
+        with open(self.path, mode) as filehandle:
+            if os.fstat(filehandle.fileno()).st_size != self.size:
+                filehandle.truncate(self.size)
+
+            if not self.size:
+                yield memoryview(b'')
+                return
+
+            with mmap.mmap(filehandle.fileno(), self.size, access=mmap.ACCESS_WRITE) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+                    mapped.flush()
+
+    def _fetch(self, view, index):
+        start, end = self.ranges[index]
+        response = self.client.get_object(
+            **self.object_kwargs,
+            Range=f'bytes={start}-{end}',
+            IfMatch=self.etag,
+        )
+
+        position = start
+        with BodyReader(response['Body']) as reader:
+            while position <= end:
+                count = reader.readinto(view[position:min(position + READ_SIZE, end + 1)])
+                if not count:
+                    raise IOError(f'Range {start}-{end} of {self.bucket}/{self.key} ended at {position}')
+                position += count
+
+        with self._lock:
+            self.completed.add(index)
+            if self.state_path:
+                self._save_state()
+
+        return index
+
+    def run(self):
+        # Downloads the ranges that are still missing and returns the target.
+        if self.size is None:
+            head = self.client.head_object(**self.object_kwargs)
+            self.size = head['ContentLength']
+            self.etag = head['ETag']
+            if self.state_path:
+                self._load_state()
+
+        with self._open_target() as view:
+            missing = [index for index in range(len(self.ranges)) if index not in self.completed]
+            report = self.executor.run(lambda index: self._fetch(view, index), missing, service='s3')
+            # The tracebacks of failed ranges hold slices of the target, which
+            # would keep a mapped file from being closed.
+            for result in report.failed:
+                _drop_tracebacks(result.error)
+
+        if report.failed:
+            if any((getattr(result.error, 'response', None) or {}).get('Error', {}).get('Code') == 'PreconditionFailed'
+                   for result in report.failed):
+                # The object changed while it was downloaded, the next run starts over.
+                self.size = self.etag = None
+                self.completed.clear()
+                if self.state_path and os.path.exists(self.state_path):
+                    os.remove(self.state_path)
+
+            raise DownloadError(report, self)
+
+        if self.state_path and os.path.exists(self.state_path):
+            os.remove(self.state_path)
+
+        return self.target
+
+
+def download(client, bucket: str, key: str, target=None, **kwargs):
+    return Download(client, bucket, key, target, **kwargs).run()
@@ -0,0 +1,160 @@
+
+from collections import OrderedDict
+from collections.abc import Mapping
+import bisect
+import datetime
+import itertools
+import typing
+
+
+DEFAULT_PAGE_SIZE = 1000
+# How many pages of versions an index keeps in memory at once.
+DEFAULT_MAX_PAGES = 8
+
+
+class VersionInfo:
+    __slots__ = ('version_id', 'last_modified', 'etag', 'size', 'is_latest', 'is_delete_marker')
+
+    def __init__(self, version_id, last_modified, etag=None, size=None, is_latest=False, is_delete_marker=False):
+        self.version_id = version_id
+        self.last_modified = last_modified
+        self.etag = etag
+        self.size = size
+        self.is_latest = is_latest
+        self.is_delete_marker = is_delete_marker
+
+    def __repr__(self):
+        kind = 'DeleteMarker' if self.is_delete_marker else 'Version'
+        return f'{kind}({self.version_id!r}, {self.last_modified.isoformat()})'
+
+    @classmethod
+    def from_item(cls, item, *, is_delete_marker=False):
+        return cls(
+            version_id=item['VersionId'],
+            last_modified=item['LastModified'],
+            etag=item.get('ETag'),
+            size=item.get('Size'),
+            is_latest=item.get('IsLatest', False),
+            is_delete_marker=is_delete_marker,
+        )
+
+
+class VersionIndex(Mapping):
+    # The versions of a single key, newest first, as a mapping of version id to
+    # last modified time.
+    #
+    # Versions are listed a page at a time as they are needed. The listing stops
+    # at the end of the key's versions rather than going on through every key it
+    # prefixes. Only max_pages pages are kept, least recently used ones being
+    # listed again when needed, while the time span of every page seen is kept
+    # so that as_of() can go straight to the page that holds a given time.
+    #
+    # The 'null' version of an unversioned object is not included.
+
+    def __init__(self, client, bucket, key, *, page_size=DEFAULT_PAGE_SIZE, max_pages=DEFAULT_MAX_PAGES):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.page_size = page_size
+        self.max_pages = max_pages
+        # The listing markers of every page found so far, the first page has none.
+        self._markers = [{}]
+        # The negated timestamp of each page's oldest entry, in ascending order
+        # as the pages go back in time.
+        self._oldest = []
+        self._pages = OrderedDict()
+
+    def _page(self, number) -> typing.Optional[typing.Tuple[typing.List[float], typing.List[VersionInfo]]]:
+        if number in self._pages:
+            self._pages.move_to_end(number)
+            return self._pages[number]
+
+        if number >= len(self._markers):
+            return None
+
+        response = self.client.list_object_versions(
+            Bucket=self.bucket,
+            Prefix=self.key,
+            MaxKeys=self.page_size,
+            **self._markers[number],
+        )
+
+        items = response.get('Versions', []) + response.get('DeleteMarkers', [])
+        entries = sorted(
+            itertools.chain(
+                (VersionInfo.from_item(item) for item in response.get('Versions', [])
+                 if item['Key'] == self.key and item['VersionId'] != 'null'),
+                (VersionInfo.from_item(item, is_delete_marker=True) for item in response.get('DeleteMarkers', [])
+                 if item['Key'] == self.key and item['VersionId'] != 'null'),
+            ),
+            key=lambda entry: entry.last_modified,
+            reverse=True,
+        )
+        timestamps = [-entry.last_modified.timestamp() for entry in entries]
+
+        if number == len(self._oldest):
+            self._oldest.append(timestamps[-1] if timestamps else float('inf'))
+
+            # Keys sort after every key they prefix, so the first other key means
+            # the key's versions are done.
+            if response.get('IsTruncated') and all(item['Key'] == self.key for item in items):
+                self._markers.append({
+                    'KeyMarker': response['NextKeyMarker'],
+                    'VersionIdMarker': response['NextVersionIdMarker'],
+                })
+
+        self._pages[number] = (timestamps, entries)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+
+        return self._pages[number]
+
+    def entries(self) -> typing.Iterator[VersionInfo]:
+        # Every version and delete marker, newest first.
+        for number in itertools.count():
+            page = self._page(number)
+            if page is None:
+                return
+
+            yield from page[1]
+
+    def as_of(self, when: datetime.datetime) -> typing.Optional[VersionInfo]:
+        # The version that was current at the given time, or None when the key
+        # did not exist or had been deleted then.
+        target = -when.timestamp()
+
+        # Pages already seen that are entirely newer are skipped.
+        for number in itertools.count(bisect.bisect_left(self._oldest, target)):
+            page = self._page(number)
+            if page is None:
+                return None
+
+            timestamps, entries = page
+            index = bisect.bisect_left(timestamps, target)
+            if index < len(entries):
+                entry = entries[index]
+                return None if entry.is_delete_marker else entry
+
+    @property
+    def latest(self) -> typing.Optional[VersionInfo]:
+        entry = next(self.entries(), None)
+        return None if entry is None or entry.is_delete_marker else entry
+
+    def _versions(self):
+        return (entry for entry in self.entries() if not entry.is_delete_marker)
+
+    def __getitem__(self, version_id):
+        for entry in self._versions():
+            if entry.version_id == version_id:
+                return entry.last_modified
+
+        raise KeyError(version_id)
+
+    def __iter__(self):
+        return (entry.version_id for entry in self._versions())
+
+    def __len__(self):
+        return sum(1 for _ in self._versions())
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.bucket!r}, {self.key!r})'
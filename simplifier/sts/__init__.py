@@ -1,13 +1,90 @@
 
+import hashlib
+import threading
+import time
+
 from ..base import Boto3Base
 
 
+# Caller identities rarely change for a given set of credentials, but assumed
+# roles can be re-pointed, so entries are still expired after a while.
+IDENTITY_TTL = 900
+
+
+class IdentityCache:
+    ttl: int = None
+
+    def __init__(self, *, ttl: int = None):
+        self.ttl = IDENTITY_TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def credential_key(session):
+        credentials = session.get_credentials()
+        if credentials is None:
+            return None
+
+        # Refreshable credentials hand out a new frozen set once they rotate, which
+        # gives the rotated credentials their own cache entry.
+        frozen = credentials.get_frozen_credentials()
+        token = hashlib.sha256(frozen.token.encode('utf-8')).hexdigest() if frozen.token else None
+        return (frozen.access_key, token)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, identity = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            return identity
+
+    def set(self, key, identity):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, identity)
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+default_identity_cache = IdentityCache()
+
+
 class STS(Boto3Base):
     _service = 'sts'
+    _identity_cache: IdentityCache = default_identity_cache
+
+    def __init__(self, *, identity_cache: IdentityCache = None, **kwargs):
+        super().__init__(**kwargs)
+
+        if identity_cache is not None:
+            self._identity_cache = identity_cache
+
+    def load_identity(self, *, refresh=False):
+        key = IdentityCache.credential_key(self.session)
+        if key is None or not self._identity_cache:
+            return self.client.get_caller_identity()
+
+        identity = None if refresh else self._identity_cache.get(key)
+        if identity is None:
+            identity = self.client.get_caller_identity()
+            identity.pop('ResponseMetadata', None)
+            self._identity_cache.set(key, identity)
+
+        return identity
 
     @property
     def identity(self):
-        return self.client.get_caller_identity()
+        return self.load_identity()
 
     @property
     def account_id(self):
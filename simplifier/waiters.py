@@ -0,0 +1,205 @@
+
+from dataclasses import dataclass, field
+import random
+import time
+import typing
+
+from .batch import is_throttling_response
+from .metrics import Sample
+
+
+# The first poll of a resource comes after this many seconds, or the waiter's own
+# delay if that is shorter. The interval then grows by BACKOFF on every poll up
+# to the waiter's delay.
+INITIAL_DELAY = 2.0
+BACKOFF = 1.5
+JITTER = 0.1
+
+PENDING = 'pending'
+SUCCESS = 'success'
+FAILURE = 'failure'
+TIMEOUT = 'timeout'
+
+
+@dataclass
+class WaitRequest:
+    obj: any
+    name: str
+    kwargs: typing.Dict[str, any]
+    config: any = field(default=None, repr=False)
+    operation: typing.Callable = field(default=None, repr=False)
+    state: str = PENDING
+    reason: str = None
+    response: typing.Dict[str, any] = field(default=None, repr=False)
+    attempts: int = 0
+    delay: float = None
+    max_attempts: int = None
+    interval: float = None
+    started: float = None
+    next_poll: float = None
+    deadline: float = None
+    finished: float = None
+
+    @property
+    def done(self):
+        return self.state != PENDING
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+
+class WaiterEngine:
+    # Waits on any number of resources from one polling loop. Each resource is
+    # polled with the acceptors of its botocore waiter, on its own adaptive
+    # interval, so waiting on N resources takes as long as the slowest of them.
+    deadline: float = None
+    max_delay: float = None
+    callback: typing.Callable[[WaitRequest], None] = None
+
+    def __init__(
+        self, *,
+        deadline: float = None,
+        initial_delay: float = INITIAL_DELAY,
+        max_delay: float = None,
+        backoff: float = BACKOFF,
+        callback: typing.Callable[[WaitRequest], None] = None,
+    ):
+        # Without a deadline each resource gets the time its botocore waiter allows,
+        # i.e. delay * max_attempts.
+        self.deadline = deadline
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.callback = callback
+        self.requests = []
+
+    def add(self, obj, waiter_name, **kwargs) -> WaitRequest:
+        from botocore import xform_name  # pylint: disable=import-outside-top-level
+
+        client = obj.client
+        waiter = client.get_waiter(waiter_name)
+        config = waiter.config
+        waiter_config = kwargs.pop('WaiterConfig', None) or {}
+
+        request = WaitRequest(
+            obj=obj,
+            name=waiter.name,
+            kwargs=kwargs,
+            config=config,
+            operation=getattr(client, xform_name(config.operation)),
+            delay=waiter_config.get('Delay', config.delay),
+            max_attempts=waiter_config.get('MaxAttempts', config.max_attempts),
+        )
+        self.requests.append(request)
+        return request
+
+    def _interval(self, request):
+        ceiling = self.max_delay or request.delay
+        if request.interval is None:
+            request.interval = min(self.initial_delay, ceiling)
+        else:
+            request.interval = min(request.interval * self.backoff, ceiling)
+
+        return request.interval * random.uniform(1 - JITTER, 1 + JITTER)
+
+    def _finish(self, request, state, reason=None):
+        request.state = state
+        request.reason = reason
+        request.finished = time.monotonic()
+
+        metrics = getattr(request.obj, 'metrics', None)
+        if metrics:
+            metrics.record(Sample(
+                kind='wait',
+                service=request.obj.service,
+                operation=request.name,
+                latency=request.elapsed,
+                error=state != SUCCESS,
+            ))
+
+    def _poll(self, request):
+        from botocore.exceptions import ClientError  # pylint: disable=import-outside-top-level
+
+        request.attempts += 1
+        try:
+            response = request.operation(**request.kwargs)
+        except ClientError as exc:
+            response = exc.response
+
+        request.response = response
+
+        if is_throttling_response(response):
+            # Throttling is not the resource's state, poll again later.
+            request.interval = (request.interval or self.initial_delay) * self.backoff
+            return
+
+        for acceptor in request.config.acceptors:
+            if acceptor.matcher_func(response):
+                if acceptor.state == SUCCESS:
+                    self._finish(request, SUCCESS)
+                elif acceptor.state == FAILURE:
+                    self._finish(request, FAILURE, f'Waiter encountered a terminal failure state: {acceptor.explanation}')
+                return
+
+        if 'Error' in response:
+            self._finish(request, FAILURE, f'An error occurred ({response["Error"].get("Code")}): '
+                                           f'{response["Error"].get("Message")}')
+
+    def run(self) -> typing.List[WaitRequest]:
+        now = time.monotonic()
+        global_deadline = now + self.deadline if self.deadline is not None else None
+
+        for request in self.requests:
+            if request.started is None:
+                request.started = now
+                request.next_poll = now
+                request.deadline = global_deadline or now + request.delay * request.max_attempts
+
+        while True:
+            pending = [request for request in self.requests if not request.done]
+            if not pending:
+                return self.requests
+
+            now = time.monotonic()
+            for request in pending:
+                if request.deadline <= now:
+                    self._finish(request, TIMEOUT, 'Max attempts exceeded')
+
+                elif request.next_poll <= now:
+                    self._poll(request)
+                    if not request.done:
+                        request.next_poll = time.monotonic() + self._interval(request)
+
+                else:
+                    continue
+
+                if self.callback:
+                    self.callback(request)
+
+            pending = [request for request in pending if not request.done]
+            if pending:
+                wake = min(min(request.next_poll, request.deadline) for request in pending)
+                time.sleep(max(wake - time.monotonic(), 0))
+
+    def wait(self) -> typing.List[WaitRequest]:
+        # Like run(), but raises botocore's WaiterError for the first resource that
+        # failed or timed out, as botocore waiters do.
+        from botocore.exceptions import WaiterError  # pylint: disable=import-outside-top-level
+
+        requests = self.run()
+        for request in requests:
+            if request.state != SUCCESS:
+                raise WaiterError(name=request.name, reason=request.reason, last_response=request.response)
+
+        return requests
+
+
+def wait_all(waits, **kwargs) -> typing.List[WaitRequest]:
+    # Waits on several (obj, waiter_name, waiter_kwargs) at once, e.g.
+    #   wait_all([(distribution, 'distribution_deployed', {'Id': distribution.id}) ...])
+    engine = WaiterEngine(**kwargs)
+    for obj, waiter_name, waiter_kwargs in waits:
+        engine.add(obj, waiter_name, **waiter_kwargs)
+
+    return engine.wait()
@@ -0,0 +1,80 @@
+
+import asyncio
+import gc
+import importlib
+import pkgutil
+import weakref
+
+import pytest
+
+import simplifier.aio
+from simplifier.aio.pool import AioClientPool
+
+
+class FakeClient:
+    closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeSession:
+
+    def get_config_variable(self, name):  # pylint: disable=unused-argument
+        return 'us-east-1'
+
+    def create_client(self, service, **kwargs):  # pylint: disable=unused-argument
+        return FakeClient()
+
+
+def test_clients_are_pooled_per_loop():
+    pool = AioClientPool()
+    session = FakeSession()
+
+    async def twice():
+        return await pool.client(session, 's3'), await pool.client(session, 's3')
+
+    first, second = asyncio.run(twice())
+    assert first is second
+    assert pool.stats.hits == 1
+
+
+def test_closed_loops_are_not_kept_alive():
+    pool = AioClientPool()
+    session = FakeSession()
+    loops = []
+
+    async def client():
+        loops.append(weakref.ref(asyncio.get_running_loop()))
+        return await pool.client(session, 's3')
+
+    asyncio.run(client())
+    asyncio.run(client())
+    gc.collect()
+
+    assert loops[0]() is None
+    assert pool.stats.size == 0
+
+
+def test_modules_import():
+    for module in pkgutil.iter_modules(simplifier.aio.__path__):
+        importlib.import_module(f'simplifier.aio.{module.name}')
+
+
+def test_pooled_client_is_created():
+    pytest.importorskip('aiobotocore')
+    from aiobotocore.session import AioSession  # pylint: disable=import-outside-top-level
+
+    pool = AioClientPool()
+    session = AioSession()
+
+    async def client():
+        try:
+            return await pool.client(session, 's3', {'region_name': 'us-east-1'})
+        finally:
+            await pool.close()
+
+    assert asyncio.run(client()).meta.service_model.service_name == 's3'
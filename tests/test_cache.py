@@ -0,0 +1,30 @@
+
+import os
+
+from simplifier.s3.cache import CacheEntry, DiskCache
+
+
+def test_disk_reads_do_not_hold_the_lock(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.put(cache.key('bucket', 'key'), CacheEntry(etag='"etag"', body=b'hello'))
+    read = cache._read
+    locked = []
+
+    def _read(key):
+        locked.append(cache._lock.locked())
+        return read(key)
+
+    cache._read = _read
+    assert cache.get(cache.key('bucket', 'key')).body == b'hello'
+    assert locked == [False]
+
+
+def test_evicted_entry_is_not_found(tmp_path):
+    cache = DiskCache(tmp_path)
+    key = cache.key('bucket', 'key')
+    cache.put(key, CacheEntry(etag='"etag"', body=b'hello'))
+    for name in os.listdir(tmp_path):
+        os.remove(tmp_path / name)
+
+    assert cache.get(key) is None
+    assert cache.stats.entries == 0
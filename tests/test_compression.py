@@ -0,0 +1,20 @@
+
+import gzip
+import io
+
+from simplifier.s3.compression import GZIP, DecompressingBody
+
+
+def test_read_is_bounded_by_the_size_asked_for():
+    body = DecompressingBody(io.BytesIO(gzip.compress(bytes(64 * 1024 * 1024))), GZIP)
+
+    assert len(body.read(10)) == 10
+    assert len(body._buffer) == 0
+    assert sum(len(chunk) for chunk in body.iter_chunks(1024 * 1024)) == 64 * 1024 * 1024 - 10
+
+
+def test_every_member_is_read():
+    data = gzip.compress(b'hello ') + gzip.compress(b'world')
+
+    assert DecompressingBody(io.BytesIO(data), GZIP).read() == b'hello world'
+    assert b''.join(DecompressingBody(io.BytesIO(data), GZIP).iter_chunks(3)) == b'hello world'
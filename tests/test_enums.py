@@ -0,0 +1,19 @@
+
+from simplifier.enums import LazyEnum
+
+
+def test_compares_with_sequences_only():
+    enum = LazyEnum(lambda: ['a', 'b'])
+
+    assert enum == ['a', 'b']
+    assert enum == ('a', 'b')
+    assert enum != 'ab'
+    assert enum != None  # pylint: disable=singleton-comparison
+    assert enum != 1
+
+
+def test_hashes_like_its_values():
+    enum = LazyEnum(lambda: ['a', 'b'])
+
+    assert hash(enum) == hash(('a', 'b'))
+    assert {enum: 1}[('a', 'b')] == 1
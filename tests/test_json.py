@@ -0,0 +1,30 @@
+
+import json
+import math
+
+import pytest
+
+from simplifier.s3.json import HAS_ORJSON, dumps, loads
+
+
+@pytest.mark.parametrize('value', [{1: 'a'}, {'big': 2 ** 70}, [math.inf]])
+def test_dumps_takes_what_json_does(value):
+    assert dumps(value) == json.dumps(value).encode('utf-8')
+
+
+@pytest.mark.parametrize('fast', [False, True])
+@pytest.mark.parametrize('data', ['18446744073709551616', b'[-18446744073709551617, 1.5]', b'{"a": [1, "x"]}'])
+def test_loads_matches_json(data, fast):
+    assert loads(data, fast=fast) == json.loads(data)
+
+
+@pytest.mark.parametrize('fast', [False, True])
+def test_loads_accepts_nan(fast):
+    value = loads(b'[NaN, Infinity]', fast=fast)
+    assert math.isnan(value[0]) and value[1] == math.inf
+
+
+@pytest.mark.skipif(not HAS_ORJSON, reason='orjson is not installed')
+def test_big_integers_stay_integers():
+    assert loads('18446744073709551616', fast=True) == 2 ** 64
+    assert isinstance(loads(b'[18446744073709551616]', fast=True)[0], int)
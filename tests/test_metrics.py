@@ -0,0 +1,30 @@
+
+import botocore.session
+from botocore.awsrequest import AWSResponse
+import pytest
+
+from simplifier.metrics import Metrics
+
+
+@pytest.fixture
+def s3_model():
+    return botocore.session.get_session().get_service_model('s3')
+
+
+@pytest.mark.parametrize('operation, status, received', [
+    ('GetObject', 200, 5),
+    ('GetObject', 304, 0),
+    ('HeadObject', 200, 0),
+])
+def test_bytes_received_only_count_sent_bodies(s3_model, operation, status, received):
+    metrics = Metrics(enabled=True)
+    samples = []
+    metrics.subscribe(samples.append)
+
+    model = s3_model.operation_model(operation)
+    context = {}
+    metrics._before_call(model=model, context=context)
+    response = AWSResponse('https://localhost', status, {'content-length': '5'}, None)
+    metrics._after_call(http_response=response, parsed={}, model=model, context=context)
+
+    assert samples[0].bytes_received == received
@@ -0,0 +1,38 @@
+
+import pytest
+
+from benchmarks.standin import Dataset, LocalAWS
+from benchmarks.suite import _session
+from simplifier.pool import ClientPool
+from simplifier.s3 import Object
+
+
+@pytest.fixture
+def aws():
+    return LocalAWS(Dataset(objects=1))
+
+
+@pytest.fixture
+def options(aws):
+    return {'session': _session(aws), 'client_pool': ClientPool()}
+
+
+def test_autoload_loads_headers_only(aws, options):
+    Object.create(aws.dataset.bucket, 'hello.txt', b'hello', **options)
+
+    calls = aws.calls
+    obj = Object(aws.dataset.bucket, 'hello.txt', **options)
+    assert aws.calls - calls == 1
+    assert obj._obj is None
+    assert obj.etag
+    assert obj.content_length == 5
+    assert aws.calls - calls == 1
+
+    assert obj.contents == b'hello'
+    assert aws.calls - calls == 2
+
+
+def test_autoload_of_missing_key_raises_no_such_key(aws, options):
+    obj = Object(aws.dataset.bucket, 'hello.txt', autoload=False, **options)
+    with pytest.raises(obj.client.exceptions.NoSuchKey):
+        Object(aws.dataset.bucket, 'missing.txt', **options)
@@ -0,0 +1,92 @@
+
+import io
+import os
+
+import pytest
+from botocore.response import StreamingBody
+
+from benchmarks.standin import Dataset, LocalAWS
+from benchmarks.suite import _session
+from simplifier.pool import ClientPool
+from simplifier.s3 import Object
+from simplifier.s3.transfer import Download, DownloadError
+
+
+PART_SIZE = 5 * 1024 * 1024
+
+
+class FlakyAWS(LocalAWS):
+    # Cuts the first response for a range short, as a dropped connection does.
+    failing_range = None
+
+    def _s3_get_object(self, params):
+        response, parsed = super()._s3_get_object(params)
+        if params.get('Range') == self.failing_range:
+            self.failing_range = None
+            body = parsed['Body'].read()
+            parsed['Body'] = StreamingBody(io.BytesIO(body[:len(body) // 2]), len(body))
+
+        return response, parsed
+
+
+@pytest.fixture
+def aws():
+    return FlakyAWS(Dataset(objects=1))
+
+
+@pytest.fixture
+def options(aws):
+    return {'session': _session(aws), 'client_pool': ClientPool()}
+
+
+def test_failed_file_download_raises_and_resumes(aws, options, tmp_path):
+    data = os.urandom(3 * PART_SIZE + 123)
+    obj = Object.create(aws.dataset.bucket, 'large.bin', data, **options)
+    aws.failing_range = f'bytes={PART_SIZE}-{2 * PART_SIZE - 1}'
+    target = tmp_path / 'large.bin'
+
+    with pytest.raises(DownloadError) as raised:
+        obj.download(target, part_size=PART_SIZE)
+
+    download = raised.value.download
+    assert isinstance(download, Download)
+    assert download.completed == {0, 2, 3}
+    assert os.path.exists(download.state_path)
+
+    calls = aws.calls
+    assert download.run() == target
+    assert aws.calls - calls == 1
+    assert target.read_bytes() == data
+    assert not os.path.exists(download.state_path)
+
+
+def test_failed_buffer_download_raises(aws, options):
+    data = os.urandom(2 * PART_SIZE)
+    obj = Object.create(aws.dataset.bucket, 'buffer.bin', data, **options)
+    aws.failing_range = f'bytes=0-{PART_SIZE - 1}'
+
+    with pytest.raises(DownloadError) as raised:
+        obj.download(part_size=PART_SIZE)
+
+    assert raised.value.download.run() == data
+
+
+def test_error_without_response_raises_download_error(aws, options, monkeypatch):
+    data = os.urandom(2 * PART_SIZE)
+    obj = Object.create(aws.dataset.bucket, 'reset.bin', data, **options)
+
+    class ConnectionReset(Exception):
+        response = None
+
+    fetch = Download._fetch
+
+    def reset(self, view, index):
+        if index == 1:
+            raise ConnectionReset('Connection reset by peer')
+        return fetch(self, view, index)
+
+    monkeypatch.setattr(Download, '_fetch', reset)
+    with pytest.raises(DownloadError) as raised:
+        obj.download(part_size=PART_SIZE)
+
+    assert raised.value.download.completed == {0}